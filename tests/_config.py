@@ -0,0 +1,134 @@
+from dataclasses import replace
+from datetime import datetime, timezone
+
+from xiuxian_bot.config import Config, IdentityProfile
+from xiuxian_bot.core.contracts import MessageContext
+
+
+FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+# Every plugin starts disabled; each test module switches on the one it covers.
+_BASE_CONFIG = Config(
+    tg_api_id=1,
+    tg_api_hash="hash",
+    tg_session_name="session",
+    game_chat_id=-100,
+    topic_id=123,
+    my_name="Me",
+    send_to_topic=True,
+    action_cmd_biguan=".闭关修炼",
+    dry_run=False,
+    log_level="INFO",
+    global_sends_per_minute=999,
+    plugin_sends_per_minute=999,
+    enable_biguan=False,
+    enable_daily=False,
+    enable_garden=False,
+    enable_xinggong=False,
+    enable_yuanying=False,
+    enable_zongmen=False,
+    biguan_extra_buffer_seconds=60,
+    biguan_cooldown_jitter_min_seconds=5,
+    biguan_cooldown_jitter_max_seconds=15,
+    biguan_retry_jitter_min_seconds=3,
+    biguan_retry_jitter_max_seconds=3,
+    biguan_mode="normal",
+    biguan_deep_settle_command=".状态",
+    biguan_deep_duration_seconds=8 * 3600 + 180,
+    garden_seed_name="清灵草种子",
+    garden_poll_interval_seconds=3600,
+    garden_action_spacing_seconds=25,
+    xinggong_star_name="庚金星",
+    xinggong_poll_interval_seconds=3600,
+    xinggong_action_spacing_seconds=25,
+    xinggong_qizhen_start_time="07:00",
+    xinggong_qizhen_retry_interval_seconds=120,
+    xinggong_qizhen_second_offset_seconds=43500,
+    xinggong_wenan_interval_seconds=43200,
+    yuanying_liefeng_interval_seconds=43200,
+    yuanying_chuqiao_interval_seconds=28800,
+    zongmen_cmd_dianmao=".宗门点卯",
+    zongmen_cmd_chuangong=".宗门传功",
+    zongmen_dianmao_time=None,
+    zongmen_chuangong_times=None,
+    zongmen_chuangong_xinde_text="宗门传功",
+    zongmen_catch_up=True,
+    zongmen_action_spacing_seconds=20,
+    enable_xinggong_wenan=True,
+    enable_xinggong_deep_biguan=False,
+    enable_xinggong_guanxing=False,
+    xinggong_guanxing_target_username="salt9527",
+    xinggong_guanxing_preview_advance_seconds=180,
+    xinggong_guanxing_shift_advance_seconds=1.0,
+    xinggong_guanxing_watch_events="星辰异象,地磁暴动",
+    enable_yuanying_liefeng=True,
+    global_send_min_interval_seconds=10,
+    state_db_path="xiuxian_state.sqlite3",
+    enable_chuangta=False,
+    chuangta_time="14:15",
+    enable_lingxiaogong=False,
+    enable_lingxiaogong_wenxintai=True,
+    enable_lingxiaogong_jiutian=True,
+    enable_lingxiaogong_dengtianjie=True,
+    lingxiaogong_poll_interval_seconds=300,
+    lingxiaogong_wenxintai_after_climb_count=4,
+    enable_random_event_nanlonghou=True,
+    random_event_nanlonghou_action=".交换 功法",
+    enable_random_event_jiyin=True,
+    random_event_jiyin_action=".献上魂魄",
+    account_id="default",
+    account_name="default",
+    identity_profiles=(
+        IdentityProfile(
+            key="main",
+            kind="main",
+            my_name="Me",
+            switch_target="主魂",
+            display_name="主魂",
+        ),
+    ),
+    active_identity_key="main",
+    switch_command_template=".切换 {target}",
+    switch_list_command=".切换",
+    switch_back_target="主魂",
+    switch_success_keywords="切换成功,神念已附着",
+    switch_back_success_keywords="神念重归主魂肉身",
+    switch_failure_keywords="未找到道号或ID",
+    auto_return_main_after_avatar_action=True,
+    auto_return_main_delay_seconds=120,
+    status_command=".状态",
+    status_identity_header_keyword="修士状态",
+)
+
+
+def make_config(**overrides) -> Config:
+    # Config is frozen, so the shared base can be handed out as-is.
+    if not overrides:
+        return _BASE_CONFIG
+    if "my_name" in overrides and "identity_profiles" not in overrides:
+        overrides["identity_profiles"] = (
+            replace(_BASE_CONFIG.identity_profiles[0], my_name=overrides["my_name"]),
+        )
+    return replace(_BASE_CONFIG, **overrides)
+
+
+def make_ctx(
+    text: str,
+    *,
+    message_id: int = 1,
+    reply_to_msg_id: int | None = 123,
+    is_reply: bool = False,
+    is_reply_to_me: bool = False,
+) -> MessageContext:
+    return MessageContext(
+        chat_id=-100,
+        message_id=message_id,
+        reply_to_msg_id=reply_to_msg_id,
+        sender_id=999,
+        text=text,
+        ts=FROZEN_TS,
+        is_reply=is_reply,
+        is_reply_to_me=is_reply_to_me,
+    )
+
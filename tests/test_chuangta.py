@@ -9,6 +9,10 @@ from xiuxian_bot.core.scheduler import Scheduler
 from xiuxian_bot.plugins.chuangta import AutoChuangtaPlugin
 
 
+_LOG = logging.getLogger("test")
+_FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def _dummy_config(
     *,
     enable_chuangta: bool = True,
@@ -85,7 +89,7 @@ def _dummy_config(
 
 class TestChuangtaPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_bootstrap_catchup_without_yuanying_sends_chuangta(self) -> None:
-        logger = logging.getLogger("test")
+        logger = _LOG
         scheduler = Scheduler(logger)
         plugin = AutoChuangtaPlugin(
             _dummy_config(enable_yuanying=False, chuangta_time="00:00"),
@@ -105,7 +109,7 @@ class TestChuangtaPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertIn(".闯塔", calls)
 
     async def test_bootstrap_catchup_with_yuanying_requests_status_first(self) -> None:
-        logger = logging.getLogger("test")
+        logger = _LOG
         scheduler = Scheduler(logger)
         plugin = AutoChuangtaPlugin(
             _dummy_config(enable_yuanying=True, chuangta_time="00:00"),
@@ -128,7 +132,7 @@ class TestChuangtaPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_wenyang_status_triggers_chuangta(self) -> None:
         plugin = AutoChuangtaPlugin(
             _dummy_config(enable_yuanying=True),
-            logging.getLogger("test"),
+            _LOG,
         )
         plugin._current_day = datetime.now().date()  # type: ignore[attr-defined]
         plugin._pending_today = True  # type: ignore[attr-defined]
@@ -141,7 +145,7 @@ class TestChuangtaPlugin(unittest.IsolatedAsyncioTestCase):
             reply_to_msg_id=200,
             sender_id=999,
             text="你的本命元婴 等级: 8 级 经验: 1086 / 4000 五行: 风 状态: 窍中温养 使用 .元婴出窍 或 .元婴闭关 派遣元婴。",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -153,7 +157,7 @@ class TestChuangtaPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_out_of_body_status_keeps_waiting(self) -> None:
         plugin = AutoChuangtaPlugin(
             _dummy_config(enable_yuanying=True),
-            logging.getLogger("test"),
+            _LOG,
         )
         plugin._current_day = datetime.now().date()  # type: ignore[attr-defined]
         plugin._pending_today = True  # type: ignore[attr-defined]
@@ -166,7 +170,7 @@ class TestChuangtaPlugin(unittest.IsolatedAsyncioTestCase):
             reply_to_msg_id=300,
             sender_id=999,
             text="【元婴状态】状态:元神出窍 归来倒计时:6小时50分钟30秒",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -178,7 +182,7 @@ class TestChuangtaPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_summary_after_wait_triggers_chuangta(self) -> None:
         plugin = AutoChuangtaPlugin(
             _dummy_config(enable_yuanying=True),
-            logging.getLogger("test"),
+            _LOG,
         )
         plugin._current_day = datetime.now().date()  # type: ignore[attr-defined]
         plugin._pending_today = True  # type: ignore[attr-defined]
@@ -190,7 +194,7 @@ class TestChuangtaPlugin(unittest.IsolatedAsyncioTestCase):
             reply_to_msg_id=400,
             sender_id=999,
             text="📜 修士 @Me 元神归窍总结 你的元婴在虚空中神游八小时，带回了以下收获：",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -202,7 +206,7 @@ class TestChuangtaPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_unknown_yuanying_reply_falls_back_to_chuangta(self) -> None:
         plugin = AutoChuangtaPlugin(
             _dummy_config(enable_yuanying=True),
-            logging.getLogger("test"),
+            _LOG,
         )
         plugin._current_day = datetime.now().date()  # type: ignore[attr-defined]
         plugin._pending_today = True  # type: ignore[attr-defined]
@@ -215,7 +219,7 @@ class TestChuangtaPlugin(unittest.IsolatedAsyncioTestCase):
             reply_to_msg_id=500,
             sender_id=999,
             text="你尚未凝结元婴，暂时无法查看元婴状态。",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -227,7 +231,7 @@ class TestChuangtaPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_status_timeout_falls_back_to_chuangta(self) -> None:
         plugin = AutoChuangtaPlugin(
             _dummy_config(enable_yuanying=True),
-            logging.getLogger("test"),
+            _LOG,
         )
         calls: list[str] = []
 
@@ -244,7 +248,7 @@ class TestChuangtaPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(calls, [".闯塔"])
 
     async def test_manual_chuangta_feedback_marks_done(self) -> None:
-        plugin = AutoChuangtaPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoChuangtaPlugin(_dummy_config(), _LOG)
         plugin._current_day = datetime.now().date()  # type: ignore[attr-defined]
 
         ctx = MessageContext(
@@ -253,14 +257,10 @@ class TestChuangtaPlugin(unittest.IsolatedAsyncioTestCase):
             reply_to_msg_id=700,
             sender_id=999,
             text="【琉璃问心塔】 你深吸一口气，踏入了古塔的第 1 层。",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
         await plugin.on_message(ctx)
 
         self.assertTrue(getattr(plugin, "_done_today"))
-
-
-if __name__ == "__main__":
-    unittest.main()
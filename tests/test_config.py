@@ -1,9 +1,11 @@
 import os
 import os
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
-from xiuxian_bot.config import Config, IdentityProfile, SystemConfig
+from xiuxian_bot.config import Config, IdentityProfile, SystemConfig, _load_dotenv
 
 
 class TestConfig(unittest.TestCase):
@@ -478,6 +480,15 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config.message_archive_retention_days, 14)
         self.assertFalse(config.message_archive_vacuum_enabled)
 
+    def test_load_dotenv_parses_lines_without_overriding_existing_env(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / ".env"
+            path.write_bytes(
+                "# comment\r\nWEB_PORT=9000\r\n\r\nLOG_LEVEL = 'debug'\r\nBROKEN_LINE\r\nWEB_HOST=\"0.0.0.0\"".encode("utf-8")
+            )
+            with patch.dict(os.environ, {"WEB_HOST": "127.0.0.1"}, clear=True):
+                _load_dotenv(path)
+                _load_dotenv(Path(tmpdir) / "missing.env")
+                loaded = dict(os.environ)
 
-if __name__ == "__main__":
-    unittest.main()
+        self.assertEqual(loaded, {"WEB_PORT": "9000", "LOG_LEVEL": "debug", "WEB_HOST": "127.0.0.1"})
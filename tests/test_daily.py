@@ -7,6 +7,10 @@ from xiuxian_bot.core.contracts import MessageContext
 from xiuxian_bot.plugins.daily import DailyPlugin
 
 
+_LOG = logging.getLogger("test")
+_FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def _dummy_config(**overrides) -> Config:
     values = {
         "tg_api_id": "1",
@@ -30,7 +34,7 @@ class TestDailyPlugin(unittest.IsolatedAsyncioTestCase):
     def test_start_time_calculates_initial_delay(self) -> None:
         plugin = DailyPlugin(
             _dummy_config(daily_bushi_start_time="08:30"),
-            logging.getLogger("test"),
+            _LOG,
         )
 
         self.assertEqual(
@@ -45,7 +49,7 @@ class TestDailyPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_bootstrap_sends_remaining_bushi_with_interval(self) -> None:
         plugin = DailyPlugin(
             _dummy_config(daily_bushi_times_per_day="2"),
-            logging.getLogger("test"),
+            _LOG,
         )
         scheduled: list[tuple[str, float, object]] = []
         sends: list[tuple[str, str, bool]] = []
@@ -79,7 +83,7 @@ class TestDailyPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_bushi_keeps_avatar_until_last_run(self) -> None:
         plugin = DailyPlugin(
             _dummy_config(daily_bushi_times_per_day="2"),
-            logging.getLogger("test"),
+            _LOG,
         )
         scheduled: list[tuple[str, float, object]] = []
 
@@ -99,7 +103,7 @@ class TestDailyPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(plugin.should_auto_return_after_send(".卜筮问天"))
 
     async def test_rare_event_replies_exchange_to_message(self) -> None:
-        plugin = DailyPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = DailyPlugin(_dummy_config(), _LOG)
         ctx = MessageContext(
             chat_id=-100,
             message_id=1001,
@@ -111,7 +115,7 @@ class TestDailyPlugin(unittest.IsolatedAsyncioTestCase):
                 "天道示警：获取此等逆天之物，需献上祭品以获天道认可。\n"
                 "请在 5分钟 内回复本消息 .换取 来确认，超时则机缘消散。"
             ),
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -124,14 +128,14 @@ class TestDailyPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(actions[0].reply_to_msg_id, 1001)
 
     async def test_rare_event_is_deduplicated(self) -> None:
-        plugin = DailyPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = DailyPlugin(_dummy_config(), _LOG)
         ctx = MessageContext(
             chat_id=-100,
             message_id=1002,
             reply_to_msg_id=999,
             sender_id=123,
             text="神物现世 昆吾通行令 天道示警 回复本消息 .换取 @Me",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=False,
             is_reply_to_me=False,
         )
@@ -140,20 +144,16 @@ class TestDailyPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(await plugin.on_message(ctx))
 
     async def test_normal_hexagram_is_ignored(self) -> None:
-        plugin = DailyPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = DailyPlugin(_dummy_config(), _LOG)
         ctx = MessageContext(
             chat_id=-100,
             message_id=1003,
             reply_to_msg_id=999,
             sender_id=123,
             text="【卦象：平】古井无波。",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
 
         self.assertIsNone(await plugin.on_message(ctx))
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -1,71 +1,76 @@
 import logging
 import unittest
-from datetime import datetime, timezone
 
 from xiuxian_bot.config import Config
-from xiuxian_bot.core.contracts import MessageContext
-from xiuxian_bot.domain.garden import parse_garden_status
+from xiuxian_bot.domain.garden import _parse_garden_status, parse_garden_status
 from xiuxian_bot.plugins.garden import AutoGardenPlugin
 
+from ._config import make_config, make_ctx
 
-def _dummy_config(*, enable_garden: bool = True) -> Config:
-    return Config(
-        tg_api_id=1,
-        tg_api_hash="hash",
-        tg_session_name="session",
-        game_chat_id=-100,
-        topic_id=123,
-        my_name="Me",
-        send_to_topic=True,
-        action_cmd_biguan=".闭关修炼",
-        dry_run=False,
-        log_level="INFO",
-        global_sends_per_minute=6,
-        plugin_sends_per_minute=3,
-        enable_biguan=False,
-        enable_daily=False,
-        enable_garden=enable_garden,
-        enable_xinggong=False,
-        enable_yuanying=False,
-        enable_zongmen=False,
-        biguan_extra_buffer_seconds=60,
-        biguan_cooldown_jitter_min_seconds=5,
-        biguan_cooldown_jitter_max_seconds=15,
-        biguan_retry_jitter_min_seconds=3,
-        biguan_retry_jitter_max_seconds=8,
-        garden_seed_name="清灵草种子",
-        garden_poll_interval_seconds=3600,
-        garden_action_spacing_seconds=25,
-        xinggong_star_name="庚金星",
-        xinggong_poll_interval_seconds=3600,
-        xinggong_action_spacing_seconds=25,
-        xinggong_qizhen_start_time="07:00",
-        xinggong_qizhen_retry_interval_seconds=120,
-        xinggong_qizhen_second_offset_seconds=43500,
-        xinggong_wenan_interval_seconds=43200,
-        yuanying_liefeng_interval_seconds=43200,
-        yuanying_chuqiao_interval_seconds=28800,
-        zongmen_cmd_dianmao="宗门点卯",
-        zongmen_cmd_chuangong="宗门传功",
-        zongmen_dianmao_time=None,
-        zongmen_chuangong_times=None,
-        zongmen_chuangong_xinde_text="今日修行心得：稳中求进。",
-        zongmen_catch_up=True,
-        zongmen_action_spacing_seconds=20,
-    )
 
+_LOG = logging.getLogger("test")
 
-class TestGardenParser(unittest.TestCase):
-    def test_parse_garden_status_rejects_unrelated(self) -> None:
-        self.assertIsNone(parse_garden_status("hello world"))
 
-    def test_parse_garden_status_flags(self) -> None:
-        text = """【黄枫谷·小药园】(灵田总数: 3块)
+def _dummy_config(**overrides) -> Config:
+    overrides.setdefault("enable_garden", True)
+    return make_config(**overrides)
+
+
+MIXED_STATUS = """【黄枫谷·小药园】(灵田总数: 3块)
 1号灵田: 清灵草种子-生长中 🌱 (剩余: 5小时26分钟47秒)
 2号灵田: 清灵草种子-害虫侵扰 🐛
 3号灵田: 清灵草种子-已成熟 ✨
 """
-        status = parse_garden_status(text)
+
+IDLE_GROWING_STATUS = """【黄枫谷·小药园】(灵田总数: 3块)
+1号灵田: 空闲
+2号灵田: 空闲
+3号灵田: 清灵草种子-生长中 🌱 (剩余: 1小时)
+"""
+
+NEAR_MATURE_STATUS = """【黄枫谷·小药园】(灵田总数: 3块)
+1号灵田: 清灵草种子-生长中 🌱 (剩余: 14分钟)
+2号灵田: 清灵草种子-生长中 🌱 (剩余: 2小时)
+3号灵田: 清灵草种子-生长中 🌱 (剩余: 3小时)
+"""
+
+MAINTENANCE_STATUS = """【黄枫谷·小药园】(灵田总数: 3块)
+1号灵田: 清灵草种子-杂草横生 🌿
+2号灵田: 清灵草种子-害虫侵扰 🐛
+3号灵田: 清灵草种子-灵气干涸 🍂 已成熟 ✨
+"""
+
+IDLE_SOW_STATUS = """【黄枫谷·小药园】(灵田总数: 3块)
+1号灵田: 空闲
+2号灵田: 清灵草种子-生长中 🌱 (剩余: 1小时)
+3号灵田: 清灵草种子-生长中 🌱 (剩余: 2小时)
+"""
+
+HARVEST_DONE = "一键采药完成！你从 11 块灵田中总计收获了：【凝血草】x25！"
+
+
+class TestGardenParser(unittest.TestCase):
+    def test_parse_garden_status_rejects_unrelated(self) -> None:
+        cached = _parse_garden_status.cache_info().currsize
+        self.assertIsNone(parse_garden_status("hello world"))
+        self.assertEqual(_parse_garden_status.cache_info().currsize, cached)
+        self.assertIsNone(parse_garden_status("【小药园】\n" + "1号灵田: 空闲\n" * 500))
+
+    def test_parse_garden_status_accepts_spaced_plot_label(self) -> None:
+        status = parse_garden_status("【小药园】\n1号 灵田: 凝血草-生长中 (剩余: 2分钟)\n2 号灵田: 空闲")
+        assert status is not None
+        self.assertTrue(status.has_idle)
+        self.assertEqual(status.min_remaining_seconds, 120)
+
+    def test_parse_garden_status_plot_lines_do_not_run_into_each_other(self) -> None:
+        status = parse_garden_status("【小药园】\n1号灵田:\n2号灵田: 凝血草-已成熟\r\n3号灵田: 凝血草-生长中 (剩余: 1分钟)")
+        assert status is not None
+        self.assertTrue(status.has_mature)
+        # Plot 2 is mature, so only plot 3 contributes a remaining time.
+        self.assertEqual(status.min_remaining_seconds, 60)
+
+    def test_parse_garden_status_flags(self) -> None:
+        status = parse_garden_status(MIXED_STATUS)
         assert status is not None
         self.assertTrue(status.has_growing)
         self.assertTrue(status.has_insect)
@@ -74,38 +79,40 @@ class TestGardenParser(unittest.TestCase):
         self.assertEqual(status.min_remaining_seconds, 19607)
 
     def test_parse_garden_status_idle(self) -> None:
-        text = """【黄枫谷·小药园】(灵田总数: 3块)
-1号灵田: 空闲
-2号灵田: 空闲
-3号灵田: 清灵草种子-生长中 🌱 (剩余: 1小时)
-"""
-        status = parse_garden_status(text)
+        status = parse_garden_status(IDLE_GROWING_STATUS)
         assert status is not None
         self.assertTrue(status.has_idle)
         self.assertTrue(status.has_growing)
         self.assertFalse(status.has_mature)
         self.assertEqual(status.min_remaining_seconds, 3600)
 
+    def test_parse_garden_status_remaining_spans_days(self) -> None:
+        status = parse_garden_status(
+            "【小药园】\n1号灵田: 凝血草 - 生长中 (剩余: 1天2小时3分钟4秒)\n2号灵田: 凝血草 - 生长中 (剩余: 30秒)"
+        )
+        assert status is not None
+        self.assertEqual(status.min_remaining_seconds, 30)
+        status = parse_garden_status("【小药园】\n1号灵田: 凝血草 - 生长中 (剩余: 1天2小时3分钟4秒)")
+        assert status is not None
+        self.assertEqual(status.min_remaining_seconds, 86400 + 7200 + 180 + 4)
+
+    def test_parse_garden_status_falls_back_to_whole_text(self) -> None:
+        status = parse_garden_status("灵田总数: 2\n凝血草 已成熟\n另一块杂草横生，灵气干涸 (剩余: 5分钟)")
+        assert status is not None
+        self.assertTrue(status.has_mature)
+        self.assertTrue(status.has_weed)
+        self.assertTrue(status.has_drought)
+        self.assertFalse(status.has_idle)
+        self.assertFalse(status.has_insect)
+        self.assertEqual(status.min_remaining_seconds, 300)
+
 
 class TestGardenPlugin(unittest.IsolatedAsyncioTestCase):
+
     async def test_status_schedules_poll_near_maturity(self) -> None:
-        plugin = AutoGardenPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoGardenPlugin(_dummy_config(), _LOG)
 
-        text = """【黄枫谷·小药园】(灵田总数: 3块)
-1号灵田: 清灵草种子-生长中 🌱 (剩余: 14分钟)
-2号灵田: 清灵草种子-生长中 🌱 (剩余: 2小时)
-3号灵田: 清灵草种子-生长中 🌱 (剩余: 3小时)
-"""
-        ctx = MessageContext(
-            chat_id=-100,
-            message_id=9,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text=text,
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        ctx = make_ctx(NEAR_MATURE_STATUS, message_id=9)
 
         actions = await plugin.on_message(ctx)
         assert actions is not None
@@ -116,23 +123,9 @@ class TestGardenPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(actions[0].delay_seconds, 850.0)
 
     async def test_status_schedules_maintenance_and_harvest(self) -> None:
-        plugin = AutoGardenPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoGardenPlugin(_dummy_config(), _LOG)
 
-        text = """【黄枫谷·小药园】(灵田总数: 3块)
-1号灵田: 清灵草种子-杂草横生 🌿
-2号灵田: 清灵草种子-害虫侵扰 🐛
-3号灵田: 清灵草种子-灵气干涸 🍂 已成熟 ✨
-"""
-        ctx = MessageContext(
-            chat_id=-100,
-            message_id=1,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text=text,
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        ctx = make_ctx(MAINTENANCE_STATUS)
 
         actions = await plugin.on_message(ctx)
         assert actions is not None
@@ -150,41 +143,18 @@ class TestGardenPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertNotIn(".播种", " ".join(a.text for a in actions))
 
     async def test_status_sows_when_idle_and_no_mature(self) -> None:
-        plugin = AutoGardenPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoGardenPlugin(_dummy_config(), _LOG)
 
-        text = """【黄枫谷·小药园】(灵田总数: 3块)
-1号灵田: 空闲
-2号灵田: 清灵草种子-生长中 🌱 (剩余: 1小时)
-3号灵田: 清灵草种子-生长中 🌱 (剩余: 2小时)
-"""
-        ctx = MessageContext(
-            chat_id=-100,
-            message_id=2,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text=text,
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        ctx = make_ctx(IDLE_SOW_STATUS, message_id=2)
 
         actions = await plugin.on_message(ctx)
         assert actions is not None
         self.assertEqual(actions[-1].text, ".播种 清灵草种子")
 
     async def test_harvest_reply_triggers_sow(self) -> None:
-        plugin = AutoGardenPlugin(_dummy_config(), logging.getLogger("test"))
-
-        ctx = MessageContext(
-            chat_id=-100,
-            message_id=3,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="一键采药完成！你从 11 块灵田中总计收获了：【凝血草】x25！",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        plugin = AutoGardenPlugin(_dummy_config(), _LOG)
+
+        ctx = make_ctx(HARVEST_DONE, message_id=3)
 
         actions = await plugin.on_message(ctx)
         assert actions is not None
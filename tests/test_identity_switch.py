@@ -15,6 +15,10 @@ from xiuxian_bot.core.state_store import SQLiteStateStore
 from xiuxian_bot.domain.text_normalizer import normalize_match_text
 
 
+_LOG = logging.getLogger("test")
+_FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def _config() -> Config:
     return Config.from_mapping(
         {
@@ -67,7 +71,7 @@ def _ctx(
         reply_to_msg_id=reply_to_msg_id,
         sender_id=999,
         text=text,
-        ts=datetime.now(timezone.utc),
+        ts=_FROZEN_TS,
         is_reply=reply_to_msg_id is not None,
         is_reply_to_me=effective_reply_to_me,
     )
@@ -96,7 +100,7 @@ class TestIdentitySwitchMatching(unittest.IsolatedAsyncioTestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             state_store = SQLiteStateStore(
                 str(Path(tmpdir) / "state.sqlite3"),
-                logging.getLogger("test"),
+                _LOG,
             )
 
             async def _send(*_args, **_kwargs) -> int | None:  # type: ignore[no-untyped-def]
@@ -105,7 +109,7 @@ class TestIdentitySwitchMatching(unittest.IsolatedAsyncioTestCase):
             coordinator = IdentitySwitchCoordinator(
                 config,
                 state_store,
-                logging.getLogger("test"),
+                _LOG,
                 _send,
             )
 
@@ -118,7 +122,7 @@ class TestIdentitySwitchMatching(unittest.IsolatedAsyncioTestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             state_store = SQLiteStateStore(
                 str(Path(tmpdir) / "state.sqlite3"),
-                logging.getLogger("test"),
+                _LOG,
             )
 
             async def _send(*_args, **_kwargs) -> int | None:  # type: ignore[no-untyped-def]
@@ -127,7 +131,7 @@ class TestIdentitySwitchMatching(unittest.IsolatedAsyncioTestCase):
             coordinator = IdentitySwitchCoordinator(
                 config,
                 state_store,
-                logging.getLogger("test"),
+                _LOG,
                 _send,
             )
             coordinator.mark_active("avatar_a")
@@ -141,7 +145,7 @@ class TestIdentitySwitchMatching(unittest.IsolatedAsyncioTestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             state_store = SQLiteStateStore(
                 str(Path(tmpdir) / "state.sqlite3"),
-                logging.getLogger("test"),
+                _LOG,
             )
 
             async def _send(*_args, **_kwargs) -> int | None:  # type: ignore[no-untyped-def]
@@ -150,7 +154,7 @@ class TestIdentitySwitchMatching(unittest.IsolatedAsyncioTestCase):
             coordinator = IdentitySwitchCoordinator(
                 config,
                 state_store,
-                logging.getLogger("test"),
+                _LOG,
                 _send,
             )
             coordinator.mark_active("avatar_a")
@@ -165,7 +169,7 @@ class TestIdentitySwitchMatching(unittest.IsolatedAsyncioTestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             state_store = SQLiteStateStore(
                 str(Path(tmpdir) / "state.sqlite3"),
-                logging.getLogger("test"),
+                _LOG,
             )
 
             async def _send(_plugin: str, text: str, _reply_to_topic: bool) -> int | None:
@@ -175,7 +179,7 @@ class TestIdentitySwitchMatching(unittest.IsolatedAsyncioTestCase):
             coordinator = IdentitySwitchCoordinator(
                 config,
                 state_store,
-                logging.getLogger("test"),
+                _LOG,
                 _send,
             )
 
@@ -201,7 +205,7 @@ class TestIdentitySwitchMatching(unittest.IsolatedAsyncioTestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             state_store = SQLiteStateStore(
                 str(Path(tmpdir) / "state.sqlite3"),
-                logging.getLogger("test"),
+                _LOG,
             )
 
             async def _send(_plugin: str, text: str, _reply_to_topic: bool) -> int | None:
@@ -211,7 +215,7 @@ class TestIdentitySwitchMatching(unittest.IsolatedAsyncioTestCase):
             coordinator = IdentitySwitchCoordinator(
                 config,
                 state_store,
-                logging.getLogger("test"),
+                _LOG,
                 _send,
             )
             coordinator.mark_active("avatar_a")
@@ -237,7 +241,3 @@ class TestIdentitySwitchMatching(unittest.IsolatedAsyncioTestCase):
             self.assertTrue(await asyncio.wait_for(task, timeout=1.0))
             self.assertEqual(sent, [".切换 主魂"])
             self.assertEqual(coordinator.active_identity_key, "main")
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -8,6 +8,10 @@ from xiuxian_bot.runtime import build_plugins
 from xiuxian_bot.plugins.lingxiaogong import AutoLingxiaogongPlugin
 
 
+_LOG = logging.getLogger("test")
+_FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def _dummy_config(
     *,
     enable_lingxiaogong: bool = True,
@@ -87,11 +91,11 @@ def _dummy_config(
 
 class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
     def test_build_plugins_includes_lingxiaogong(self) -> None:
-        plugins = build_plugins(_dummy_config(), logging.getLogger("test"))
+        plugins = build_plugins(_dummy_config(), _LOG)
         self.assertIn("lingxiaogong", {plugin.name for plugin in plugins})
 
     async def test_bootstrap_requests_status_immediately(self) -> None:
-        plugin = AutoLingxiaogongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoLingxiaogongPlugin(_dummy_config(), _LOG)
 
         sends: list[str] = []
 
@@ -107,7 +111,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(sends, [".天阶状态"])
 
     async def test_status_without_wenxin_before_threshold_requests_climb(self) -> None:
-        plugin = AutoLingxiaogongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoLingxiaogongPlugin(_dummy_config(), _LOG)
 
         sends: list[str] = []
 
@@ -139,7 +143,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
 引九天罡风: 未解锁（需完成1轮周天）
 借天门势: 未解锁（需完成3轮周天）
 """,
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -150,7 +154,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_status_before_wenxin_threshold_requests_climb(self) -> None:
         plugin = AutoLingxiaogongPlugin(
             _dummy_config(lingxiaogong_wenxintai_after_climb_count=4),
-            logging.getLogger("test"),
+            _LOG,
         )
 
         sends: list[str] = []
@@ -186,7 +190,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
  - .引九天罡风: 3小时3分钟16秒
  - .借天门势: 未解锁 (需完成 3 轮周天)
 """,
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -195,7 +199,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(sends[-1], ".登天阶")
 
     async def test_status_with_existing_seal_requests_climb(self) -> None:
-        plugin = AutoLingxiaogongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoLingxiaogongPlugin(_dummy_config(), _LOG)
 
         sends: list[str] = []
 
@@ -225,7 +229,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
 引九天罡风: 未解锁（需完成1轮周天）
 借天门势: 未解锁（需完成3轮周天）
 """,
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -234,7 +238,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(sends[-1], ".登天阶")
 
     async def test_status_with_available_jiutian_requests_jiutian_first(self) -> None:
-        plugin = AutoLingxiaogongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoLingxiaogongPlugin(_dummy_config(), _LOG)
 
         sends: list[str] = []
 
@@ -269,7 +273,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
  - .引九天罡风: 可用
  - .借天门势: 未解锁 (需完成 3 轮周天)
 """,
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -278,7 +282,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(sends[-1], ".引九天罡风")
 
     async def test_system_identity_status_feedback_matches_pending_request_without_reply(self) -> None:
-        plugin = AutoLingxiaogongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoLingxiaogongPlugin(_dummy_config(), _LOG)
 
         sends: list[str] = []
 
@@ -313,7 +317,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
  - .引九天罡风: 3小时3分钟16秒
  - .借天门势: 未解锁 (需完成 3 轮周天)
 """,
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=False,
             is_reply_to_me=False,
             is_from_system_identity=True,
@@ -324,7 +328,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(sends[-1], ".登天阶")
 
     async def test_system_identity_status_feedback_without_reply_marker_matches_pending_request(self) -> None:
-        plugin = AutoLingxiaogongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoLingxiaogongPlugin(_dummy_config(), _LOG)
 
         sends: list[str] = []
 
@@ -350,7 +354,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
 登阶冷却: 0秒
 问心状态: 今日尚未问心。可使用 .问心台 获取登阶加持。
 """,
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=False,
             is_from_system_identity=True,
@@ -362,7 +366,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(sends[-1], ".登天阶")
 
     async def test_wenxintai_unknown_seal_marks_done_and_schedules_refresh(self) -> None:
-        plugin = AutoLingxiaogongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoLingxiaogongPlugin(_dummy_config(), _LOG)
 
         scheduled: list[tuple[str, float]] = []
 
@@ -388,7 +392,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
 你于问心台前静坐良久，最终凝出一道【无相】之印。
 你因此获得了 20 点宗门贡献。
 """,
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -399,7 +403,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertIn(("lingxiaogong.status.loop", 15.0), scheduled)
 
     async def test_status_with_cooldown_schedules_climb_retry(self) -> None:
-        plugin = AutoLingxiaogongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoLingxiaogongPlugin(_dummy_config(), _LOG)
 
         scheduled: list[tuple[str, float]] = []
 
@@ -428,7 +432,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
 引九天罡风: 未解锁（需完成1轮周天）
 借天门势: 未解锁（需完成3轮周天）
 """,
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -442,7 +446,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertLess(climb_delays[0], 4452)
 
     async def test_jiutian_feedback_schedules_status_refresh_and_next_retry(self) -> None:
-        plugin = AutoLingxiaogongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoLingxiaogongPlugin(_dummy_config(), _LOG)
 
         scheduled: list[tuple[str, float]] = []
 
@@ -469,7 +473,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
 【罡风淬体】提升至 6 / 12 层，并凝得一道【澄明】之印。
 下一次登天阶的成功率将显著提高。
 """,
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -484,7 +488,7 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertLess(jiutian_delays[0], 43202)
 
     async def test_climb_feedback_schedules_status_refresh(self) -> None:
-        plugin = AutoLingxiaogongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoLingxiaogongPlugin(_dummy_config(), _LOG)
 
         scheduled: list[tuple[str, float]] = []
 
@@ -510,14 +514,10 @@ class TestLingxiaogongPlugin(unittest.IsolatedAsyncioTestCase):
 你在阶前生出杂念，心魔趁虚而入，额外损失了 73 点修为。
 当前云阶进度仍为 4 / 12，罡风淬体: 1 / 12
 """,
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
 
         await plugin.on_message(ctx)
         self.assertIn(("lingxiaogong.status.loop", 15.0), scheduled)
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -11,6 +11,10 @@ from xiuxian_bot.plugins.luoyunzong import LuoyunzongPlugin
 from xiuxian_bot.runtime import build_plugins
 
 
+_LOG = logging.getLogger("test")
+_FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def _dummy_config(**overrides) -> Config:
     values = {
         "tg_api_id": "1",
@@ -38,7 +42,7 @@ def _ctx(text: str, *, reply_to_msg_id: int | None = 1001) -> MessageContext:
         reply_to_msg_id=reply_to_msg_id,
         sender_id=999,
         text=text,
-        ts=datetime.now(timezone.utc),
+        ts=_FROZEN_TS,
         is_reply=reply_to_msg_id is not None,
         is_reply_to_me=reply_to_msg_id is not None,
     )
@@ -123,11 +127,11 @@ PUBLIC_GUARD_FINISHED = """【守护成功！】
 
 class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
     def test_build_plugins_includes_luoyunzong(self) -> None:
-        plugins = build_plugins(_dummy_config(), logging.getLogger("test"))
+        plugins = build_plugins(_dummy_config(), _LOG)
         self.assertIn("luoyunzong", {plugin.name for plugin in plugins})
 
     def test_parse_status_extracts_needs_progress_and_stage(self) -> None:
-        plugin = LuoyunzongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = LuoyunzongPlugin(_dummy_config(), _LOG)
 
         status = plugin._parse_status(NORMAL_STATUS)  # noqa: SLF001
 
@@ -136,7 +140,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(status["stage"], (4, 4))
 
     async def test_bootstrap_sends_linggen_then_status(self) -> None:
-        plugin = LuoyunzongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = LuoyunzongPlugin(_dummy_config(), _LOG)
         calls: list[tuple[str, float, object]] = []
         sends: list[str] = []
 
@@ -160,7 +164,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         )
 
     async def test_linggen_match_sends_watering(self) -> None:
-        plugin = LuoyunzongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = LuoyunzongPlugin(_dummy_config(), _LOG)
         await plugin.on_message(_ctx("灵根: 天灵根(木)"))
 
         actions = await plugin.on_message(_ctx(NORMAL_STATUS))
@@ -171,7 +175,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_attack_sends_guard_not_watering(self) -> None:
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
         )
 
         actions = await plugin.on_message(_ctx(ATTACK_STATUS))
@@ -183,7 +187,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
 
@@ -197,7 +201,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_public_guard_finished_exits_guard_state(self) -> None:
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
         )
 
         await plugin.on_global_status(_ctx(PUBLIC_GUARD_STARTED, reply_to_msg_id=None))
@@ -210,7 +214,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_attack_forecast_does_not_send_guard(self) -> None:
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
         )
 
         actions = await plugin.on_message(_ctx(ATTACK_FORECAST_STATUS))
@@ -222,7 +226,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
 
@@ -244,7 +248,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
 
@@ -264,12 +268,12 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin_a = LuoyunzongPlugin(
             _dummy_config(active_identity_key="avatar_a"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
         plugin_b = LuoyunzongPlugin(
             _dummy_config(active_identity_key="avatar_b"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
 
@@ -285,7 +289,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
         calls: list[tuple[str, float, object]] = []
@@ -311,7 +315,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
 
@@ -326,7 +330,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         current_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: current_now,
         )
         one_hour_status = HARVESTED_STATUS_WITH_REMAINING.replace(
@@ -347,7 +351,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
 
@@ -362,7 +366,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
 
@@ -376,7 +380,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_always_strategy_waters_without_linggen_match(self) -> None:
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
         )
 
         actions = await plugin.on_message(_ctx(NORMAL_STATUS))
@@ -390,7 +394,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
                 luoyunzong_watering_strategy="match_need",
                 luoyunzong_watering_required_needs="火,金",
             ),
-            logging.getLogger("test"),
+            _LOG,
         )
 
         no_action = await plugin.on_message(_ctx(NORMAL_STATUS))
@@ -404,7 +408,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
         calls: list[tuple[str, float, object]] = []
@@ -430,7 +434,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
         plugin._watering_next_at = base_now + timedelta(minutes=11)  # type: ignore[attr-defined]
@@ -453,7 +457,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         current_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: current_now,
         )
         plugin._watering_next_at = current_now + timedelta(seconds=7)  # type: ignore[attr-defined]
@@ -493,7 +497,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
 
@@ -515,7 +519,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
 
@@ -535,7 +539,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
         calls: list[tuple[str, float, object]] = []
@@ -559,7 +563,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
         calls: list[tuple[str, float, object]] = []
@@ -586,7 +590,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
         calls: list[tuple[str, float, object]] = []
@@ -613,7 +617,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_guard_prompt_text_does_not_refresh_guard_cooldown(self) -> None:
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
         )
 
         await plugin.on_message(_ctx("请速用 .协同守山！ 守山次数: 356"))
@@ -624,7 +628,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
         calls: list[tuple[str, float, object]] = []
@@ -648,7 +652,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
     def test_guard_status_text_is_not_action_feedback(self) -> None:
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
         )
 
         self.assertFalse(plugin._looks_like_action_feedback(ATTACK_STATUS))  # type: ignore[attr-defined]
@@ -660,7 +664,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
         current_now = datetime(2026, 5, 8, 12, 0, tzinfo=timezone.utc)
         plugin = LuoyunzongPlugin(
             _dummy_config(luoyunzong_watering_strategy="always"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: current_now,
         )
 
@@ -681,12 +685,12 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
             store_b = SQLiteStateStore(str(path), account_id="1:avatar_b")
             plugin_a = LuoyunzongPlugin(
                 _dummy_config(luoyunzong_watering_strategy="always"),
-                logging.getLogger("test"),
+                _LOG,
                 now_fn=lambda: base_now,
             )
             plugin_b = LuoyunzongPlugin(
                 _dummy_config(luoyunzong_watering_strategy="always"),
-                logging.getLogger("test"),
+                _LOG,
                 now_fn=lambda: base_now,
             )
             plugin_a.set_state_store(store_a)
@@ -712,12 +716,12 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
             global_store = root.for_account("__global__:luoyunzong")
             plugin_a = LuoyunzongPlugin(
                 _dummy_config(account_id="1", active_identity_key="avatar_a"),
-                logging.getLogger("test"),
+                _LOG,
                 now_fn=lambda: base_now,
             )
             plugin_b = LuoyunzongPlugin(
                 _dummy_config(account_id="2", active_identity_key="avatar_b"),
-                logging.getLogger("test"),
+                _LOG,
                 now_fn=lambda: base_now,
             )
             plugin_a.set_state_store(root.for_account("1:avatar_a"))
@@ -757,7 +761,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
             global_store = root.for_account("__global__:luoyunzong")
             plugin_a = LuoyunzongPlugin(
                 _dummy_config(account_id="1", active_identity_key="avatar_a"),
-                logging.getLogger("test"),
+                _LOG,
                 now_fn=lambda: base_now,
             )
             plugin_b = LuoyunzongPlugin(
@@ -766,7 +770,7 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
                     active_identity_key="avatar_b",
                     luoyunzong_watering_strategy="always",
                 ),
-                logging.getLogger("test"),
+                _LOG,
                 now_fn=lambda: base_now,
             )
             plugin_a.set_state_store(root.for_account("1:avatar_a"))
@@ -822,7 +826,3 @@ class TestLuoyunzongPlugin(unittest.IsolatedAsyncioTestCase):
                 for line in captured.output
             )
         )
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -13,6 +13,16 @@ from xiuxian_bot.config import Config, IdentityProfile, SystemConfig
 from xiuxian_bot.core.account_repository import AccountRepository
 
 
+_LOG = logging.getLogger("test")
+
+
+class _FakeSchedulerBase:
+    # Runtime queues delayed actions through schedule_many; route them through each fake's schedule().
+    async def schedule_many(self, items) -> None:  # type: ignore[no-untyped-def]
+        for key, delay_seconds, action in items:
+            await self.schedule(key=key, delay_seconds=delay_seconds, action=action)  # type: ignore[attr-defined]
+
+
 def _dummy_config(**overrides) -> Config:
     values = dict(
         tg_api_id=1,
@@ -24,7 +34,7 @@ def _dummy_config(**overrides) -> Config:
         send_to_topic=True,
         action_cmd_biguan=".闭关修炼",
         dry_run=False,
-        log_level="INFO",
+        log_level="CRITICAL",
         global_sends_per_minute=6,
         plugin_sends_per_minute=3,
         enable_biguan=False,
@@ -115,7 +125,7 @@ class TestMessageArchiveRepository(unittest.TestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = MessageArchiveRepository(str(path), logging.getLogger("test"))
+            repo = MessageArchiveRepository(str(path), _LOG)
             ts = datetime.now(timezone.utc)
 
             repo.archive_message(
@@ -170,7 +180,7 @@ class TestMessageArchiveRepository(unittest.TestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = MessageArchiveRepository(str(path), logging.getLogger("test"))
+            repo = MessageArchiveRepository(str(path), _LOG)
             for account_id, message_id in (
                 (1, 1001),
                 (1, 1002),
@@ -221,7 +231,7 @@ class TestMessageArchiveRepository(unittest.TestCase):
             conn.commit()
             conn.close()
 
-            repo = MessageArchiveRepository(str(path), logging.getLogger("test"))
+            repo = MessageArchiveRepository(str(path), _LOG)
             global_stats = repo.get_stats(now=fixed_now)
             account_stats = repo.get_stats(account_id=1, now=fixed_now)
 
@@ -246,7 +256,7 @@ class TestMessageArchiveRepository(unittest.TestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = MessageArchiveRepository(str(path), logging.getLogger("test"))
+            repo = MessageArchiveRepository(str(path), _LOG)
             for message_id in (3001, 3002, 3003):
                 repo.archive_message(
                     MessageArchiveInput(
@@ -283,7 +293,7 @@ class TestMessageArchiveRepository(unittest.TestCase):
             conn.commit()
             conn.close()
 
-            repo = MessageArchiveRepository(str(path), logging.getLogger("test"))
+            repo = MessageArchiveRepository(str(path), _LOG)
             result = repo.cleanup_old_messages(
                 retention_days=30,
                 now=fixed_now,
@@ -331,7 +341,7 @@ class TestMessageArchiveRepository(unittest.TestCase):
             conn.commit()
             conn.close()
 
-            repo = MessageArchiveRepository(str(path), logging.getLogger("test"))
+            repo = MessageArchiveRepository(str(path), _LOG)
             repo.archive_message(
                 MessageArchiveInput(
                     account_id=1,
@@ -401,7 +411,7 @@ class TestRuntimeMessageArchive(unittest.IsolatedAsyncioTestCase):
         from xiuxian_bot.core.contracts import MessageContext
         from xiuxian_bot.runtime import AccountRunner
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -491,7 +501,7 @@ class TestRuntimeMessageArchive(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             record = repo.create_account("alpha", _dummy_config(account_name="alpha"), enabled=True)
             system_config = SystemConfig(app_db_path=str(path), log_dir=str(Path(tmpdir) / "logs"))
             runner = AccountRunner(record, system_config)
@@ -507,7 +517,7 @@ class TestRuntimeMessageArchive(unittest.IsolatedAsyncioTestCase):
                 await asyncio.sleep(0.05)
                 await runner.stop()
 
-            archive = MessageArchiveRepository(str(path), logging.getLogger("test"))
+            archive = MessageArchiveRepository(str(path), _LOG)
             rows = archive.search_messages(account_id=record.id)
             self.assertEqual(len(rows), 1)
             self.assertEqual(rows[0].raw_text, "旁观话题消息")
@@ -521,7 +531,7 @@ class TestRuntimeMessageArchive(unittest.IsolatedAsyncioTestCase):
         from xiuxian_bot.core.contracts import MessageContext
         from xiuxian_bot.runtime import AccountRunner
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -611,7 +621,7 @@ class TestRuntimeMessageArchive(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             record = repo.create_account(
                 "alpha",
                 _dummy_config(account_name="alpha", enable_message_archive=False),
@@ -631,7 +641,7 @@ class TestRuntimeMessageArchive(unittest.IsolatedAsyncioTestCase):
                 await asyncio.sleep(0.05)
                 await runner.stop()
 
-            archive = MessageArchiveRepository(str(path), logging.getLogger("test"))
+            archive = MessageArchiveRepository(str(path), _LOG)
             rows = archive.search_messages(account_id=record.id)
             self.assertEqual(rows, [])
             archive.close()
@@ -642,7 +652,7 @@ class TestRuntimeMessageArchive(unittest.IsolatedAsyncioTestCase):
         from xiuxian_bot.core.contracts import MessageContext
         from xiuxian_bot.runtime import AccountRunner
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -741,7 +751,7 @@ class TestRuntimeMessageArchive(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             record = repo.create_account("alpha", _dummy_config(account_name="alpha"), enabled=True)
             system_config = SystemConfig(app_db_path=str(path), log_dir=str(Path(tmpdir) / "logs"))
             runner = AccountRunner(record, system_config)
@@ -757,7 +767,7 @@ class TestRuntimeMessageArchive(unittest.IsolatedAsyncioTestCase):
                 await asyncio.sleep(0.05)
                 await runner.stop()
 
-            archive = MessageArchiveRepository(str(path), logging.getLogger("test"))
+            archive = MessageArchiveRepository(str(path), _LOG)
             rows = archive.search_messages(account_id=record.id)
             self.assertEqual(len(rows), 1)
             self.assertEqual(rows[0].raw_text, "[image]\n编辑后带图说明")
@@ -840,9 +850,9 @@ class TestWebMessageArchive(unittest.IsolatedAsyncioTestCase):
             ), patch("xiuxian_bot.web.RunnerManager", fake_manager):
                 app = create_app()
                 async with app.router.lifespan_context(app):
-                    repository = AccountRepository(system_config.app_db_path, logging.getLogger("test"))
+                    repository = AccountRepository(system_config.app_db_path, _LOG)
                     account = repository.create_account("alpha", _dummy_config(account_name="alpha"), enabled=True)
-                    archive = MessageArchiveRepository(system_config.app_db_path, logging.getLogger("test"))
+                    archive = MessageArchiveRepository(system_config.app_db_path, _LOG)
                     now = datetime.now(timezone.utc)
                     archive.archive_message(
                         MessageArchiveInput(
@@ -946,9 +956,9 @@ class TestWebMessageArchive(unittest.IsolatedAsyncioTestCase):
             )
             fake_manager = self._fake_manager_cls(Path(system_config.log_dir))
 
-            repository = AccountRepository(system_config.app_db_path, logging.getLogger("test"))
+            repository = AccountRepository(system_config.app_db_path, _LOG)
             account = repository.create_account("alpha", _dummy_config(account_name="alpha"), enabled=True)
-            archive = MessageArchiveRepository(system_config.app_db_path, logging.getLogger("test"))
+            archive = MessageArchiveRepository(system_config.app_db_path, _LOG)
             now = datetime(2026, 4, 11, 4, 0, tzinfo=timezone.utc)
             archive.archive_message(
                 MessageArchiveInput(
@@ -1019,7 +1029,3 @@ class TestWebMessageArchive(unittest.IsolatedAsyncioTestCase):
                         self.assertEqual(page.status_code, 200)
                         self.assertIn("保留消息", page.text)
                         self.assertNotIn("过期消息", page.text)
-
-
-if __name__ == "__main__":
-    unittest.main()
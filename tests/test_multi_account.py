@@ -13,6 +13,16 @@ from xiuxian_bot.core.contracts import MessageContext, SendAction
 from xiuxian_bot.core.state_store import SQLiteStateStore, serialize_datetime
 
 
+_LOG = logging.getLogger("test")
+
+
+class _FakeSchedulerBase:
+    # Runtime queues delayed actions through schedule_many; route them through each fake's schedule().
+    async def schedule_many(self, items) -> None:  # type: ignore[no-untyped-def]
+        for key, delay_seconds, action in items:
+            await self.schedule(key=key, delay_seconds=delay_seconds, action=action)  # type: ignore[attr-defined]
+
+
 def _dummy_config(**overrides) -> Config:
     values = dict(
         tg_api_id=1,
@@ -24,7 +34,7 @@ def _dummy_config(**overrides) -> Config:
         send_to_topic=True,
         action_cmd_biguan=".闭关修炼",
         dry_run=False,
-        log_level="INFO",
+        log_level="CRITICAL",
         global_sends_per_minute=6,
         plugin_sends_per_minute=3,
         enable_biguan=True,
@@ -118,7 +128,7 @@ class TestMultiAccountStorage(unittest.TestCase):
     def test_account_repository_persists_identity_profiles(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            logger = logging.getLogger("test")
+            logger = _LOG
             repo = AccountRepository(str(path), logger)
             config = _dummy_config(
                 my_name="寒山子",
@@ -182,10 +192,31 @@ class TestMultiAccountStorage(unittest.TestCase):
         self.assertTrue(_is_luoyunzong_public_guard_route_candidate(finished))
         self.assertFalse(_is_luoyunzong_public_guard_route_candidate("请速用 .查看货品 与其交易！"))
 
+    def test_short_text_collapses_whitespace_and_truncates(self) -> None:
+        from xiuxian_bot.runtime import _short_text
+
+        self.assertEqual(_short_text("  你已收回神通，\n\t神念重归主魂肉身。 "), "你已收回神通， 神念重归主魂肉身。")
+        self.assertEqual(_short_text("甲" * 10, max_chars=10), "甲" * 10)
+        self.assertEqual(_short_text("甲" * 11, max_chars=10), "甲" * 9 + "…")
+        # Long inputs are clipped before collapsing, but still end with the ellipsis.
+        self.assertEqual(_short_text("甲" + " " * 100, max_chars=10), "甲…")
+
+    def test_compile_keyword_scan_matches_any_literal_keyword(self) -> None:
+        from xiuxian_bot.runtime import _compile_keyword_scan
+
+        scan = _compile_keyword_scan(("韩立", "", "观星台", "a.b"))
+        assert scan is not None
+        self.assertIsNotNone(scan.search("道友前往观星台一观"))
+        self.assertIsNotNone(scan.search("@韩立 你好"))
+        self.assertIsNotNone(scan.search("a.b"))
+        self.assertIsNone(scan.search("axb"))
+        self.assertIsNone(scan.search("天机阁快报"))
+        self.assertIsNone(_compile_keyword_scan(("", "")))
+
     def test_account_repository_crud_and_delete_states(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            logger = logging.getLogger("test")
+            logger = _LOG
             repo = AccountRepository(str(path), logger)
 
             created = repo.create_account("alpha", _dummy_config(account_name="alpha"), enabled=True)
@@ -228,7 +259,7 @@ class TestMultiAccountStorage(unittest.TestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            logger = logging.getLogger("test")
+            logger = _LOG
             garden_next = serialize_datetime(datetime.now())
             xinggong_next = serialize_datetime(datetime.now())
             wenan_next = serialize_datetime(datetime.now())
@@ -302,7 +333,7 @@ class TestMultiAccountStorage(unittest.TestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            logger = logging.getLogger("test")
+            logger = _LOG
             store = SQLiteStateStore(str(path), logger, account_id="1")
             blocked_until = serialize_datetime(datetime.now())
             store.save_state(
@@ -338,7 +369,7 @@ class TestMultiAccountStorage(unittest.TestCase):
     def test_ensure_legacy_account_migrates_first_account_only(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             system_config = SystemConfig(
                 app_db_path=str(path),
                 default_account_name="legacy-user",
@@ -372,7 +403,7 @@ class TestMultiAccountStorage(unittest.TestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             record = repo.create_account("alpha", _dummy_config(account_name="alpha"), enabled=True)
             system_config = SystemConfig(app_db_path=str(path), log_dir=str(Path(tmpdir) / "logs"))
 
@@ -418,7 +449,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             record = repo.create_account("alpha", _dummy_config(account_name="alpha"), enabled=True)
             system_config = SystemConfig(app_db_path=str(path), log_dir=str(Path(tmpdir) / "logs"))
 
@@ -465,7 +496,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             record = repo.create_account("alpha", _dummy_config(account_name="alpha"), enabled=True)
             system_config = SystemConfig(app_db_path=str(path), log_dir=str(Path(tmpdir) / "logs"))
 
@@ -482,7 +513,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
         sends: list[tuple[str, str]] = []
         cancel_calls: list[str] = []
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -597,7 +628,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             record = repo.create_account(
                 "alpha",
                 _dummy_config(account_name="alpha", enable_yuanying=True),
@@ -632,7 +663,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
         scheduled_return_main: list[tuple[float, object]] = []
         stop_event = asyncio.Event()
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -795,7 +826,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 my_name="寒山子",
                 auto_return_main_delay_seconds=120,
@@ -848,7 +879,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
         sends: list[tuple[str, str, str | None]] = []
         stop_event = asyncio.Event()
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -959,7 +990,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 my_name="寒山子",
                 enable_xinggong=True,
@@ -1016,7 +1047,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
         cooldown_hits: list[str] = []
         stop_event = asyncio.Event()
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -1111,7 +1142,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 my_name="寒山子",
                 enable_xinggong=True,
@@ -1159,7 +1190,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
         scheduled_return_main: list[tuple[float, object]] = []
         stop_event = asyncio.Event()
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -1252,7 +1283,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 my_name="寒山子",
                 identity_profiles=(
@@ -1317,7 +1348,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
         sends: list[tuple[str, str, str | None, str | None]] = []
         sent_ids: dict[str, int] = {}
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -1406,7 +1437,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 enable_message_archive=False,
                 identity_profiles=(
@@ -1466,7 +1497,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
         scheduled_return_main: list[tuple[float, object]] = []
         stop_event = asyncio.Event()
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -1587,7 +1618,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 my_name="寒山子",
                 auto_return_main_delay_seconds=120,
@@ -1634,7 +1665,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
         scheduled_return_main: list[tuple[float, object]] = []
         stop_event = asyncio.Event()
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -1776,7 +1807,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 my_name="寒山子",
                 auto_return_main_delay_seconds=120,
@@ -1825,7 +1856,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         sends: list[tuple[str, str]] = []
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -1942,7 +1973,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 my_name="寒山子",
                 auto_return_main_after_avatar_action=False,
@@ -1989,7 +2020,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
         sends: list[tuple[str, str, int | None]] = []
         stop_event = asyncio.Event()
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -2089,7 +2120,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             record = repo.create_account("alpha", _dummy_config(account_name="alpha"), enabled=True)
             system_config = SystemConfig(app_db_path=str(path), log_dir=str(Path(tmpdir) / "logs"))
             runner = AccountRunner(record, system_config)
@@ -2108,12 +2139,291 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(sends, [("reply", ".交换 功法", 4321)])
             repo.close()
 
+    async def test_account_runner_keeps_action_order_when_mixing_delayed_and_immediate(self) -> None:
+        from xiuxian_bot.runtime import AccountRunner
+
+        events: list[tuple[str, ...]] = []
+        stop_event = asyncio.Event()
+
+        class FakeScheduler(_FakeSchedulerBase):
+            def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
+                self.logger = logger
+
+            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
+                _ = action
+                events.append(("schedule", key, str(delay_seconds)))
+
+            async def schedule_many(self, items) -> None:  # type: ignore[no-untyped-def]
+                events.append(("batch", *(f"{key}@{delay_seconds:g}" for key, delay_seconds, _ in items)))
+
+            async def cancel_all(self) -> None:
+                return None
+
+        class FakeAdapter:
+            def __init__(self, config, logger, **kwargs) -> None:  # type: ignore[no-untyped-def]
+                _ = kwargs
+                self.config = config
+                self.logger = logger
+                self.me_id = 1
+                self._new_handler = None
+
+            def on_new_message(self, handler) -> None:  # type: ignore[no-untyped-def]
+                self._new_handler = handler
+
+            def on_message_edited(self, handler) -> None:  # type: ignore[no-untyped-def]
+                _ = handler
+
+            async def start(self) -> None:
+                return None
+
+            async def send_message(
+                self,
+                text: str,
+                *,
+                reply_to_topic: bool = True,
+                reply_to_msg_id: int | None = None,
+            ) -> int | None:
+                _ = (text, reply_to_topic, reply_to_msg_id)
+                return 5001
+
+            async def build_context(self, event) -> MessageContext:  # type: ignore[no-untyped-def]
+                return event
+
+            async def run_forever(self) -> None:
+                assert self._new_handler is not None
+                await self._new_handler(
+                    MessageContext(
+                        chat_id=-100,
+                        message_id=4321,
+                        reply_to_msg_id=None,
+                        sender_id=999,
+                        text="@Me 测试回包",
+                        ts=datetime.now(timezone.utc),
+                        is_reply=False,
+                        is_reply_to_me=False,
+                    )
+                )
+                await stop_event.wait()
+
+            async def stop(self) -> None:
+                stop_event.set()
+
+        class FakeSender:
+            def __init__(self, **kwargs) -> None:  # type: ignore[no-untyped-def]
+                self.kwargs = kwargs
+
+            async def send(
+                self,
+                plugin: str,
+                text: str,
+                reply_to_topic: bool,
+                *,
+                reply_to_msg_id: int | None = None,
+                identity_key: str | None = None,
+            ) -> int | None:
+                _ = (plugin, reply_to_topic, reply_to_msg_id, identity_key)
+                events.append(("send", text))
+                return 5000 + len(events)
+
+        class MixedPlugin:
+            name = "mixed"
+            enabled = True
+            priority = 10
+
+            async def on_message(self, ctx: MessageContext):  # type: ignore[no-untyped-def]
+                _ = ctx
+                return [
+                    SendAction(plugin=self.name, text=".一", reply_to_topic=True),
+                    SendAction(plugin=self.name, text=".二", reply_to_topic=True, delay_seconds=5.0, key="two"),
+                    SendAction(plugin=self.name, text=".三", reply_to_topic=True),
+                    SendAction(plugin=self.name, text=".四", reply_to_topic=True, delay_seconds=7.0, key="four"),
+                    SendAction(plugin=self.name, text=".五", reply_to_topic=True, delay_seconds=9.0, key="five"),
+                ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "app.sqlite3"
+            repo = AccountRepository(str(path), _LOG)
+            record = repo.create_account("alpha", _dummy_config(account_name="alpha"), enabled=True)
+            system_config = SystemConfig(app_db_path=str(path), log_dir=str(Path(tmpdir) / "logs"))
+            runner = AccountRunner(record, system_config)
+
+            with patch("xiuxian_bot.runtime.Scheduler", FakeScheduler), patch(
+                "xiuxian_bot.runtime.ReliableSender",
+                FakeSender,
+            ), patch("xiuxian_bot.runtime.TGAdapter", FakeAdapter), patch(
+                "xiuxian_bot.runtime.build_plugins",
+                return_value=[MixedPlugin()],
+            ):
+                await runner.start()
+                await asyncio.sleep(0.05)
+                await runner.stop()
+
+            # Each delayed action is queued at its place in the list, so its delay counts from
+            # after the immediate sends before it; consecutive delayed actions share one batch.
+            actions = [event for event in events if event[0] in ("send", "batch")]
+            self.assertEqual(
+                actions,
+                [
+                    ("send", ".一"),
+                    ("batch", "main:two@5"),
+                    ("send", ".三"),
+                    ("batch", "main:four@7", "main:five@9"),
+                ],
+            )
+            repo.close()
+
+    async def test_account_runner_drops_buffered_delayed_actions_when_pause_starts(self) -> None:
+        from xiuxian_bot.runtime import AccountRunner
+
+        sends: list[str] = []
+        pending: dict[str, float] = {}
+
+        class FakeScheduler(_FakeSchedulerBase):
+            def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
+                self.logger = logger
+
+            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
+                _ = action
+                pending[key] = delay_seconds
+
+            async def schedule_many(self, items) -> None:  # type: ignore[no-untyped-def]
+                for key, delay_seconds, _ in items:
+                    pending[key] = delay_seconds
+
+            async def cancel_all(self) -> None:
+                pending.clear()
+
+        class FakeSender:
+            def __init__(self, **kwargs) -> None:  # type: ignore[no-untyped-def]
+                self.kwargs = kwargs
+
+            async def send(
+                self,
+                plugin: str,
+                text: str,
+                reply_to_topic: bool,
+                *,
+                reply_to_msg_id: int | None = None,
+                identity_key: str | None = None,
+            ) -> int | None:
+                _ = (plugin, reply_to_topic, reply_to_msg_id, identity_key)
+                sends.append(text)
+                return 1
+
+        class FakeAdapter:
+            def __init__(self, config, logger, **kwargs) -> None:  # type: ignore[no-untyped-def]
+                _ = kwargs
+                self.config = config
+                self.logger = logger
+                self.me_id = 1
+                self._handler = None
+
+            def on_new_message(self, handler) -> None:  # type: ignore[no-untyped-def]
+                self._handler = handler
+
+            def on_message_edited(self, handler) -> None:  # type: ignore[no-untyped-def]
+                _ = handler
+
+            async def start(self) -> None:
+                return None
+
+            async def send_message(
+                self,
+                text: str,
+                *,
+                reply_to_topic: bool = True,
+                reply_to_msg_id: int | None = None,
+            ) -> int | None:
+                _ = (text, reply_to_topic, reply_to_msg_id)
+                return 1
+
+            async def build_context(self, event) -> MessageContext:  # type: ignore[no-untyped-def]
+                return event
+
+            async def run_forever(self) -> None:
+                assert self._handler is not None
+                await self._handler(
+                    MessageContext(
+                        chat_id=-100,
+                        message_id=4321,
+                        reply_to_msg_id=None,
+                        sender_id=999,
+                        text="@Me 测试回包",
+                        ts=datetime.now(timezone.utc),
+                        is_reply=False,
+                        is_reply_to_me=False,
+                    )
+                )
+                await asyncio.Future()
+
+            async def stop(self) -> None:
+                return None
+
+        class PausePlugin:
+            name = "yuanying"
+            enabled = True
+            priority = 100
+
+            def __init__(self) -> None:
+                self.clear_checks: int | None = None
+
+            def set_state_store(self, store) -> None:  # type: ignore[no-untyped-def]
+                _ = store
+
+            def restore_state(self) -> None:
+                return None
+
+            def runtime_pause_reason(self) -> str | None:
+                # Clear for the dispatch-level check and the first action, then the escape kicks in.
+                if self.clear_checks is None or self.clear_checks > 0:
+                    if self.clear_checks is not None:
+                        self.clear_checks -= 1
+                    return None
+                return "元婴遁逃暂停中，等待手动恢复"
+
+            async def on_message(self, ctx: MessageContext) -> list[SendAction] | None:
+                _ = ctx
+                self.clear_checks = 2
+                return [
+                    SendAction(plugin=self.name, text=".二", reply_to_topic=True, delay_seconds=5.0, key="two"),
+                    SendAction(plugin=self.name, text=".三", reply_to_topic=True),
+                ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "app.sqlite3"
+            repo = AccountRepository(str(path), _LOG)
+            record = repo.create_account(
+                "alpha",
+                _dummy_config(account_name="alpha", enable_yuanying=True),
+                enabled=True,
+            )
+            system_config = SystemConfig(app_db_path=str(path), log_dir=str(Path(tmpdir) / "logs"))
+            runner = AccountRunner(record, system_config)
+
+            with patch("xiuxian_bot.runtime.Scheduler", FakeScheduler), patch(
+                "xiuxian_bot.runtime.ReliableSender",
+                FakeSender,
+            ), patch("xiuxian_bot.runtime.TGAdapter", FakeAdapter), patch(
+                "xiuxian_bot.runtime.build_plugins",
+                return_value=[PausePlugin()],
+            ):
+                await runner.start()
+                await asyncio.sleep(0.05)
+                snapshot = runner.snapshot()
+                self.assertEqual(snapshot.state, "paused")
+                self.assertEqual(sends, [])
+                # The delayed action was still buffered when pause cancelled the scheduler; it must not outlive it.
+                self.assertEqual(pending, {})
+                await runner.stop()
+
+            repo.close()
+
     async def test_account_runner_binds_reply_to_sending_identity_instead_of_active_identity(self) -> None:
         from xiuxian_bot.runtime import AccountRunner
 
         sends: list[tuple[str, str]] = []
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -2234,7 +2544,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / 'app.sqlite3'
-            repo = AccountRepository(str(path), logging.getLogger('test'))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 my_name='寒山子',
                 identity_profiles=(
@@ -2273,7 +2583,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
         handled_by: list[str] = []
         sent_ids: dict[str, int] = {}
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -2430,7 +2740,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 my_name="寒山子",
                 identity_profiles=(
@@ -2473,7 +2783,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
         from xiuxian_bot.plugins.xinggong import AutoXinggongPlugin
         from xiuxian_bot.runtime import AccountRunner
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -2558,7 +2868,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 my_name="寒山子",
                 enable_xinggong=True,
@@ -2649,7 +2959,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
                     return cls.current.replace(tzinfo=tz)
                 return cls.current
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -2753,7 +3063,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 enable_message_archive=False,
                 enable_xinggong=False,
@@ -2832,7 +3142,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
         avatar_send_started = asyncio.Event()
         scheduled_tasks: list[asyncio.Task[None]] = []
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -2973,7 +3283,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 my_name="寒山子",
                 auto_return_main_after_avatar_action=False,
@@ -3011,7 +3321,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
         sends: list[str] = []
         scheduled_tasks: list[asyncio.Task[None]] = []
 
-        class FakeScheduler:
+        class FakeScheduler(_FakeSchedulerBase):
             def __init__(self, logger) -> None:  # type: ignore[no-untyped-def]
                 self.logger = logger
 
@@ -3142,7 +3452,7 @@ class TestRunnerManager(unittest.IsolatedAsyncioTestCase):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "app.sqlite3"
-            repo = AccountRepository(str(path), logging.getLogger("test"))
+            repo = AccountRepository(str(path), _LOG)
             config = _dummy_config(
                 my_name="寒山子",
                 enable_lingxiaogong=True,
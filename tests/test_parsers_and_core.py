@@ -1,14 +1,35 @@
 import asyncio
 import logging
 import unittest
+from unittest import mock
 
+from xiuxian_bot.core.contracts import SendAction
+from xiuxian_bot.core.dispatcher import Dispatcher
+from xiuxian_bot.core.rate_limit import RateLimiter
+from xiuxian_bot.core.reliable_sender import ReliableSender
 from xiuxian_bot.core.scheduler import Scheduler
+from xiuxian_bot.domain._duration import parse_duration_seconds
 from xiuxian_bot.domain.parsers import (
     parse_biguan_cooldown_minutes,
     parse_lingqi_cooldown_seconds,
 )
 
 
+_LOG = logging.getLogger("test")
+
+
+def _eager_task_factory(loop, coro):  # type: ignore[no-untyped-def]
+    # Runs the coroutine to completion inside create_task, like an eager task that never suspends.
+    future = loop.create_future()
+    try:
+        coro.send(None)
+    except StopIteration:
+        future.set_result(None)
+        return future
+    coro.close()
+    raise AssertionError("eager test action suspended")
+
+
 class TestParsers(unittest.TestCase):
     def test_parse_biguan_cooldown_minutes(self) -> None:
         self.assertEqual(parse_biguan_cooldown_minutes("打坐调息 10 分钟"), 10)
@@ -21,11 +42,20 @@ class TestParsers(unittest.TestCase):
         self.assertEqual(parse_lingqi_cooldown_seconds("灵气尚未平复，无法立即再次闭关。请在 0秒 后再试。"), 0)
         self.assertIsNone(parse_lingqi_cooldown_seconds("灵气尚未平复"))
 
+    def test_parse_duration_seconds_takes_first_amount_per_unit(self) -> None:
+        self.assertEqual(parse_duration_seconds("1天2小时3分钟4秒"), 93784)
+        self.assertEqual(parse_duration_seconds("2小时16分钟 下次 5小时30分钟"), 2 * 3600 + 16 * 60)
+        self.assertIsNone(parse_duration_seconds("尚未开始"))
+
 
 class TestScheduler(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.scheduler = Scheduler(_LOG)
+        # Runs even when an assertion fails mid-test, so no sleeping task outlives its loop.
+        self.addAsyncCleanup(self.scheduler.cancel_all)
+
     async def test_schedule_override_by_key(self) -> None:
-        logger = logging.getLogger("test")
-        scheduler = Scheduler(logger)
+        scheduler = self.scheduler
 
         hits: list[str] = []
 
@@ -39,10 +69,187 @@ class TestScheduler(unittest.IsolatedAsyncioTestCase):
         await scheduler.schedule(key="k", delay_seconds=0.05, action=action2)
 
         await asyncio.sleep(0.3)
-        await scheduler.cancel_all()
 
         self.assertEqual(hits, ["2"])
 
+    async def test_schedule_many_batches_and_overrides_by_key(self) -> None:
+        scheduler = self.scheduler
+
+        hits: list[str] = []
+
+        def _action(tag: str):  # type: ignore[no-untyped-def]
+            async def _run() -> None:
+                hits.append(tag)
+
+            return _run
+
+        await scheduler.schedule(key="a", delay_seconds=0.2, action=_action("a-old"))
+        await scheduler.schedule_many(
+            [
+                ("a", 0.01, _action("a")),
+                ("b", 0.02, _action("b")),
+                ("b", 0.03, _action("b-new")),
+            ]
+        )
+
+        await asyncio.sleep(0.3)
+
+        self.assertEqual(hits, ["a", "b-new"])
+
+    async def test_finished_actions_release_their_key(self) -> None:
+        scheduler = self.scheduler
+
+        runs: list[str] = []
+
+        async def loop_once() -> None:
+            runs.append("loop")
+            if len(runs) == 1:
+                await scheduler.schedule(key="loop", delay_seconds=0.01, action=loop_once)
+
+        async def noop() -> None:
+            return None
+
+        await scheduler.schedule(key="once", delay_seconds=0.0, action=noop)
+        await scheduler.schedule(key="loop", delay_seconds=0.0, action=loop_once)
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(runs, ["loop", "loop"])
+        self.assertEqual(scheduler._tasks, {})  # type: ignore[attr-defined]
+        self.assertEqual(scheduler._pending, {})  # type: ignore[attr-defined]
+
+    async def test_earlier_deadline_scheduled_later_fires_first(self) -> None:
+        scheduler = self.scheduler
+
+        hits: list[str] = []
+
+        def _action(tag: str):  # type: ignore[no-untyped-def]
+            async def _run() -> None:
+                hits.append(tag)
+
+            return _run
+
+        await scheduler.schedule(key="late", delay_seconds=0.08, action=_action("late"))
+        await scheduler.schedule(key="early", delay_seconds=0.01, action=_action("early"))
+        await scheduler.schedule(key="mid", delay_seconds=0.04, action=_action("mid"))
+        await asyncio.sleep(0.03)
+        self.assertEqual(hits, ["early"])
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(hits, ["early", "mid", "late"])
+
+    async def test_rescheduled_keys_do_not_pile_up_tombstones(self) -> None:
+        scheduler = self.scheduler
+
+        hits: list[str] = []
+
+        def _action(tag: str):  # type: ignore[no-untyped-def]
+            async def _run() -> None:
+                hits.append(tag)
+
+            return _run
+
+        await scheduler.schedule(key="other", delay_seconds=0.02, action=_action("other"))
+        for _ in range(50):
+            await scheduler.schedule(key="k", delay_seconds=60.0, action=_action("k-old"))
+        await scheduler.schedule(key="k", delay_seconds=0.01, action=_action("k"))
+
+        self.assertLessEqual(len(scheduler._heap), 4)  # type: ignore[attr-defined]
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(hits, ["k", "other"])
+
+    async def test_eager_zero_delay_reschedule_waits_for_next_timer(self) -> None:
+        scheduler = self.scheduler
+        loop = asyncio.get_running_loop()
+
+        runs: list[str] = []
+
+        async def again() -> None:
+            runs.append("again")
+            # Bounded so a regression fails the assertion below instead of spinning forever.
+            if len(runs) < 5:
+                await scheduler.schedule(key="again", delay_seconds=0.0, action=again)
+
+        with mock.patch.object(loop, "time", return_value=100.0):
+            await scheduler.schedule(key="again", delay_seconds=0.0, action=again)
+            loop.set_task_factory(_eager_task_factory)
+            try:
+                scheduler._fire_due(loop)  # type: ignore[attr-defined]
+            finally:
+                loop.set_task_factory(None)
+
+        self.assertEqual(runs, ["again"])
+        self.assertIn("again", scheduler._pending)  # type: ignore[attr-defined]
+
+    async def test_cancel_all_drops_pending_actions(self) -> None:
+        scheduler = self.scheduler
+
+        hits: list[str] = []
+
+        async def action() -> None:
+            hits.append("x")
+
+        await scheduler.schedule(key="x", delay_seconds=0.02, action=action)
+        await scheduler.cancel_all()
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(hits, [])
+
+
+class _StubPlugin:
+    def __init__(self, name: str, priority: int, *, delay: float = 0.0, fail: bool = False, enabled: bool = True) -> None:
+        self.name = name
+        self.priority = priority
+        self.enabled = enabled
+        self._delay = delay
+        self._fail = fail
+
+    async def on_message(self, ctx) -> list[SendAction] | None:  # type: ignore[no-untyped-def]
+        await asyncio.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError("boom")
+        return [SendAction(plugin=self.name, text=self.name)]
+
+
+class TestDispatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_dispatch_keeps_priority_order_and_isolates_failures(self) -> None:
+        dispatcher = Dispatcher(
+            [
+                _StubPlugin("low", 0),
+                _StubPlugin("high", 10, delay=0.02),
+                _StubPlugin("broken", 5, fail=True),
+                _StubPlugin("off", 20, enabled=False),
+            ],
+            _LOG,
+        )
+
+        with self.assertLogs(_LOG, level="ERROR") as logs:
+            actions = await dispatcher.dispatch(None)  # type: ignore[arg-type]
+
+        self.assertEqual([action.text for action in actions], ["high", "low"])
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("plugin_error name=broken", logs.output[0])
+
+
+class TestReliableSender(unittest.IsolatedAsyncioTestCase):
+    async def test_send_logs_outgoing_text_with_identity_and_reply(self) -> None:
+        async def send_message(text: str, **_kwargs) -> int | None:  # type: ignore[no-untyped-def]
+            _ = text
+            return 42
+
+        sender = ReliableSender(
+            send_message=send_message,
+            limiter=RateLimiter(global_per_minute=10, plugin_per_minute=10),
+            logger=_LOG,
+            dry_run=False,
+            min_interval_seconds=0.0,
+        )
+
+        with self.assertLogs(_LOG, level="INFO") as logs:
+            self.assertEqual(await sender.send("p", ".闭关", True, identity_key="avatar"), 42)
+            self.assertEqual(await sender.send("p", ".出关", True, reply_to_msg_id=7), 42)
 
-if __name__ == "__main__":
-    unittest.main()
+        self.assertEqual(
+            [record.getMessage() for record in logs.records],
+            [">> [avatar] .闭关", ">> .出关 (reply_to=7)"],
+        )
@@ -11,6 +11,10 @@ from xiuxian_bot.plugins.qiling import QilingPlugin
 from xiuxian_bot.runtime import build_plugins
 
 
+_LOG = logging.getLogger("test")
+_FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 ARTIFACT = "青竹蜂云剑（神雷版）"
 
 QILING_LIST = f"""【本命器灵录】
@@ -41,7 +45,7 @@ def _ctx(text: str) -> MessageContext:
         reply_to_msg_id=1001,
         sender_id=999,
         text=text,
-        ts=datetime.now(timezone.utc),
+        ts=_FROZEN_TS,
         is_reply=True,
         is_reply_to_me=True,
     )
@@ -57,13 +61,13 @@ class _FakeScheduler:
 
 class TestQilingPlugin(unittest.IsolatedAsyncioTestCase):
     def test_build_plugins_includes_qiling(self) -> None:
-        plugins = build_plugins(_dummy_config(), logging.getLogger("test"))
+        plugins = build_plugins(_dummy_config(), _LOG)
         self.assertIn("qiling", {plugin.name for plugin in plugins})
 
     async def test_artifact_list_discovery_extracts_attached_artifacts(self) -> None:
         plugin = QilingPlugin(
             _dummy_config(qiling_artifact_names=""),
-            logging.getLogger("test"),
+            _LOG,
         )
 
         await plugin.on_message(_ctx(QILING_LIST))
@@ -76,7 +80,7 @@ class TestQilingPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_bootstrap_discovers_when_no_artifact_is_configured(self) -> None:
         plugin = QilingPlugin(
             _dummy_config(qiling_artifact_names=""),
-            logging.getLogger("test"),
+            _LOG,
         )
         scheduler = _FakeScheduler()
         sends: list[str] = []
@@ -101,7 +105,7 @@ class TestQilingPlugin(unittest.IsolatedAsyncioTestCase):
                 qiling_enable_nurture=True,
                 qiling_enable_trial=False,
             ),
-            logging.getLogger("test"),
+            _LOG,
         )
         scheduler = _FakeScheduler()
         sends: list[str] = []
@@ -119,7 +123,7 @@ class TestQilingPlugin(unittest.IsolatedAsyncioTestCase):
         base_now = datetime(2026, 5, 19, 12, 0, tzinfo=timezone.utc)
         plugin = QilingPlugin(
             _dummy_config(qiling_artifact_names="玄天斩灵剑"),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
 
@@ -153,7 +157,7 @@ class TestQilingPlugin(unittest.IsolatedAsyncioTestCase):
                 qiling_enable_nurture=True,
                 qiling_enable_trial=False,
             ),
-            logging.getLogger("test"),
+            _LOG,
             now_fn=lambda: base_now,
         )
         scheduler = _FakeScheduler()
@@ -186,7 +190,7 @@ class TestQilingPlugin(unittest.IsolatedAsyncioTestCase):
                     qiling_enable_trial=False,
                     active_identity_key="main",
                 ),
-                logging.getLogger("test"),
+                _LOG,
                 now_fn=lambda: base_now,
             )
             main.set_state_store(main_store)
@@ -209,7 +213,7 @@ class TestQilingPlugin(unittest.IsolatedAsyncioTestCase):
                     qiling_enable_trial=False,
                     active_identity_key="main",
                 ),
-                logging.getLogger("test"),
+                _LOG,
                 now_fn=lambda: base_now,
             )
             main_reloaded.set_state_store(main_store)
@@ -231,7 +235,7 @@ class TestQilingPlugin(unittest.IsolatedAsyncioTestCase):
                     qiling_enable_trial=False,
                     active_identity_key="channel_a",
                 ),
-                logging.getLogger("test"),
+                _LOG,
                 now_fn=lambda: base_now,
             )
             channel.set_state_store(channel_store)
@@ -250,7 +254,3 @@ class TestQilingPlugin(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(channel_sends, [f".抚摸法宝 {ARTIFACT}"])
             main_store.close()
             channel_store.close()
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -7,6 +7,10 @@ from xiuxian_bot.core.contracts import MessageContext
 from xiuxian_bot.plugins.random_event import AutoRandomEventPlugin
 
 
+_LOG = logging.getLogger("test")
+_FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def _dummy_config(**overrides) -> Config:
     values = dict(
         tg_api_id=1,
@@ -108,7 +112,7 @@ def _ctx(text: str, *, message_id: int = 1001) -> MessageContext:
         reply_to_msg_id=None,
         sender_id=999,
         text=text,
-        ts=datetime.now(timezone.utc),
+        ts=_FROZEN_TS,
         is_reply=False,
         is_reply_to_me=False,
     )
@@ -133,7 +137,7 @@ JIYIN_CHOICE_TEXT = """@fanrenthree！你感到一股无法抗拒的意志锁定
 
 class TestRandomEventPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_nanlonghou_choice_replies_to_choice_message(self) -> None:
-        plugin = AutoRandomEventPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoRandomEventPlugin(_dummy_config(), _LOG)
 
         actions = await plugin.on_message(_ctx(CHOICE_TEXT, message_id=321))
 
@@ -145,7 +149,7 @@ class TestRandomEventPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(actions[0].reply_to_msg_id, 321)
 
     async def test_nanlonghou_ignores_other_identity(self) -> None:
-        plugin = AutoRandomEventPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoRandomEventPlugin(_dummy_config(), _LOG)
         text = CHOICE_TEXT.replace("@fanrenthree", "@otheruser")
 
         actions = await plugin.on_message(_ctx(text))
@@ -153,7 +157,7 @@ class TestRandomEventPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(actions)
 
     async def test_nanlonghou_does_not_repeat_same_choice_message(self) -> None:
-        plugin = AutoRandomEventPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoRandomEventPlugin(_dummy_config(), _LOG)
 
         first = await plugin.on_message(_ctx(CHOICE_TEXT, message_id=321))
         second = await plugin.on_message(_ctx(CHOICE_TEXT, message_id=321))
@@ -182,14 +186,14 @@ class TestRandomEventPlugin(unittest.IsolatedAsyncioTestCase):
             ),
             active_identity_key="avatar",
         )
-        plugin = AutoRandomEventPlugin(base.apply_identity("avatar"), logging.getLogger("test"))
+        plugin = AutoRandomEventPlugin(base.apply_identity("avatar"), _LOG)
 
         self.assertTrue(plugin.enabled)
         actions = await plugin.on_message(_ctx(CHOICE_TEXT))
         self.assertIsNone(actions)
 
     async def test_jiyin_choice_replies_to_choice_message(self) -> None:
-        plugin = AutoRandomEventPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoRandomEventPlugin(_dummy_config(), _LOG)
 
         actions = await plugin.on_message(_ctx(JIYIN_CHOICE_TEXT, message_id=654))
 
@@ -201,7 +205,7 @@ class TestRandomEventPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(actions[0].reply_to_msg_id, 654)
 
     async def test_jiyin_ignores_other_identity(self) -> None:
-        plugin = AutoRandomEventPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoRandomEventPlugin(_dummy_config(), _LOG)
         text = JIYIN_CHOICE_TEXT.replace("@fanrenthree", "@otheruser")
 
         actions = await plugin.on_message(_ctx(text))
@@ -232,6 +236,6 @@ class TestRandomEventPlugin(unittest.IsolatedAsyncioTestCase):
             ),
             active_identity_key="avatar",
         )
-        plugin = AutoRandomEventPlugin(base.apply_identity("avatar"), logging.getLogger("test"))
+        plugin = AutoRandomEventPlugin(base.apply_identity("avatar"), _LOG)
 
         self.assertFalse(plugin.enabled)
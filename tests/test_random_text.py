@@ -10,6 +10,9 @@ from xiuxian_bot.plugins.random_text import RandomTextPlugin
 from xiuxian_bot.runtime import build_plugins
 
 
+_LOG = logging.getLogger("test")
+
+
 def _dummy_config(**overrides) -> Config:
     values = {
         "tg_api_id": "1",
@@ -39,11 +42,11 @@ class _FakeRng:
 
 class TestRandomTextPlugin(unittest.IsolatedAsyncioTestCase):
     def test_build_plugins_includes_random_text(self) -> None:
-        plugins = build_plugins(_dummy_config(), logging.getLogger("test"))
+        plugins = build_plugins(_dummy_config(), _LOG)
         self.assertIn("random_text", {plugin.name for plugin in plugins})
 
     async def test_bootstrap_does_not_schedule_initial_send(self) -> None:
-        plugin = RandomTextPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = RandomTextPlugin(_dummy_config(), _LOG)
         calls: list[str] = []
 
         class _FakeScheduler:
@@ -60,7 +63,7 @@ class TestRandomTextPlugin(unittest.IsolatedAsyncioTestCase):
     def test_empty_messages_never_selects_message(self) -> None:
         plugin = RandomTextPlugin(
             _dummy_config(random_text_messages="  \n"),
-            logging.getLogger("test"),
+            _LOG,
         )
 
         self.assertIsNone(plugin.next_message())
@@ -75,7 +78,7 @@ class TestRandomTextPlugin(unittest.IsolatedAsyncioTestCase):
             store = SQLiteStateStore(str(Path(tmpdir) / "state.sqlite3"))
             plugin = RandomTextPlugin(
                 _dummy_config(),
-                logging.getLogger("test"),
+                _LOG,
                 now_fn=_now,
                 rng=_FakeRng(),  # type: ignore[arg-type]
             )
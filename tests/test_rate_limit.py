@@ -1,9 +1,16 @@
-import time
 import unittest
 
 from xiuxian_bot.core.rate_limit import RateLimiter, SlidingWindowRateLimiter
 
 
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
 class TestRateLimiter(unittest.TestCase):
     def test_allow_is_atomic(self) -> None:
         limiter = RateLimiter(global_per_minute=2, plugin_per_minute=1)
@@ -13,19 +20,40 @@ class TestRateLimiter(unittest.TestCase):
         self.assertTrue(limiter.allow("b"))
 
     def test_sliding_window_next_allowed_in(self) -> None:
-        lim = SlidingWindowRateLimiter(max_events=1, window_seconds=1)
+        clock = _FakeClock()
+        lim = SlidingWindowRateLimiter(max_events=1, window_seconds=1, monotonic_fn=clock.monotonic)
         self.assertTrue(lim.allow())
         self.assertFalse(lim.allow())
         wait = lim.next_allowed_in()
         self.assertGreater(wait, 0.0)
-        time.sleep(wait + 0.05)
+        clock.now += wait + 0.05
         self.assertTrue(lim.allow())
 
+    def test_rate_limiter_never_exceeds_limit_in_any_window(self) -> None:
+        clock = _FakeClock()
+        limiter = RateLimiter(global_per_minute=3, plugin_per_minute=2, monotonic_fn=clock.monotonic)
+        allowed: list[float] = []
+        for step in range(600):
+            clock.now = step * 0.5
+            for plugin in ("a", "b"):
+                if limiter.allow(plugin):
+                    allowed.append(clock.now)
+        # The first 3 go out at once, then never more than 3 in any 60s window.
+        self.assertEqual(allowed[:3], [0.0, 0.0, 0.5])
+        for at in allowed:
+            self.assertLessEqual(sum(at - 60 < other <= at for other in allowed), 3)
+        self.assertEqual(len(allowed), 15)
+
+    def test_rate_limiter_next_allowed_in_uses_slowest_bucket(self) -> None:
+        clock = _FakeClock()
+        limiter = RateLimiter(global_per_minute=6, plugin_per_minute=1, monotonic_fn=clock.monotonic)
+        self.assertTrue(limiter.allow("a"))
+        self.assertFalse(limiter.allow("a"))
+        self.assertAlmostEqual(limiter.next_allowed_in("a"), 60.0)
+        self.assertEqual(limiter.next_allowed_in("b"), 0.0)
+
     def test_invalid_limits_raise(self) -> None:
         with self.assertRaises(ValueError):
             SlidingWindowRateLimiter(max_events=0, window_seconds=60)
-
-
-if __name__ == "__main__":
-    unittest.main()
-
+        with self.assertRaises(ValueError):
+            SlidingWindowRateLimiter(max_events=1, window_seconds=0)
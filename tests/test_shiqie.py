@@ -8,6 +8,10 @@ from xiuxian_bot.plugins.shiqie import ShiqiePlugin
 from xiuxian_bot.runtime import build_plugins
 
 
+_LOG = logging.getLogger("test")
+_FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def _dummy_config(**overrides) -> Config:
     values = {
         "tg_api_id": "1",
@@ -29,7 +33,7 @@ def _ctx(text: str, *, reply_to_msg_id: int | None = 1001) -> MessageContext:
         reply_to_msg_id=reply_to_msg_id,
         sender_id=999,
         text=text,
-        ts=datetime.now(timezone.utc),
+        ts=_FROZEN_TS,
         is_reply=reply_to_msg_id is not None,
         is_reply_to_me=reply_to_msg_id is not None,
     )
@@ -37,11 +41,11 @@ def _ctx(text: str, *, reply_to_msg_id: int | None = 1001) -> MessageContext:
 
 class TestShiqiePlugin(unittest.IsolatedAsyncioTestCase):
     def test_build_plugins_includes_shiqie(self) -> None:
-        plugins = build_plugins(_dummy_config(), logging.getLogger("test"))
+        plugins = build_plugins(_dummy_config(), _LOG)
         self.assertIn("shiqie", {plugin.name for plugin in plugins})
 
     async def test_bootstrap_schedules_two_loops(self) -> None:
-        plugin = ShiqiePlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = ShiqiePlugin(_dummy_config(), _LOG)
         calls: list[tuple[str, float, object]] = []
 
         class _FakeScheduler:
@@ -58,7 +62,7 @@ class TestShiqiePlugin(unittest.IsolatedAsyncioTestCase):
         )
 
     async def test_loops_send_commands_and_schedule_fallbacks(self) -> None:
-        plugin = ShiqiePlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = ShiqiePlugin(_dummy_config(), _LOG)
         calls: list[tuple[str, float, object]] = []
         sends: list[str] = []
 
@@ -79,7 +83,7 @@ class TestShiqiePlugin(unittest.IsolatedAsyncioTestCase):
         self.assertIn(("shiqie.rumeng.loop", 28800.0), [(key, delay) for key, delay, _ in calls])
 
     async def test_tianji_cooldown_reschedules_only_tianji(self) -> None:
-        plugin = ShiqiePlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = ShiqiePlugin(_dummy_config(), _LOG)
         calls: list[tuple[str, float, object]] = []
 
         class _FakeScheduler:
@@ -97,7 +101,7 @@ class TestShiqiePlugin(unittest.IsolatedAsyncioTestCase):
         self.assertNotIn(("shiqie.rumeng.loop", 38039.0), [(key, delay) for key, delay, _ in calls])
 
     async def test_rumeng_progress_four_triggers_pintu(self) -> None:
-        plugin = ShiqiePlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = ShiqiePlugin(_dummy_config(), _LOG)
         calls: list[tuple[str, float, object]] = []
 
         class _FakeScheduler:
@@ -116,7 +120,7 @@ class TestShiqiePlugin(unittest.IsolatedAsyncioTestCase):
         self.assertIn(("shiqie.rumeng.loop", 28800.0), [(key, delay) for key, delay, _ in calls])
 
     async def test_rumeng_progress_under_four_does_not_trigger_pintu(self) -> None:
-        plugin = ShiqiePlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = ShiqiePlugin(_dummy_config(), _LOG)
         actions = await plugin.on_message(_ctx("入梦寻图完成，当前进度：3/4"))
 
         self.assertIsNone(actions)
@@ -15,6 +15,9 @@ from xiuxian_bot.plugins.yuanying import AutoYuanyingPlugin
 from xiuxian_bot.plugins.zongmen import AutoZongmenPlugin
 
 
+_LOG = logging.getLogger("test")
+
+
 def _dummy_config(**overrides) -> Config:
     values = dict(
         tg_api_id=1,
@@ -124,7 +127,7 @@ class TestStateStoreAndRestore(unittest.IsolatedAsyncioTestCase):
             target_at = datetime.now() + timedelta(minutes=5)
             store.save_state("biguan", {"next_attempt_at": serialize_datetime(target_at)})
 
-            plugin = AutoBiguanPlugin(_dummy_config(enable_biguan=True), logging.getLogger("test"))
+            plugin = AutoBiguanPlugin(_dummy_config(enable_biguan=True), _LOG)
             plugin.set_state_store(store)
             plugin.restore_state()
 
@@ -153,7 +156,7 @@ class TestStateStoreAndRestore(unittest.IsolatedAsyncioTestCase):
                 {"pending_feedback_deadline_at": serialize_datetime(target_at)},
             )
 
-            plugin = AutoBiguanPlugin(_dummy_config(enable_biguan=True), logging.getLogger("test"))
+            plugin = AutoBiguanPlugin(_dummy_config(enable_biguan=True), _LOG)
             plugin.set_state_store(store)
             plugin.restore_state()
 
@@ -187,7 +190,7 @@ class TestStateStoreAndRestore(unittest.IsolatedAsyncioTestCase):
                 },
             )
 
-            plugin = AutoGardenPlugin(_dummy_config(enable_garden=True), logging.getLogger("test"))
+            plugin = AutoGardenPlugin(_dummy_config(enable_garden=True), _LOG)
             plugin.set_state_store(store)
             plugin.restore_state()
 
@@ -222,7 +225,7 @@ class TestStateStoreAndRestore(unittest.IsolatedAsyncioTestCase):
                 },
             )
 
-            plugin = AutoYuanyingPlugin(_dummy_config(enable_yuanying=True), logging.getLogger("test"))
+            plugin = AutoYuanyingPlugin(_dummy_config(enable_yuanying=True), _LOG)
             plugin.set_state_store(store)
             plugin.restore_state()
 
@@ -259,7 +262,7 @@ class TestStateStoreAndRestore(unittest.IsolatedAsyncioTestCase):
                 },
             )
 
-            plugin = AutoYuanyingPlugin(_dummy_config(enable_yuanying=True), logging.getLogger("test"))
+            plugin = AutoYuanyingPlugin(_dummy_config(enable_yuanying=True), _LOG)
             plugin.set_state_store(store)
             plugin.restore_state()
 
@@ -293,7 +296,7 @@ class TestStateStoreAndRestore(unittest.IsolatedAsyncioTestCase):
                     enable_xinggong_guanxing=True,
                     xinggong_qizhen_start_time="00:00",
                 ),
-                logging.getLogger("test"),
+                _LOG,
             )
             plugin.set_state_store(store)
             plugin.restore_state()
@@ -345,7 +348,7 @@ class TestStateStoreAndRestore(unittest.IsolatedAsyncioTestCase):
 
             chuangta = AutoChuangtaPlugin(
                 _dummy_config(enable_chuangta=True, enable_yuanying=True),
-                logging.getLogger("test"),
+                _LOG,
             )
             chuangta.set_state_store(store)
             chuangta.restore_state()
@@ -358,7 +361,7 @@ class TestStateStoreAndRestore(unittest.IsolatedAsyncioTestCase):
                     zongmen_dianmao_time="09:37",
                     zongmen_chuangong_times="09:38,09:40,09:43",
                 ),
-                logging.getLogger("test"),
+                _LOG,
             )
             zongmen.set_state_store(store)
             zongmen.restore_state()
@@ -391,7 +394,7 @@ class TestStateStoreAndRestore(unittest.IsolatedAsyncioTestCase):
 
             plugin = AutoLingxiaogongPlugin(
                 _dummy_config(enable_lingxiaogong=True),
-                logging.getLogger("test"),
+                _LOG,
             )
             plugin.set_state_store(store)
             plugin.restore_state()
@@ -414,7 +417,3 @@ class TestStateStoreAndRestore(unittest.IsolatedAsyncioTestCase):
             self.assertIn("lingxiaogong.climb.loop", keys)
             self.assertIn("lingxiaogong.jiutian.loop", keys)
             store.close()
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -1,4 +1,6 @@
 import logging
+import os
+import tempfile
 import unittest
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -10,11 +12,19 @@ from xiuxian_bot.config import Config, IdentityProfile
 from xiuxian_bot.tg_adapter import TGAdapter, _send_as_options_from_result
 
 
+# TelegramClient creates its session file on construction; keep it out of the working tree.
+_SESSION_DIR = tempfile.TemporaryDirectory()
+
+
+def tearDownModule() -> None:
+    _SESSION_DIR.cleanup()
+
+
 def _dummy_config(*, topic_id: int = 7310786) -> Config:
     return Config(
         tg_api_id=1,
         tg_api_hash="hash",
-        tg_session_name="session",
+        tg_session_name=os.path.join(_SESSION_DIR.name, "session"),
         game_chat_id=-100,
         topic_id=topic_id,
         my_name="Me",
@@ -263,6 +273,35 @@ class TestTGAdapter(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(ctx.is_reply_to_me)
         self.assertTrue(ctx.is_system_reply)
 
+    async def test_build_context_reply_to_own_send_skips_fetch(self) -> None:
+        adapter = TGAdapter(_dummy_config(), logging.getLogger("test.tg_adapter"))
+        adapter._me_id = 1
+        adapter._peer = object()
+        adapter._client = AsyncMock(return_value=SimpleNamespace(id=321))
+        await adapter.send_message(".元婴状态", reply_to_topic=True)
+        adapter._client = AsyncMock(return_value=SimpleNamespace(id=322))
+        await adapter.send_message(".元婴状态", reply_to_topic=True, send_as="@my_channel")
+
+        def _reply_event(reply_to_msg_id: int) -> SimpleNamespace:
+            return SimpleNamespace(
+                raw_text="元婴状态回包",
+                reply_to_msg_id=reply_to_msg_id,
+                is_reply=True,
+                chat_id=-100,
+                sender_id=20002,
+                sender=SimpleNamespace(bot=True),
+                message=SimpleNamespace(id=400, date=None),
+                get_reply_message=AsyncMock(return_value=SimpleNamespace(sender_id=-1009)),
+            )
+
+        own = _reply_event(321)
+        ctx = await adapter.build_context(own)
+        self.assertTrue(ctx.is_reply_to_me)
+        self.assertTrue(ctx.is_system_reply)
+        own.get_reply_message.assert_not_awaited()
 
-if __name__ == "__main__":
-    unittest.main()
+        # Sent as a channel: the replied-to message is not ours, so it is still fetched.
+        channel = _reply_event(322)
+        ctx = await adapter.build_context(channel)
+        self.assertFalse(ctx.is_reply_to_me)
+        channel.get_reply_message.assert_awaited_once()
@@ -8,6 +8,10 @@ from xiuxian_bot.plugins.wild_explore import WildExplorePlugin
 from xiuxian_bot.runtime import build_plugins
 
 
+_LOG = logging.getLogger("test")
+_FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def _dummy_config(**overrides) -> Config:
     values = {
         "tg_api_id": "1",
@@ -29,7 +33,7 @@ def _ctx(text: str) -> MessageContext:
         reply_to_msg_id=1001,
         sender_id=999,
         text=text,
-        ts=datetime.now(timezone.utc),
+        ts=_FROZEN_TS,
         is_reply=True,
         is_reply_to_me=True,
     )
@@ -37,11 +41,11 @@ def _ctx(text: str) -> MessageContext:
 
 class TestWildExplorePlugin(unittest.IsolatedAsyncioTestCase):
     def test_build_plugins_includes_wild_explore(self) -> None:
-        plugins = build_plugins(_dummy_config(), logging.getLogger("test"))
+        plugins = build_plugins(_dummy_config(), _LOG)
         self.assertIn("wild_explore", {plugin.name for plugin in plugins})
 
     async def test_bootstrap_schedules_initial_loop(self) -> None:
-        plugin = WildExplorePlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = WildExplorePlugin(_dummy_config(), _LOG)
         calls: list[tuple[str, float]] = []
 
         class _FakeScheduler:
@@ -61,7 +65,7 @@ class TestWildExplorePlugin(unittest.IsolatedAsyncioTestCase):
                 wild_explore_strategy="谨慎",
                 wild_explore_repeat_delay_seconds="7",
             ),
-            logging.getLogger("test"),
+            _LOG,
         )
         calls: list[tuple[str, float, object]] = []
         sends: list[str] = []
@@ -83,7 +87,7 @@ class TestWildExplorePlugin(unittest.IsolatedAsyncioTestCase):
     async def test_zero_repeat_delay_still_sends_once_without_repeat_schedule(self) -> None:
         plugin = WildExplorePlugin(
             _dummy_config(wild_explore_repeat_delay_seconds="0"),
-            logging.getLogger("test"),
+            _LOG,
         )
         calls: list[tuple[str, float, object]] = []
         sends: list[str] = []
@@ -102,7 +106,7 @@ class TestWildExplorePlugin(unittest.IsolatedAsyncioTestCase):
         self.assertNotIn("wild_explore.repeat", {key for key, _, _ in calls})
 
     async def test_cooldown_feedback_reschedules_after_remaining_time(self) -> None:
-        plugin = WildExplorePlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = WildExplorePlugin(_dummy_config(), _LOG)
         calls: list[tuple[str, float, object]] = []
 
         class _FakeScheduler:
@@ -122,7 +126,7 @@ class TestWildExplorePlugin(unittest.IsolatedAsyncioTestCase):
     async def test_normal_feedback_reschedules_after_interval(self) -> None:
         plugin = WildExplorePlugin(
             _dummy_config(wild_explore_interval_seconds="7200"),
-            logging.getLogger("test"),
+            _LOG,
         )
         calls: list[tuple[str, float, object]] = []
 
@@ -1,102 +1,58 @@
 import logging
 import unittest
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 
 from xiuxian_bot.config import Config, IdentityProfile
-from xiuxian_bot.core.contracts import MessageContext
 from xiuxian_bot.domain.text_normalizer import normalize_match_text
 from xiuxian_bot.domain.xinggong import parse_xinggong_observatory
 from xiuxian_bot.plugins.xinggong import AutoXinggongPlugin
 
+from ._config import make_config, make_ctx
 
-def _dummy_config(
-    *,
-    my_name: str = "Me",
-    enable_xinggong: bool = True,
-    enable_xinggong_wenan: bool = True,
-    enable_xinggong_deep_biguan: bool = False,
-    enable_xinggong_guanxing: bool = False,
-    xinggong_wenan_interval_seconds: int = 43200,
-    xinggong_qizhen_start_time: str = "07:00",
-    xinggong_guanxing_target_username: str = "salt9527",
-    xinggong_guanxing_preview_advance_seconds: int = 180,
-    xinggong_guanxing_shift_advance_seconds: float = 1.0,
-    xinggong_guanxing_watch_events: str = "星辰异象,地磁暴动",
-    identity_profiles: tuple[IdentityProfile, ...] | None = None,
-    active_identity_key: str = "main",
-) -> Config:
-    return Config(
-        tg_api_id=1,
-        tg_api_hash="hash",
-        tg_session_name="session",
-        game_chat_id=-100,
-        topic_id=123,
-        my_name=my_name,
-        send_to_topic=True,
-        action_cmd_biguan=".闭关修炼",
-        dry_run=False,
-        log_level="INFO",
-        global_sends_per_minute=999,
-        plugin_sends_per_minute=999,
-        enable_biguan=False,
-        enable_daily=False,
-        enable_garden=False,
-        enable_xinggong=enable_xinggong,
-        enable_yuanying=False,
-        enable_zongmen=False,
-        biguan_extra_buffer_seconds=60,
-        biguan_cooldown_jitter_min_seconds=5,
-        biguan_cooldown_jitter_max_seconds=15,
-        biguan_retry_jitter_min_seconds=3,
-        biguan_retry_jitter_max_seconds=8,
-        garden_seed_name="清灵草种子",
-        garden_poll_interval_seconds=3600,
-        garden_action_spacing_seconds=25,
-        xinggong_star_name="庚金星",
-        xinggong_poll_interval_seconds=3600,
-        xinggong_action_spacing_seconds=25,
-        xinggong_qizhen_start_time=xinggong_qizhen_start_time,
-        xinggong_qizhen_retry_interval_seconds=120,
-        xinggong_qizhen_second_offset_seconds=43500,
-        xinggong_wenan_interval_seconds=xinggong_wenan_interval_seconds,
-        yuanying_liefeng_interval_seconds=43200,
-        yuanying_chuqiao_interval_seconds=28800,
-        zongmen_cmd_dianmao=".宗门点卯",
-        zongmen_cmd_chuangong=".宗门传功",
-        zongmen_dianmao_time=None,
-        zongmen_chuangong_times=None,
-        zongmen_chuangong_xinde_text="今日修行心得：稳中求进。",
-        zongmen_catch_up=True,
-        zongmen_action_spacing_seconds=20,
-        enable_xinggong_wenan=enable_xinggong_wenan,
-        enable_xinggong_deep_biguan=enable_xinggong_deep_biguan,
-        enable_xinggong_guanxing=enable_xinggong_guanxing,
-        xinggong_guanxing_target_username=xinggong_guanxing_target_username,
-        xinggong_guanxing_preview_advance_seconds=xinggong_guanxing_preview_advance_seconds,
-        xinggong_guanxing_shift_advance_seconds=xinggong_guanxing_shift_advance_seconds,
-        xinggong_guanxing_watch_events=xinggong_guanxing_watch_events,
-        account_id="default",
-        account_name="default",
-        identity_profiles=identity_profiles
-        or (
-            IdentityProfile(
-                key="main",
-                kind="main",
-                my_name=my_name,
-                switch_target="主魂",
-                display_name="主魂",
-            ),
-        ),
-        active_identity_key=active_identity_key,
-        switch_command_template=".切换 {target}",
-        switch_list_command=".切换",
-        switch_back_target="主魂",
-        switch_success_keywords="切换成功,神念已附着",
-        switch_back_success_keywords="神念重归主魂肉身",
-        switch_failure_keywords="未找到道号或ID",
-        status_command=".状态",
-        status_identity_header_keyword="修士状态",
-    )
+
+_LOG = logging.getLogger("test")
+
+
+def _dummy_config(**overrides) -> Config:
+    overrides.setdefault("enable_xinggong", True)
+    return make_config(**overrides)
+
+
+class _FakeScheduler:
+    """Records ``(key, delay_seconds)`` for every schedule call without running the action."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, float]] = []
+
+    async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
+        self.calls.append((key, delay_seconds))
+
+
+class _FakeSend:
+    """Records every send and answers with a fixed message id."""
+
+    def __init__(self, message_id: int | None = None) -> None:
+        self.message_id = message_id
+        self.calls: list[tuple[str, str, bool, int | None]] = []
+        self.texts: list[str] = []
+
+    async def __call__(
+        self,
+        plugin: str,
+        text: str,
+        reply_to_topic: bool,
+        *,
+        reply_to_msg_id: int | None = None,
+    ) -> int | None:
+        self.calls.append((plugin, text, reply_to_topic, reply_to_msg_id))
+        self.texts.append(text)
+        return self.message_id
+
+
+def _prime_qizhen_slot(plugin: AutoXinggongPlugin, now: datetime, *, slot: int = 1) -> None:
+    """Mimic the scheduled loop: the cycle is initialized and ``slot`` awaits its invite."""
+    setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
+    setattr(plugin, "_qizhen_pending_slot", slot)
 
 
 class TestXinggongParser(unittest.TestCase):
@@ -117,8 +73,8 @@ class TestXinggongParser(unittest.TestCase):
         status = parse_xinggong_observatory(text)
         assert status is not None
         self.assertEqual(status.total_disks, 3)
-        self.assertEqual(status.idle_disks, [1, 2, 3])
-        self.assertEqual(status.abnormal_disks, [])
+        self.assertEqual(status.idle_disks, (1, 2, 3))
+        self.assertEqual(status.abnormal_disks, ())
         self.assertIsNone(status.min_remaining_seconds)
 
     def test_parse_observatory_remaining_and_abnormal(self) -> None:
@@ -136,24 +92,74 @@ class TestXinggongParser(unittest.TestCase):
         status = parse_xinggong_observatory(text)
         assert status is not None
         self.assertEqual(status.total_disks, 8)
-        self.assertEqual(status.abnormal_disks, [5, 7])
+        self.assertEqual(status.abnormal_disks, (5, 7))
         self.assertEqual(status.min_remaining_seconds, 20336)
 
+    def test_parse_observatory_collectable(self) -> None:
+        text = """【星宫 · 观星台】 (引星盘总数: 3座)
+1号引星盘: 天雷星-已凝聚完成
+2号引星盘: 天雷星-精华可收集，星光紊乱
+3号引星盘: 天雷星-凝聚中 (剩余: 1分钟)
+"""
+        status = parse_xinggong_observatory(text)
+        assert status is not None
+        self.assertEqual(status.collectable_disks, (1,))
+        self.assertEqual(status.abnormal_disks, (2,))
+        self.assertEqual(status.min_remaining_seconds, 60)
+
+    def test_parse_observatory_memoizes_repeated_replies(self) -> None:
+        text = "【星宫 · 观星台】 (引星盘总数: 1座)\n1号引星盘: 空闲\n"
+        status = parse_xinggong_observatory(text)
+        self.assertIs(parse_xinggong_observatory(text), status)
+        # Cache hits share the result, so it must not be mutable.
+        assert status is not None
+        self.assertIsInstance(status.idle_disks, tuple)
+        self.assertIsNone(parse_xinggong_observatory("1号引星盘: 空闲"))
 
-class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
-    async def test_bootstrap_schedules_wenan_loop(self) -> None:
-        plugin = AutoXinggongPlugin(_dummy_config(), logging.getLogger("test"))
 
-        calls: list[tuple[str, float]] = []
+class TestXinggongSendBlock(unittest.TestCase):
+    def test_send_block_delay_seconds_only_blocks_noncritical_in_claim_window(self) -> None:
+        plugin = AutoXinggongPlugin(
+            _dummy_config(enable_xinggong_guanxing=True, xinggong_guanxing_shift_advance_seconds=1.0),
+            _LOG,
+        )
+        settlement_at = datetime.now() + timedelta(seconds=5)
+        plugin._guanxing_claim_active = True  # type: ignore[attr-defined]
+        plugin._guanxing_settlement_at = settlement_at  # type: ignore[attr-defined]
 
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                calls.append((key, delay_seconds))
+        blocked = plugin.send_block_delay_seconds("garden", ".小药园", now=datetime.now())
+        allowed = plugin.send_block_delay_seconds("xinggong", ".改换星移 @salt9527", now=datetime.now())
 
-        async def _send(_plugin: str, _text: str, _reply_to_topic: bool) -> int | None:
-            return None
+        self.assertGreater(blocked, 0.0)
+        self.assertEqual(allowed, 0.0)
 
-        await plugin.bootstrap(_FakeScheduler(), _send)
+    def test_send_block_delay_seconds_extends_into_negative_shift_window(self) -> None:
+        plugin = AutoXinggongPlugin(
+            _dummy_config(enable_xinggong_guanxing=True, xinggong_guanxing_shift_advance_seconds=-0.5),
+            _LOG,
+        )
+        now = datetime.now()
+        plugin._guanxing_claim_active = True  # type: ignore[attr-defined]
+        plugin._guanxing_settlement_at = now  # type: ignore[attr-defined]
+
+        blocked = plugin.send_block_delay_seconds(
+            "garden",
+            ".小药园",
+            now=now + timedelta(seconds=0.2),
+        )
+
+        self.assertGreater(blocked, 1.0)
+
+
+class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
+    async def test_bootstrap_schedules_wenan_loop(self) -> None:
+        plugin = AutoXinggongPlugin(_dummy_config(), _LOG)
+
+        scheduler = _FakeScheduler()
+        calls = scheduler.calls
+        send = _FakeSend()
+
+        await plugin.bootstrap(scheduler, send)
         keys = {k for k, _ in calls}
         delays = dict(calls)
         self.assertIn("xinggong.qizhen.loop", keys)
@@ -163,19 +169,14 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_bootstrap_skips_wenan_loop_when_disabled(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_wenan=False),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        calls: list[tuple[str, float]] = []
+        scheduler = _FakeScheduler()
+        calls = scheduler.calls
+        send = _FakeSend()
 
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                calls.append((key, delay_seconds))
-
-        async def _send(_plugin: str, _text: str, _reply_to_topic: bool) -> int | None:
-            return None
-
-        await plugin.bootstrap(_FakeScheduler(), _send)
+        await plugin.bootstrap(scheduler, send)
         keys = {k for k, _ in calls}
         self.assertIn("xinggong.qizhen.loop", keys)
         self.assertNotIn("xinggong.wenan.loop", keys)
@@ -183,53 +184,36 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_wenan_loop_uses_configured_interval(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(xinggong_wenan_interval_seconds=777),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        calls: list[tuple[str, float]] = []
-
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                calls.append((key, delay_seconds))
+        scheduler = _FakeScheduler()
+        calls = scheduler.calls
+        send = _FakeSend()
 
-        async def _send(_plugin: str, _text: str, _reply_to_topic: bool) -> int | None:
-            return None
-
-        plugin._scheduler = _FakeScheduler()  # type: ignore[attr-defined]
-        plugin._send = _send  # type: ignore[attr-defined]
+        plugin._scheduler = scheduler  # type: ignore[attr-defined]
+        plugin._send = send  # type: ignore[attr-defined]
         await plugin._wenan_loop()  # type: ignore[attr-defined]
         self.assertIn(("xinggong.wenan.loop", 777.0), calls)
 
     async def test_high_value_preview_schedules_preview_and_shift(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_guanxing=True),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        scheduled: list[tuple[str, float]] = []
-        sends: list[tuple[str, str, bool, int | None]] = []
-
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                scheduled.append((key, delay_seconds))
+        scheduler = _FakeScheduler()
+        scheduled = scheduler.calls
+        send = _FakeSend(7001)
+        sends = send.calls
 
-        async def _send(_plugin: str, text: str, reply_to_topic: bool, *, reply_to_msg_id=None):
-            sends.append((_plugin, text, reply_to_topic, reply_to_msg_id))
-            return 7001
-
-        plugin._scheduler = _FakeScheduler()  # type: ignore[attr-defined]
-        plugin._send = _send  # type: ignore[attr-defined]
+        plugin._scheduler = scheduler  # type: ignore[attr-defined]
+        plugin._send = send  # type: ignore[attr-defined]
         plugin._should_ignore_external_guanxing_preview = lambda _now: False  # type: ignore[attr-defined]
 
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "【星盘显化】@intoso 闭目凝神，推演天机...星盘之上，天机已然显现！\n下一次天道演化将是：【Good·星辰异象】\n当前天命所归：@mutourenazz",
             message_id=1001,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="【星盘显化】@intoso 闭目凝神，推演天机...星盘之上，天机已然显现！\n下一次天道演化将是：【Good·星辰异象】\n当前天命所归：@mutourenazz",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
         )
         actions = await plugin.on_message(ctx)
 
@@ -244,16 +228,13 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_guanxing_preview_loop_sends_command(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_guanxing=True),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        sends: list[tuple[str, str, bool, int | None]] = []
-
-        async def _send(_plugin: str, text: str, reply_to_topic: bool, *, reply_to_msg_id=None):
-            sends.append((_plugin, text, reply_to_topic, reply_to_msg_id))
-            return 7001
+        send = _FakeSend(7001)
+        sends = send.calls
 
-        plugin._send = _send  # type: ignore[attr-defined]
+        plugin._send = send  # type: ignore[attr-defined]
         plugin._guanxing_claim_active = True  # type: ignore[attr-defined]
         plugin._guanxing_settlement_at = datetime.now() + timedelta(minutes=3)  # type: ignore[attr-defined]
 
@@ -266,20 +247,17 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_personal_preview_reply_becomes_shift_reply_target(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_guanxing=True),
-            logging.getLogger("test"),
+            _LOG,
         )
         now = datetime.now()
         plugin._guanxing_settlement_at = now + timedelta(minutes=1)  # type: ignore[attr-defined]
         plugin._guanxing_claim_active = True  # type: ignore[attr-defined]
         plugin._guanxing_own_command_msg_id = 8001  # type: ignore[attr-defined]
 
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "【星盘显化】@Me 闭目凝神，推演天机...星盘之上，天机已然显现！\n下一次天道演化将是：【Good·星辰异象】\n当前天命所归：@someone",
             message_id=8002,
             reply_to_msg_id=8001,
-            sender_id=999,
-            text="【星盘显化】@Me 闭目凝神，推演天机...星盘之上，天机已然显现！\n下一次天道演化将是：【Good·星辰异象】\n当前天命所归：@someone",
-            ts=datetime.now(timezone.utc),
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -291,20 +269,17 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_personal_preview_reply_ocr_variant_still_becomes_shift_reply_target(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_guanxing=True),
-            logging.getLogger("test"),
+            _LOG,
         )
         now = datetime.now()
         plugin._guanxing_settlement_at = now + timedelta(minutes=1)  # type: ignore[attr-defined]
         plugin._guanxing_claim_active = True  # type: ignore[attr-defined]
         plugin._guanxing_own_command_msg_id = 8011  # type: ignore[attr-defined]
 
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "星 盘 显 化\n@Me 闭目凝神，推演天机...\n下一次 天道演化 将是： 【Ｇood - 星辰 异象】\n当前 天命所归：@someone",
             message_id=8012,
             reply_to_msg_id=8011,
-            sender_id=999,
-            text="星 盘 显 化\n@Me 闭目凝神，推演天机...\n下一次 天道演化 将是： 【Ｇood - 星辰 异象】\n当前 天命所归：@someone",
-            ts=datetime.now(timezone.utc),
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -316,16 +291,13 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_shift_send_replies_to_personal_preview_message(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_guanxing=True),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        sends: list[tuple[str, str, bool, int | None]] = []
-
-        async def _send(_plugin: str, text: str, reply_to_topic: bool, *, reply_to_msg_id=None):
-            sends.append((_plugin, text, reply_to_topic, reply_to_msg_id))
-            return 9001
+        send = _FakeSend(9001)
+        sends = send.calls
 
-        plugin._send = _send  # type: ignore[attr-defined]
+        plugin._send = send  # type: ignore[attr-defined]
         plugin._guanxing_claim_active = True  # type: ignore[attr-defined]
         plugin._guanxing_settlement_at = datetime.now() + timedelta(seconds=1)  # type: ignore[attr-defined]
         plugin._guanxing_own_preview_msg_id = 9000  # type: ignore[attr-defined]
@@ -343,32 +315,21 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
                 xinggong_guanxing_preview_advance_seconds=1,
                 xinggong_guanxing_shift_advance_seconds=0.25,
             ),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        scheduled: list[tuple[str, float]] = []
-
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                scheduled.append((key, delay_seconds))
-
-        async def _send(_plugin: str, text: str, reply_to_topic: bool, *, reply_to_msg_id=None):
-            return 7001
+        scheduler = _FakeScheduler()
+        scheduled = scheduler.calls
+        send = _FakeSend(7001)
 
-        plugin._scheduler = _FakeScheduler()  # type: ignore[attr-defined]
-        plugin._send = _send  # type: ignore[attr-defined]
+        plugin._scheduler = scheduler  # type: ignore[attr-defined]
+        plugin._send = send  # type: ignore[attr-defined]
         plugin._should_ignore_external_guanxing_preview = lambda _now: False  # type: ignore[attr-defined]
         plugin._next_guanxing_settlement_at = lambda now: now + timedelta(seconds=10)  # type: ignore[attr-defined]
 
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "【星盘显化】@intoso 闭目凝神，推演天机...星盘之上，天机已然显现！\n下一次天道演化将是：【Good·星辰异象】\n当前天命所归：@mutourenazz",
             message_id=1002,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="【星盘显化】@intoso 闭目凝神，推演天机...星盘之上，天机已然显现！\n下一次天道演化将是：【Good·星辰异象】\n当前天命所归：@mutourenazz",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
         )
         actions = await plugin.on_message(ctx)
 
@@ -384,32 +345,21 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
                 xinggong_guanxing_preview_advance_seconds=1,
                 xinggong_guanxing_shift_advance_seconds=-0.25,
             ),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        scheduled: list[tuple[str, float]] = []
+        scheduler = _FakeScheduler()
+        scheduled = scheduler.calls
+        send = _FakeSend(7001)
 
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                scheduled.append((key, delay_seconds))
-
-        async def _send(_plugin: str, text: str, reply_to_topic: bool, *, reply_to_msg_id=None):
-            return 7001
-
-        plugin._scheduler = _FakeScheduler()  # type: ignore[attr-defined]
-        plugin._send = _send  # type: ignore[attr-defined]
+        plugin._scheduler = scheduler  # type: ignore[attr-defined]
+        plugin._send = send  # type: ignore[attr-defined]
         plugin._should_ignore_external_guanxing_preview = lambda _now: False  # type: ignore[attr-defined]
         plugin._next_guanxing_settlement_at = lambda now: now + timedelta(seconds=10)  # type: ignore[attr-defined]
 
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "【星盘显化】@intoso 闭目凝神，推演天机...星盘之上，天机已然显现！\n下一次天道演化将是：【Good·星辰异象】\n当前天命所归：@mutourenazz",
             message_id=1003,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="【星盘显化】@intoso 闭目凝神，推演天机...星盘之上，天机已然显现！\n下一次天道演化将是：【Good·星辰异象】\n当前天命所归：@mutourenazz",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
         )
         actions = await plugin.on_message(ctx)
 
@@ -418,51 +368,16 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertAlmostEqual(delay_by_key["xinggong.guanxing.preview"], 9.0, places=2)
         self.assertAlmostEqual(delay_by_key["xinggong.guanxing.shift"], 10.25, places=2)
 
-    def test_send_block_delay_seconds_only_blocks_noncritical_in_claim_window(self) -> None:
-        plugin = AutoXinggongPlugin(
-            _dummy_config(enable_xinggong_guanxing=True, xinggong_guanxing_shift_advance_seconds=1.0),
-            logging.getLogger("test"),
-        )
-        settlement_at = datetime.now() + timedelta(seconds=5)
-        plugin._guanxing_claim_active = True  # type: ignore[attr-defined]
-        plugin._guanxing_settlement_at = settlement_at  # type: ignore[attr-defined]
-
-        blocked = plugin.send_block_delay_seconds("garden", ".小药园", now=datetime.now())
-        allowed = plugin.send_block_delay_seconds("xinggong", ".改换星移 @salt9527", now=datetime.now())
-
-        self.assertGreater(blocked, 0.0)
-        self.assertEqual(allowed, 0.0)
-
-    def test_send_block_delay_seconds_extends_into_negative_shift_window(self) -> None:
-        plugin = AutoXinggongPlugin(
-            _dummy_config(enable_xinggong_guanxing=True, xinggong_guanxing_shift_advance_seconds=-0.5),
-            logging.getLogger("test"),
-        )
-        now = datetime.now()
-        plugin._guanxing_claim_active = True  # type: ignore[attr-defined]
-        plugin._guanxing_settlement_at = now  # type: ignore[attr-defined]
-
-        blocked = plugin.send_block_delay_seconds(
-            "garden",
-            ".小药园",
-            now=now + timedelta(seconds=0.2),
-        )
-
-        self.assertGreater(blocked, 1.0)
-
     async def test_shift_send_allows_negative_offset_after_settlement(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_guanxing=True, xinggong_guanxing_shift_advance_seconds=-0.5),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        sends: list[tuple[str, str, bool, int | None]] = []
+        send = _FakeSend(9002)
+        sends = send.calls
 
-        async def _send(_plugin: str, text: str, reply_to_topic: bool, *, reply_to_msg_id=None):
-            sends.append((_plugin, text, reply_to_topic, reply_to_msg_id))
-            return 9002
-
-        plugin._send = _send  # type: ignore[attr-defined]
+        plugin._send = send  # type: ignore[attr-defined]
         plugin._guanxing_claim_active = True  # type: ignore[attr-defined]
         plugin._guanxing_settlement_at = datetime.now() - timedelta(seconds=0.6)  # type: ignore[attr-defined]
         plugin._guanxing_own_preview_msg_id = 9000  # type: ignore[attr-defined]
@@ -477,19 +392,16 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_guanxing_failure_cancels_claim_window(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_guanxing=True),
-            logging.getLogger("test"),
+            _LOG,
         )
         plugin._guanxing_claim_active = True  # type: ignore[attr-defined]
         plugin._guanxing_settlement_at = datetime.now() + timedelta(minutes=1)  # type: ignore[attr-defined]
         plugin._guanxing_own_command_msg_id = 9100  # type: ignore[attr-defined]
 
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "你今日已观星一次，天机不可多泄，请明日再来",
             message_id=9101,
             reply_to_msg_id=9100,
-            sender_id=999,
-            text="你今日已观星一次，天机不可多泄，请明日再来",
-            ts=datetime.now(timezone.utc),
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -501,31 +413,20 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_external_anomaly_message_registers_claim_with_ocr_variants(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_guanxing=True),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        scheduled: list[tuple[str, float]] = []
-
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                scheduled.append((key, delay_seconds))
+        scheduler = _FakeScheduler()
+        scheduled = scheduler.calls
+        send = _FakeSend(7001)
 
-        async def _send(_plugin: str, text: str, reply_to_topic: bool, *, reply_to_msg_id=None):
-            return 7001
-
-        plugin._scheduler = _FakeScheduler()  # type: ignore[attr-defined]
-        plugin._send = _send  # type: ignore[attr-defined]
+        plugin._scheduler = scheduler  # type: ignore[attr-defined]
+        plugin._send = send  # type: ignore[attr-defined]
         plugin._should_ignore_external_guanxing_preview = lambda _now: False  # type: ignore[attr-defined]
 
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "【 天机异动 】 星盘光芒大作！【星宫】弟子 @foo 强行施展【改换星移】之术，竟成功扭转了天机！ 原本将降临于 @bar 身上的【Ｇood - 星辰 异象】，现已改道，将由 @baz 承受！",
             message_id=9150,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="【 天机异动 】 星盘光芒大作！【星宫】弟子 @foo 强行施展【改换星移】之术，竟成功扭转了天机！ 原本将降临于 @bar 身上的【Ｇood - 星辰 异象】，现已改道，将由 @baz 承受！",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
         )
         actions = await plugin.on_message(ctx)
 
@@ -539,20 +440,14 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_external_preview_in_new_window_grace_period_is_ignored(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_guanxing=True),
-            logging.getLogger("test"),
+            _LOG,
         )
 
         plugin._next_guanxing_settlement_at = lambda now: now + timedelta(hours=3)  # type: ignore[attr-defined]
 
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "【星盘显化】@other 闭目凝神，推演天机...星盘之上，天机已然显现！\n下一次天道演化将是：【Good·星辰异象】\n当前天命所归：@someone",
             message_id=9201,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="【星盘显化】@other 闭目凝神，推演天机...星盘之上，天机已然显现！\n下一次天道演化将是：【Good·星辰异象】\n当前天命所归：@someone",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
         )
         actions = await plugin.on_message(ctx)
 
@@ -560,23 +455,14 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(getattr(plugin, "_guanxing_claim_active"))
 
     async def test_status_sows_when_idle(self) -> None:
-        plugin = AutoXinggongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoXinggongPlugin(_dummy_config(), _LOG)
 
         text = """【星宫 · 观星台】 (引星盘总数: 3座)
 1号引星盘: 空闲
 2号引星盘: 空闲
 3号引星盘: 空闲
 """
-        ctx = MessageContext(
-            chat_id=-100,
-            message_id=1,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text=text,
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        ctx = make_ctx(text)
         actions = await plugin.on_message(ctx)
         assert actions is not None
 
@@ -587,56 +473,27 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual([a.delay_seconds for a in actions[1:]], [0.0])
 
     async def test_status_abnormal_triggers_soothe(self) -> None:
-        plugin = AutoXinggongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoXinggongPlugin(_dummy_config(), _LOG)
 
         text = """【星宫·观星台】 (引星盘总数: 2座)
 1号引星盘: 庚金星－元磁紊乱
 2号引星盘: 空闲
 """
-        ctx = MessageContext(
-            chat_id=-100,
-            message_id=2,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text=text,
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        ctx = make_ctx(text, message_id=2)
         actions = await plugin.on_message(ctx)
         assert actions is not None
         self.assertEqual(actions[1].text, ".安抚星辰")
 
     async def test_qizhen_success_via_invite_edit(self) -> None:
-        plugin = AutoXinggongPlugin(_dummy_config(), logging.getLogger("test"))
-        # Mimic the runtime: cycle is already initialized by the scheduled loop before messages arrive.
+        plugin = AutoXinggongPlugin(_dummy_config(), _LOG)
         now = datetime.now()
-        setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
-        setattr(plugin, "_qizhen_pending_slot", 1)
-
-        invite = MessageContext(
-            chat_id=-100,
-            message_id=10,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="【周天星斗大阵-启】\n【星宫】弟子 @Me 正在布设大阵，尚需1 位同门相助!",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        _prime_qizhen_slot(plugin, now)
+
+        invite = make_ctx("【周天星斗大阵-启】\n【星宫】弟子 @Me 正在布设大阵，尚需1 位同门相助!", message_id=10)
         await plugin.on_message(invite)
         self.assertEqual(getattr(plugin, "_qizhen_last_invite_msg_id"), 10)
 
-        success = MessageContext(
-            chat_id=-100,
-            message_id=10,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="【周天星斗大阵-成】星光汇聚，大阵已成!",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        success = make_ctx("【周天星斗大阵-成】星光汇聚，大阵已成!", message_id=10)
         await plugin.on_message(success)
         self.assertIsNotNone(getattr(plugin, "_qizhen_first_success_at"))
 
@@ -661,21 +518,11 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
                 ),
             ),
         )
-        plugin = AutoXinggongPlugin(base_config.apply_identity("avatar"), logging.getLogger("test"))
+        plugin = AutoXinggongPlugin(base_config.apply_identity("avatar"), _LOG)
         now = datetime.now()
-        setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
-        setattr(plugin, "_qizhen_pending_slot", 1)
-
-        invite = MessageContext(
-            chat_id=-100,
-            message_id=31,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="【周天星斗大阵-启】\n【星宫】弟子 锐锋子 正在布设大阵，尚需1 位同门相助!",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        _prime_qizhen_slot(plugin, now)
+
+        invite = make_ctx("【周天星斗大阵-启】\n【星宫】弟子 锐锋子 正在布设大阵，尚需1 位同门相助!", message_id=31)
         actions = await plugin.on_message(invite)
 
         self.assertIsNone(actions)
@@ -703,18 +550,9 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
                 ),
             ),
         )
-        plugin = AutoXinggongPlugin(config, logging.getLogger("test"))
-
-        invite = MessageContext(
-            chat_id=-100,
-            message_id=32,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="【周天星斗大阵-启】\n【星宫】弟子 7467781636 正在布设大阵，尚需1 位同门相助!",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        plugin = AutoXinggongPlugin(config, _LOG)
+
+        invite = make_ctx("【周天星斗大阵-启】\n【星宫】弟子 7467781636 正在布设大阵，尚需1 位同门相助!", message_id=32)
         actions = await plugin.on_message(invite)
 
         assert actions is not None
@@ -742,21 +580,11 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
                 ),
             ),
         )
-        plugin = AutoXinggongPlugin(base_config.apply_identity("channel"), logging.getLogger("test"))
+        plugin = AutoXinggongPlugin(base_config.apply_identity("channel"), _LOG)
         now = datetime.now()
-        setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
-        setattr(plugin, "_qizhen_pending_slot", 1)
-
-        invite = MessageContext(
-            chat_id=-100,
-            message_id=34,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="【周天星斗大阵-启】\n【星宫】弟子 @xinggong_channel 正在布设大阵，尚需1 位同门相助!",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        _prime_qizhen_slot(plugin, now)
+
+        invite = make_ctx("【周天星斗大阵-启】\n【星宫】弟子 @xinggong_channel 正在布设大阵，尚需1 位同门相助!", message_id=34)
         actions = await plugin.on_message(invite)
 
         self.assertIsNone(actions)
@@ -764,18 +592,9 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(getattr(plugin, "_qizhen_last_invite_slot"), 1)
 
     async def test_qizhen_invite_from_other_player_still_triggers_assist(self) -> None:
-        plugin = AutoXinggongPlugin(_dummy_config(), logging.getLogger("test"))
-
-        invite = MessageContext(
-            chat_id=-100,
-            message_id=33,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="【周天星斗大阵-启】\n【星宫】弟子 @Other 正在布设大阵，尚需1 位同门相助!",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        plugin = AutoXinggongPlugin(_dummy_config(), _LOG)
+
+        invite = make_ctx("【周天星斗大阵-启】\n【星宫】弟子 @Other 正在布设大阵，尚需1 位同门相助!", message_id=33)
         actions = await plugin.on_message(invite)
 
         assert actions is not None
@@ -802,36 +621,23 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
                 ),
             ),
         )
-        plugin = AutoXinggongPlugin(base_config.apply_identity("avatar"), logging.getLogger("test"))
+        plugin = AutoXinggongPlugin(base_config.apply_identity("avatar"), _LOG)
         now = datetime.now()
-        setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
-        setattr(plugin, "_qizhen_pending_slot", 1)
-
-        success = MessageContext(
-            chat_id=-100,
-            message_id=34,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="【周天星斗大阵-成】锐锋子 星光汇聚，大阵已成!",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        _prime_qizhen_slot(plugin, now)
+
+        success = make_ctx("【周天星斗大阵-成】锐锋子 星光汇聚，大阵已成!", message_id=34)
         await plugin.on_message(success)
 
         self.assertIsNotNone(getattr(plugin, "_qizhen_first_success_at"))
 
     async def test_qizhen_cooldown_reply_updates_blocked_until(self) -> None:
-        plugin = AutoXinggongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoXinggongPlugin(_dummy_config(), _LOG)
 
         start = datetime.now()
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "你刚刚参与过布阵，心神消耗巨大，请在1小时2分钟3秒后再次启阵。",
             message_id=20,
             reply_to_msg_id=19,
-            sender_id=999,
-            text="你刚刚参与过布阵，心神消耗巨大，请在1小时2分钟3秒后再次启阵。",
-            ts=datetime.now(timezone.utc),
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -864,25 +670,21 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
                 ),
             ),
         )
-        main_plugin = AutoXinggongPlugin(base_config.apply_identity("main"), logging.getLogger("test"))
+        main_plugin = AutoXinggongPlugin(base_config.apply_identity("main"), _LOG)
         channel_plugin = AutoXinggongPlugin(
             base_config.apply_identity("channel"),
-            logging.getLogger("test"),
+            _LOG,
         )
         now = datetime.now()
         setattr(channel_plugin, "_cycle_date", channel_plugin._cycle_date_for(now))  # type: ignore[attr-defined]
         setattr(channel_plugin, "_qizhen_pending_slot", 1)
         setattr(channel_plugin, "_qizhen_last_sent_at", now - timedelta(seconds=5))
 
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "你刚刚参与过布阵，心神消耗巨大，请在 6小时38分钟6秒 后再次启阵。",
             message_id=24,
             reply_to_msg_id=9001,
-            sender_id=999,
-            text="你刚刚参与过布阵，心神消耗巨大，请在 6小时38分钟6秒 后再次启阵。",
-            ts=datetime.now(timezone.utc),
             is_reply=True,
-            is_reply_to_me=False,
         )
         await channel_plugin.on_message(ctx)
 
@@ -894,30 +696,17 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertLess(delta, 23910)
 
     async def test_qizhen_existing_invite_reply_waits_210_seconds(self) -> None:
-        plugin = AutoXinggongPlugin(_dummy_config(), logging.getLogger("test"))
-
-        calls: list[tuple[str, float]] = []
+        plugin = AutoXinggongPlugin(_dummy_config(), _LOG)
 
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                calls.append((key, delay_seconds))
+        scheduler = _FakeScheduler()
+        calls = scheduler.calls
 
-        plugin._scheduler = _FakeScheduler()  # type: ignore[attr-defined]
+        plugin._scheduler = scheduler  # type: ignore[attr-defined]
         now = datetime.now()
-        setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
-        setattr(plugin, "_qizhen_pending_slot", 1)
+        _prime_qizhen_slot(plugin, now)
         setattr(plugin, "_qizhen_last_sent_at", now - timedelta(seconds=180))
 
-        ctx = MessageContext(
-            chat_id=-100,
-            message_id=21,
-            reply_to_msg_id=None,
-            sender_id=999,
-            text="你已发布启阵邀请，请勿重复操作，等待同门响应或邀请超时。",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        ctx = make_ctx("你已发布启阵邀请，请勿重复操作，等待同门响应或邀请超时。", message_id=21, reply_to_msg_id=None)
         await plugin.on_message(ctx)
         pending_until = getattr(plugin, "_qizhen_existing_invite_until")
         self.assertIsNotNone(pending_until)
@@ -930,25 +719,19 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_qizhen_cooldown_reply_recovers_first_success_and_future_midpoint(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_deep_biguan=True),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        calls: list[tuple[str, float]] = []
+        scheduler = _FakeScheduler()
+        calls = scheduler.calls
 
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                calls.append((key, delay_seconds))
-
-        plugin._scheduler = _FakeScheduler()  # type: ignore[attr-defined]
+        plugin._scheduler = scheduler  # type: ignore[attr-defined]
 
         start = datetime.now()
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "你刚刚参与过布阵，心神消耗巨大，请在11小时0分钟0秒后再次启阵。",
             message_id=21,
             reply_to_msg_id=20,
-            sender_id=999,
-            text="你刚刚参与过布阵，心神消耗巨大，请在11小时0分钟0秒后再次启阵。",
-            ts=datetime.now(timezone.utc),
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -966,29 +749,19 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertLess(midpoint_delays[0], 14410)
 
     async def test_qizhen_cooldown_reply_without_reply_still_matches_within_210_seconds(self) -> None:
-        plugin = AutoXinggongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoXinggongPlugin(_dummy_config(), _LOG)
 
         now = datetime.now()
-        setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
-        setattr(plugin, "_qizhen_pending_slot", 1)
+        _prime_qizhen_slot(plugin, now)
         setattr(plugin, "_qizhen_last_sent_at", now - timedelta(seconds=180))
 
-        ctx = MessageContext(
-            chat_id=-100,
-            message_id=22,
-            reply_to_msg_id=None,
-            sender_id=999,
-            text="你刚刚参与过布阵，心神消耗巨大，请在11小时0分钟0秒后再次启阵。",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        ctx = make_ctx("你刚刚参与过布阵，心神消耗巨大，请在11小时0分钟0秒后再次启阵。", message_id=22, reply_to_msg_id=None)
         await plugin.on_message(ctx)
         self.assertIsNotNone(getattr(plugin, "_qizhen_blocked_until"))
         self.assertIsNotNone(getattr(plugin, "_qizhen_first_success_at"))
 
     async def test_qizhen_cooldown_reply_for_pending_second_slot_recovers_second_success(self) -> None:
-        plugin = AutoXinggongPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoXinggongPlugin(_dummy_config(), _LOG)
 
         now = datetime.now()
         first_success = now - timedelta(hours=13)
@@ -997,13 +770,10 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
         setattr(plugin, "_qizhen_pending_slot", 2)
         setattr(plugin, "_qizhen_last_sent_at", now - timedelta(seconds=10))
 
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "你刚刚参与过布阵，心神消耗巨大，请在11小时0分钟0秒后再次启阵。",
             message_id=23,
             reply_to_msg_id=22,
-            sender_id=999,
-            text="你刚刚参与过布阵，心神消耗巨大，请在11小时0分钟0秒后再次启阵。",
-            ts=datetime.now(timezone.utc),
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -1014,24 +784,18 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_qizhen_cooldown_reply_after_buff_window_schedules_keep_check(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_deep_biguan=True),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        calls: list[tuple[str, float]] = []
-
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                calls.append((key, delay_seconds))
+        scheduler = _FakeScheduler()
+        calls = scheduler.calls
 
-        plugin._scheduler = _FakeScheduler()  # type: ignore[attr-defined]
+        plugin._scheduler = scheduler  # type: ignore[attr-defined]
 
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "你刚刚参与过布阵，心神消耗巨大，请在6小时0分钟0秒后再次启阵。",
             message_id=22,
             reply_to_msg_id=21,
-            sender_id=999,
-            text="你刚刚参与过布阵，心神消耗巨大，请在6小时0分钟0秒后再次启阵。",
-            ts=datetime.now(timezone.utc),
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -1043,16 +807,13 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_restore_deep_biguan_after_buff_window_schedules_keep_check_only(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_deep_biguan=True),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        calls: list[tuple[str, float]] = []
+        scheduler = _FakeScheduler()
+        calls = scheduler.calls
 
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                calls.append((key, delay_seconds))
-
-        plugin._scheduler = _FakeScheduler()  # type: ignore[attr-defined]
+        plugin._scheduler = scheduler  # type: ignore[attr-defined]
         plugin._qizhen_first_success_at = datetime.now() - timedelta(hours=7)  # type: ignore[attr-defined]
 
         await plugin._restore_deep_biguan_schedule()  # type: ignore[attr-defined]
@@ -1063,31 +824,18 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_qizhen_success_schedules_deep_biguan_checks_when_enabled(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_deep_biguan=True),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        calls: list[tuple[str, float]] = []
-
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                calls.append((key, delay_seconds))
+        scheduler = _FakeScheduler()
+        calls = scheduler.calls
 
-        plugin._scheduler = _FakeScheduler()  # type: ignore[attr-defined]
+        plugin._scheduler = scheduler  # type: ignore[attr-defined]
         now = datetime.now()
-        setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
-        setattr(plugin, "_qizhen_pending_slot", 1)
+        _prime_qizhen_slot(plugin, now)
         setattr(plugin, "_qizhen_last_invite_msg_id", 88)
 
-        success = MessageContext(
-            chat_id=-100,
-            message_id=88,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="【周天星斗大阵-成】星光汇聚，大阵已成!",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        success = make_ctx("【周天星斗大阵-成】星光汇聚，大阵已成!", message_id=88)
         await plugin.on_message(success)
         self.assertIn(("xinggong.qizhen.loop", 0.0), calls)
         self.assertIn(("xinggong.deep_biguan.status.now", 0.0), calls)
@@ -1096,7 +844,7 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_biguan_status_reply_enters_deep_biguan_when_inactive(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_deep_biguan=True),
-            logging.getLogger("test"),
+            _LOG,
         )
         now = datetime.now()
         setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
@@ -1104,16 +852,25 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
         setattr(plugin, "_deep_biguan_status_requested_at", now)
         setattr(plugin, "_deep_biguan_status_msg_id", 55)
 
-        ctx = MessageContext(
-            chat_id=-100,
-            message_id=56,
-            reply_to_msg_id=55,
-            sender_id=999,
-            text="你并未处于深度闭关之中",
-            ts=datetime.now(timezone.utc),
-            is_reply=True,
-            is_reply_to_me=False,
+        ctx = make_ctx("你并未处于深度闭关之中", message_id=56, reply_to_msg_id=55, is_reply=True)
+        actions = await plugin.on_message(ctx)
+        assert actions is not None
+        self.assertEqual([a.text for a in actions], [".深度闭关"])
+
+    async def test_unrelated_chat_is_ignored_unless_status_reply_awaited(self) -> None:
+        plugin = AutoXinggongPlugin(
+            _dummy_config(enable_xinggong_deep_biguan=True),
+            _LOG,
         )
+        now = datetime.now()
+        setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
+
+        ctx = make_ctx("你并未处于深度闭关之中", message_id=56, reply_to_msg_id=55, is_reply=True)
+        self.assertIsNone(await plugin.on_message(ctx))
+
+        setattr(plugin, "_deep_biguan_status_reason", "qizhen_success")
+        setattr(plugin, "_deep_biguan_status_requested_at", now)
+        setattr(plugin, "_deep_biguan_status_msg_id", 55)
         actions = await plugin.on_message(ctx)
         assert actions is not None
         self.assertEqual([a.text for a in actions], [".深度闭关"])
@@ -1121,7 +878,7 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_biguan_status_reply_restarts_deep_biguan_when_active(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_deep_biguan=True),
-            logging.getLogger("test"),
+            _LOG,
         )
         now = datetime.now()
         setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
@@ -1129,15 +886,11 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
         setattr(plugin, "_deep_biguan_status_requested_at", now)
         setattr(plugin, "_deep_biguan_status_msg_id", 66)
 
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "你正在深度闭关，预计还需 4小时59分钟58秒即可功成圆满。",
             message_id=67,
             reply_to_msg_id=66,
-            sender_id=999,
-            text="你正在深度闭关，预计还需 4小时59分钟58秒即可功成圆满。",
-            ts=datetime.now(timezone.utc),
             is_reply=True,
-            is_reply_to_me=False,
         )
         actions = await plugin.on_message(ctx)
         assert actions is not None
@@ -1147,7 +900,7 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_biguan_status_reply_keeps_deep_biguan_after_buff_window(self) -> None:
         plugin = AutoXinggongPlugin(
             _dummy_config(enable_xinggong_deep_biguan=True),
-            logging.getLogger("test"),
+            _LOG,
         )
         now = datetime.now()
         setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
@@ -1155,36 +908,25 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
         setattr(plugin, "_deep_biguan_status_requested_at", now)
         setattr(plugin, "_deep_biguan_status_msg_id", 77)
 
-        ctx = MessageContext(
-            chat_id=-100,
+        ctx = make_ctx(
+            "你正在深度闭关，预计还需 2小时59分钟58秒即可功成圆满。",
             message_id=78,
             reply_to_msg_id=77,
-            sender_id=999,
-            text="你正在深度闭关，预计还需 2小时59分钟58秒即可功成圆满。",
-            ts=datetime.now(timezone.utc),
             is_reply=True,
-            is_reply_to_me=False,
         )
         actions = await plugin.on_message(ctx)
         self.assertIsNone(actions)
 
     async def test_qizhen_loop_respects_blocked_until(self) -> None:
-        plugin = AutoXinggongPlugin(_dummy_config(), logging.getLogger("test"))
-
-        scheduled: list[tuple[str, float]] = []
-
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                scheduled.append((key, delay_seconds))
+        plugin = AutoXinggongPlugin(_dummy_config(), _LOG)
 
-        sends: list[str] = []
+        scheduler = _FakeScheduler()
+        scheduled = scheduler.calls
+        send = _FakeSend()
+        sends = send.texts
 
-        async def _send(_plugin: str, text: str, _reply_to_topic: bool) -> int | None:
-            sends.append(text)
-            return None
-
-        plugin._scheduler = _FakeScheduler()  # type: ignore[attr-defined]
-        plugin._send = _send  # type: ignore[attr-defined]
+        plugin._scheduler = scheduler  # type: ignore[attr-defined]
+        plugin._send = send  # type: ignore[attr-defined]
         plugin._qizhen_blocked_until = datetime.now() + timedelta(hours=10)  # type: ignore[attr-defined]
 
         await plugin._qizhen_loop()  # type: ignore[attr-defined]
@@ -1199,23 +941,16 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
         future_start = (now + timedelta(hours=1)).strftime("%H:%M")
         plugin = AutoXinggongPlugin(
             _dummy_config(xinggong_qizhen_start_time=future_start),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        scheduled: list[tuple[str, float]] = []
-
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                scheduled.append((key, delay_seconds))
-
-        sends: list[str] = []
+        scheduler = _FakeScheduler()
+        scheduled = scheduler.calls
+        send = _FakeSend()
+        sends = send.texts
 
-        async def _send(_plugin: str, text: str, _reply_to_topic: bool) -> int | None:
-            sends.append(text)
-            return None
-
-        plugin._scheduler = _FakeScheduler()  # type: ignore[attr-defined]
-        plugin._send = _send  # type: ignore[attr-defined]
+        plugin._scheduler = scheduler  # type: ignore[attr-defined]
+        plugin._send = send  # type: ignore[attr-defined]
         setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
         plugin._qizhen_first_success_at = now - timedelta(hours=13)  # type: ignore[attr-defined]
         plugin._qizhen_second_success_at = now - timedelta(minutes=1)  # type: ignore[attr-defined]
@@ -1235,23 +970,16 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
         future_start = (now + timedelta(hours=1)).strftime("%H:%M")
         plugin = AutoXinggongPlugin(
             _dummy_config(xinggong_qizhen_start_time=future_start),
-            logging.getLogger("test"),
+            _LOG,
         )
 
-        scheduled: list[tuple[str, float]] = []
-
-        class _FakeScheduler:
-            async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
-                scheduled.append((key, delay_seconds))
+        scheduler = _FakeScheduler()
+        scheduled = scheduler.calls
+        send = _FakeSend(999)
+        sends = send.texts
 
-        sends: list[str] = []
-
-        async def _send(_plugin: str, text: str, _reply_to_topic: bool) -> int | None:
-            sends.append(text)
-            return 999
-
-        plugin._scheduler = _FakeScheduler()  # type: ignore[attr-defined]
-        plugin._send = _send  # type: ignore[attr-defined]
+        plugin._scheduler = scheduler  # type: ignore[attr-defined]
+        plugin._send = send  # type: ignore[attr-defined]
         setattr(plugin, "_cycle_date", plugin._cycle_date_for(now))  # type: ignore[attr-defined]
         plugin._qizhen_first_success_at = now - timedelta(hours=13)  # type: ignore[attr-defined]
         plugin._qizhen_second_success_at = now - timedelta(hours=12, seconds=10)  # type: ignore[attr-defined]
@@ -1263,7 +991,3 @@ class TestXinggongPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(getattr(plugin, "_qizhen_pending_slot"), 1)
         self.assertEqual(getattr(plugin, "_cycle_date"), now.date())
         self.assertIn(("xinggong.qizhen.loop", 120.0), scheduled)
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -7,6 +7,10 @@ from xiuxian_bot.core.contracts import MessageContext
 from xiuxian_bot.plugins.yuanying import AutoYuanyingPlugin
 
 
+_LOG = logging.getLogger("test")
+_FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def _dummy_config(
     *,
     enable_yuanying: bool = True,
@@ -63,7 +67,7 @@ def _dummy_config(
 
 class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_bootstrap_schedules_two_loops(self) -> None:
-        plugin = AutoYuanyingPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoYuanyingPlugin(_dummy_config(), _LOG)
         calls: list[tuple[str, float]] = []
 
         class _FakeScheduler:
@@ -80,7 +84,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_disable_liefeng_only_schedules_chuqiao_loop(self) -> None:
         plugin = AutoYuanyingPlugin(
             _dummy_config(enable_yuanying=True, enable_yuanying_liefeng=False),
-            logging.getLogger("test"),
+            _LOG,
         )
         calls: list[tuple[str, float]] = []
 
@@ -101,7 +105,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
                 yuanying_liefeng_interval_seconds=999,
                 yuanying_chuqiao_interval_seconds=555,
             ),
-            logging.getLogger("test"),
+            _LOG,
         )
         calls: list[tuple[str, float]] = []
         sends: list[str] = []
@@ -123,7 +127,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(sends[-1], ".元婴状态")
 
     async def test_liefeng_cooldown_updates_next_time(self) -> None:
-        plugin = AutoYuanyingPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoYuanyingPlugin(_dummy_config(), _LOG)
         start = datetime.now()
         ctx = MessageContext(
             chat_id=-100,
@@ -131,7 +135,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
             reply_to_msg_id=10,
             sender_id=999,
             text="空间裂缝尚未稳定，其中的空间风暴仍在肆虐。请在11小时58分钟35秒后再行探寻。",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -143,14 +147,14 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertLess(delta, 12 * 3600 + 60)
 
     async def test_liefeng_failure_retries_quickly(self) -> None:
-        plugin = AutoYuanyingPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoYuanyingPlugin(_dummy_config(), _LOG)
         ctx = MessageContext(
             chat_id=-100,
             message_id=2,
             reply_to_msg_id=11,
             sender_id=999,
             text="【遭遇风暴】空间裂缝中风暴肆虐，你的元婴受创，被迫逃回！",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -163,7 +167,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
     async def test_liefeng_failure_does_not_retry_when_disabled(self) -> None:
         plugin = AutoYuanyingPlugin(
             _dummy_config(enable_yuanying=True, enable_yuanying_liefeng=False),
-            logging.getLogger("test"),
+            _LOG,
         )
         ctx = MessageContext(
             chat_id=-100,
@@ -171,7 +175,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
             reply_to_msg_id=11,
             sender_id=999,
             text="【遭遇风暴】空间裂缝中风暴肆虐，你的元婴受创，被迫逃回！",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -179,7 +183,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(actions)
 
     async def test_chuqiao_reply_syncs_next_run(self) -> None:
-        plugin = AutoYuanyingPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoYuanyingPlugin(_dummy_config(), _LOG)
         start = datetime.now()
         ctx = MessageContext(
             chat_id=-100,
@@ -187,7 +191,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
             reply_to_msg_id=12,
             sender_id=999,
             text="你心念一动，丹田中的元婴化作一道流光飞出，消失在天际。它将在外云游8小时，为你寻觅天地奇珍。下一次发言时若已归来，将自动结算收获。",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -200,7 +204,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(getattr(plugin, "_chuqiao_waiting_settle"))
 
     async def test_chuqiao_status_reply_syncs_remaining_time(self) -> None:
-        plugin = AutoYuanyingPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoYuanyingPlugin(_dummy_config(), _LOG)
         start = datetime.now()
         ctx = MessageContext(
             chat_id=-100,
@@ -208,7 +212,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
             reply_to_msg_id=30,
             sender_id=999,
             text="【元婴状态】状态:元神出窍 归来倒计时:6小时50分钟30秒",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -221,7 +225,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(getattr(plugin, "_chuqiao_waiting_settle"))
 
     async def test_chuqiao_status_reply_with_spaces_syncs_remaining_time(self) -> None:
-        plugin = AutoYuanyingPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoYuanyingPlugin(_dummy_config(), _LOG)
         start = datetime.now()
         ctx = MessageContext(
             chat_id=-100,
@@ -229,7 +233,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
             reply_to_msg_id=30,
             sender_id=999,
             text="【元婴状态】 状态: 元神出窍 归来倒计时: 6小时50分钟30秒",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -242,14 +246,14 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(getattr(plugin, "_chuqiao_waiting_settle"))
 
     async def test_chuqiao_status_wenyang_restarts_chuqiao(self) -> None:
-        plugin = AutoYuanyingPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoYuanyingPlugin(_dummy_config(), _LOG)
         ctx = MessageContext(
             chat_id=-100,
             message_id=32,
             reply_to_msg_id=30,
             sender_id=999,
             text="【元婴状态】状态:窍中温养",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -258,14 +262,14 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual([a.text for a in actions], [".元婴出窍"])
 
     async def test_chuqiao_status_wenyang_with_spaces_restarts_chuqiao(self) -> None:
-        plugin = AutoYuanyingPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoYuanyingPlugin(_dummy_config(), _LOG)
         ctx = MessageContext(
             chat_id=-100,
             message_id=320,
             reply_to_msg_id=30,
             sender_id=999,
             text="你的本命元婴 等级: 7 级 经验: 2986 / 3500 五行: 风 状态: 窍中温养 使用 .元婴出窍 或 .元婴闭关 派遣元婴。",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -274,14 +278,14 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual([a.text for a in actions], [".元婴出窍"])
 
     async def test_chuqiao_summary_restarts_immediately(self) -> None:
-        plugin = AutoYuanyingPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoYuanyingPlugin(_dummy_config(), _LOG)
         ctx = MessageContext(
             chat_id=-100,
             message_id=33,
             reply_to_msg_id=30,
             sender_id=999,
             text="【元神归窍总结】你的元婴满载而归，为你带来了诸多机缘。",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -290,7 +294,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual([a.text for a in actions], [".元婴出窍"])
 
     async def test_liefeng_weakness_waits_for_recovery(self) -> None:
-        plugin = AutoYuanyingPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoYuanyingPlugin(_dummy_config(), _LOG)
         start = datetime.now()
         ctx = MessageContext(
             chat_id=-100,
@@ -298,7 +302,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
             reply_to_msg_id=13,
             sender_id=999,
             text="【元婴遁逃·虚弱】千钧一发之际，你的元婴带着你的三魂七魄，从破碎的肉身中遁出！但你的神魂遭受重创，已陷入6小时的【虚弱期】！",
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -311,7 +315,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(plugin.runtime_pause_reason(), "元婴遁逃暂停中，等待手动恢复")
 
     def test_clear_runtime_pause_can_reset_pending_progress(self) -> None:
-        plugin = AutoYuanyingPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoYuanyingPlugin(_dummy_config(), _LOG)
         plugin._escape_pause_active = True  # type: ignore[attr-defined]
         plugin._escape_pause_reason = "元婴遁逃暂停中，等待手动恢复"  # type: ignore[attr-defined]
         plugin._liefeng_blocked_until = datetime.now() + timedelta(hours=6)  # type: ignore[attr-defined]
@@ -326,7 +330,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(getattr(plugin, "_chuqiao_waiting_settle"))
 
     async def test_chuqiao_busy_reply_requests_status_without_resetting_wait_time(self) -> None:
-        plugin = AutoYuanyingPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoYuanyingPlugin(_dummy_config(), _LOG)
         original = datetime.now() + timedelta(hours=3)
         plugin._chuqiao_blocked_until = original  # type: ignore[attr-defined]
         ctx = MessageContext(
@@ -335,7 +339,7 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
             reply_to_msg_id=14,
             sender_id=999,
             text='你的元婴正在执行"元神出窍"任务，无法分身。请先使用.元婴归窍将其召回。',
-            ts=datetime.now(timezone.utc),
+            ts=_FROZEN_TS,
             is_reply=True,
             is_reply_to_me=True,
         )
@@ -343,7 +347,3 @@ class TestYuanyingPlugin(unittest.IsolatedAsyncioTestCase):
         assert actions is not None
         self.assertEqual([a.text for a in actions], [".元婴状态"])
         self.assertEqual(getattr(plugin, "_chuqiao_blocked_until"), original)
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -1,124 +1,98 @@
-import asyncio
 import logging
 import unittest
-from datetime import datetime, timezone
 
 from xiuxian_bot.config import Config
-from xiuxian_bot.core.contracts import MessageContext
-from xiuxian_bot.core.scheduler import Scheduler
 from xiuxian_bot.plugins.zongmen import AutoZongmenPlugin
 
+from ._config import make_config, make_ctx
 
-def _dummy_config(
-    *,
-    enable_zongmen: bool = True,
-    enable_zongmen_chuangong: bool = True,
-) -> Config:
-    return Config(
-        tg_api_id=1,
-        tg_api_hash="hash",
-        tg_session_name="session",
-        game_chat_id=-100,
-        topic_id=123,
-        my_name="Me",
-        send_to_topic=True,
-        action_cmd_biguan=".闭关修炼",
-        dry_run=False,
-        log_level="INFO",
-        global_sends_per_minute=999,
-        plugin_sends_per_minute=999,
-        enable_biguan=False,
-        enable_daily=False,
-        enable_garden=False,
-        enable_xinggong=False,
-        enable_yuanying=False,
-        enable_zongmen=enable_zongmen,
-        biguan_extra_buffer_seconds=60,
-        biguan_cooldown_jitter_min_seconds=5,
-        biguan_cooldown_jitter_max_seconds=15,
-        biguan_retry_jitter_min_seconds=3,
-        biguan_retry_jitter_max_seconds=8,
-        garden_seed_name="清灵草种子",
-        garden_poll_interval_seconds=3600,
-        garden_action_spacing_seconds=25,
-        xinggong_star_name="庚金星",
-        xinggong_poll_interval_seconds=3600,
-        xinggong_action_spacing_seconds=25,
-        xinggong_qizhen_start_time="07:00",
-        xinggong_qizhen_retry_interval_seconds=120,
-        xinggong_qizhen_second_offset_seconds=43500,
-        xinggong_wenan_interval_seconds=43200,
-        yuanying_liefeng_interval_seconds=43200,
-        yuanying_chuqiao_interval_seconds=28800,
-        zongmen_cmd_dianmao="宗门点卯",
-        zongmen_cmd_chuangong="宗门传功",
-        zongmen_dianmao_time="00:00",
-        zongmen_chuangong_times="00:00,00:00,00:00",
-        zongmen_chuangong_xinde_text="宗门传功",
-        enable_zongmen_chuangong=enable_zongmen_chuangong,
-        zongmen_catch_up=True,
-        zongmen_action_spacing_seconds=0,
-    )
+
+_LOG = logging.getLogger("test")
+
+
+_ZONGMEN_DEFAULTS = {
+    "enable_zongmen": True,
+    "zongmen_cmd_dianmao": "宗门点卯",
+    "zongmen_cmd_chuangong": "宗门传功",
+    "zongmen_dianmao_time": "00:00",
+    "zongmen_chuangong_times": "00:00,00:00,00:00",
+    "enable_zongmen_chuangong": True,
+    "zongmen_action_spacing_seconds": 0,
+}
+
+
+def _dummy_config(**overrides) -> Config:
+    return make_config(**{**_ZONGMEN_DEFAULTS, **overrides})
+
+
+class _VirtualScheduler:
+    """Runs scheduled actions in due order on a virtual clock instead of sleeping."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self._seq = 0
+        self._pending: dict[str, tuple[float, int, object]] = {}
+
+    async def schedule(self, *, key: str, delay_seconds: float, action) -> None:  # type: ignore[no-untyped-def]
+        # Same-key scheduling replaces the pending entry, like Scheduler.
+        self._seq += 1
+        self._pending[key] = (self.now + max(0.0, delay_seconds), self._seq, action)
+
+    async def schedule_many(self, items) -> None:  # type: ignore[no-untyped-def]
+        for key, delay_seconds, action in items:
+            await self.schedule(key=key, delay_seconds=delay_seconds, action=action)
+
+    async def run_until(self, deadline: float) -> None:
+        while self._pending:
+            key, (due, _, action) = min(self._pending.items(), key=lambda item: item[1][:2])
+            if due > deadline:
+                return
+            del self._pending[key]
+            self.now = due
+            await action()  # type: ignore[operator]
 
 
 class TestZongmenParser(unittest.IsolatedAsyncioTestCase):
     async def test_reply_hint_disables_chuangong(self) -> None:
-        plugin = AutoZongmenPlugin(_dummy_config(), logging.getLogger("test"))
-
-        ctx = MessageContext(
-            chat_id=-100,
-            message_id=1,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="此神通需回复你的一条有价值的发言，方可为宗门记录功法。",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        plugin = AutoZongmenPlugin(_dummy_config(), _LOG)
+
+        ctx = make_ctx("此神通需回复你的一条有价值的发言，方可为宗门记录功法。")
         await plugin.on_message(ctx)
 
         # Internal flag should be set; next scheduled runs will skip.
         self.assertTrue(getattr(plugin, "_chuangong_disabled"))
 
     async def test_parse_chuangong_count(self) -> None:
-        plugin = AutoZongmenPlugin(_dummy_config(), logging.getLogger("test"))
-
-        ctx = MessageContext(
-            chat_id=-100,
-            message_id=2,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="传功成功记录！你为宗门贡献了心得，获得了 30 点贡献。今日已传功 1/3 次。",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        plugin = AutoZongmenPlugin(_dummy_config(), _LOG)
+
+        ctx = make_ctx("传功成功记录！你为宗门贡献了心得，获得了 30 点贡献。今日已传功 1/3 次。", message_id=2)
         await plugin.on_message(ctx)
         self.assertEqual(getattr(plugin, "_chuangong_count"), 1)
 
     async def test_limit_reply_marks_chuangong_done_and_clears_pending(self) -> None:
-        plugin = AutoZongmenPlugin(_dummy_config(), logging.getLogger("test"))
+        plugin = AutoZongmenPlugin(_dummy_config(), _LOG)
         plugin._chuangong_pending = True  # type: ignore[attr-defined]
 
-        ctx = MessageContext(
-            chat_id=-100,
-            message_id=22,
-            reply_to_msg_id=123,
-            sender_id=999,
-            text="你今日传功过于频繁，元神消耗过剧，请明日再来吧。每日最多传功 3 次。",
-            ts=datetime.now(timezone.utc),
-            is_reply=False,
-            is_reply_to_me=False,
-        )
+        ctx = make_ctx("你今日传功过于频繁，元神消耗过剧，请明日再来吧。每日最多传功 3 次。", message_id=22)
         await plugin.on_message(ctx)
         self.assertEqual(getattr(plugin, "_chuangong_count"), 3)
         self.assertFalse(getattr(plugin, "_chuangong_pending"))
 
 
 class TestZongmenBootstrap(unittest.IsolatedAsyncioTestCase):
+    async def test_terminal_day_state_ignores_further_replies(self) -> None:
+        plugin = AutoZongmenPlugin(_dummy_config(), _LOG)
+        await plugin.on_message(make_ctx("点卯成功！"))
+        await plugin.on_message(make_ctx("你今日传功过于频繁，元神消耗过剧，请明日再来吧。每日最多传功 3 次。"))
+        self.assertTrue(getattr(plugin, "_dianmao_done"))
+
+        await plugin.on_message(make_ctx("此神通需回复你的一条有价值的发言，方可为宗门记录功法。"))
+        self.assertFalse(getattr(plugin, "_chuangong_disabled"))
+        self.assertEqual(getattr(plugin, "_chuangong_count"), 3)
+
     async def test_bootstrap_default_chuangong_disabled_only_schedules_dianmao(self) -> None:
-        logger = logging.getLogger("test")
-        scheduler = Scheduler(logger)
+        logger = _LOG
+        scheduler = _VirtualScheduler()
         plugin = AutoZongmenPlugin(_dummy_config(enable_zongmen_chuangong=False), logger)
 
         calls: list[tuple[str, str, bool, int | None]] = []
@@ -128,14 +102,13 @@ class TestZongmenBootstrap(unittest.IsolatedAsyncioTestCase):
             return 1001
 
         await plugin.bootstrap(scheduler, fake_send)
-        await asyncio.sleep(0.2)
-        await scheduler.cancel_all()
+        await scheduler.run_until(60.0)
 
         self.assertEqual(calls, [("zongmen", "宗门点卯", True, None)])
 
     async def test_bootstrap_catchup_sends_dianmao_and_chuangong(self) -> None:
-        logger = logging.getLogger("test")
-        scheduler = Scheduler(logger)
+        logger = _LOG
+        scheduler = _VirtualScheduler()
         plugin = AutoZongmenPlugin(_dummy_config(), logger)
 
         calls: list[tuple[str, str, bool, int | None]] = []
@@ -149,13 +122,10 @@ class TestZongmenBootstrap(unittest.IsolatedAsyncioTestCase):
             if text == "宗门传功" and reply_to_msg_id is not None:
                 success_count += 1
                 await plugin.on_message(
-                    MessageContext(
-                        chat_id=-100,
+                    make_ctx(
+                        f"传功成功记录！你为宗门贡献了心得，获得了 30 点贡献。今日已传功 {success_count}/3 次。",
                         message_id=next_id,
                         reply_to_msg_id=reply_to_msg_id,
-                        sender_id=999,
-                        text=f"传功成功记录！你为宗门贡献了心得，获得了 30 点贡献。今日已传功 {success_count}/3 次。",
-                        ts=datetime.now(timezone.utc),
                         is_reply=True,
                         is_reply_to_me=True,
                     )
@@ -164,9 +134,8 @@ class TestZongmenBootstrap(unittest.IsolatedAsyncioTestCase):
 
         await plugin.bootstrap(scheduler, fake_send)
 
-        # Let scheduled tasks run, including pending retries after each success clears pending.
-        await asyncio.sleep(2.5)
-        await scheduler.cancel_all()
+        # Run due tasks, including pending retries after each success clears pending.
+        await scheduler.run_until(60.0)
 
         # Expect 1 dianmao + 3*(xinde + command) = 7 sends.
         self.assertEqual(len(calls), 7)
@@ -181,8 +150,8 @@ class TestZongmenBootstrap(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(cmds), 3)
 
     async def test_bootstrap_catchup_stops_after_limit_reply(self) -> None:
-        logger = logging.getLogger("test")
-        scheduler = Scheduler(logger)
+        logger = _LOG
+        scheduler = _VirtualScheduler()
         plugin = AutoZongmenPlugin(_dummy_config(), logger)
 
         calls: list[tuple[str, str, bool, int | None]] = []
@@ -196,13 +165,10 @@ class TestZongmenBootstrap(unittest.IsolatedAsyncioTestCase):
             if text == "宗门传功" and reply_to_msg_id is not None and not limit_seen:
                 limit_seen = True
                 await plugin.on_message(
-                    MessageContext(
-                        chat_id=-100,
+                    make_ctx(
+                        "你今日传功过于频繁，元神消耗过剧，请明日再来吧。每日最多传功 3 次。",
                         message_id=next_id,
                         reply_to_msg_id=reply_to_msg_id,
-                        sender_id=999,
-                        text="你今日传功过于频繁，元神消耗过剧，请明日再来吧。每日最多传功 3 次。",
-                        ts=datetime.now(timezone.utc),
                         is_reply=True,
                         is_reply_to_me=True,
                     )
@@ -210,8 +176,7 @@ class TestZongmenBootstrap(unittest.IsolatedAsyncioTestCase):
             return next_id
 
         await plugin.bootstrap(scheduler, fake_send)
-        await asyncio.sleep(0.2)
-        await scheduler.cancel_all()
+        await scheduler.run_until(60.0)
 
         xinde = [c for c in calls if c[1].startswith("心得：")]
         cmds = [c for c in calls if c[1] == "宗门传功" and c[3] is not None]
@@ -11,27 +11,29 @@ from .domain.text_normalizer import normalize_match_text
 def _load_dotenv(path: Path) -> None:
     if not path.exists():
         return
-    for raw_line in path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip("\"'")
-        if key:
-            os.environ.setdefault(key, value)
-
-
-def _env(key: str) -> str | None:
-    value = os.getenv(key)
+    setdefault = os.environ.setdefault
+    with path.open("r", encoding="utf-8") as handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            key = key.strip()
+            value = value.strip().strip("\"'")
+            if key:
+                setdefault(key, value)
+
+
+def _env(env: Mapping[str, str], key: str) -> str | None:
+    value = env.get(key)
     if value is None:
         return None
     value = value.strip()
     return value or None
 
 
-def _get_env_str(key: str, *, default: str | None = None) -> str:
-    value = _env(key)
+def _get_env_str(env: Mapping[str, str], key: str, *, default: str | None = None) -> str:
+    value = _env(env, key)
     if value is None:
         if default is None:
             raise ValueError(f"Missing required env var: {key}")
@@ -39,8 +41,8 @@ def _get_env_str(key: str, *, default: str | None = None) -> str:
     return value
 
 
-def _get_env_int(key: str, *, default: int | None = None) -> int:
-    value = _env(key)
+def _get_env_int(env: Mapping[str, str], key: str, *, default: int | None = None) -> int:
+    value = _env(env, key)
     if value is None:
         if default is None:
             raise ValueError(f"Missing required env var: {key}")
@@ -51,8 +53,8 @@ def _get_env_int(key: str, *, default: int | None = None) -> int:
         raise ValueError(f"Invalid int env var {key}={value!r}") from exc
 
 
-def _get_env_float(key: str, *, default: float | None = None) -> float:
-    value = _env(key)
+def _get_env_float(env: Mapping[str, str], key: str, *, default: float | None = None) -> float:
+    value = _env(env, key)
     if value is None:
         if default is None:
             raise ValueError(f"Missing required env var: {key}")
@@ -63,8 +65,8 @@ def _get_env_float(key: str, *, default: float | None = None) -> float:
         raise ValueError(f"Invalid float env var {key}={value!r}") from exc
 
 
-def _get_env_bool(key: str, *, default: bool = False) -> bool:
-    value = _env(key)
+def _get_env_bool(env: Mapping[str, str], key: str, *, default: bool = False) -> bool:
+    value = _env(env, key)
     if value is None:
         return default
     return _parse_bool(value, key)
@@ -243,41 +245,48 @@ class SystemConfig:
     @staticmethod
     def load() -> "SystemConfig":
         _load_dotenv(Path(".env"))
-        app_db_path = _env("APP_DB_PATH") or _env("STATE_DB_PATH") or "xiuxian_app.sqlite3"
-        admin_password = _get_env_str("WEB_ADMIN_PASSWORD", default="changeme")
+        # One snapshot per load: plain dict lookups, and nothing can shift under a half-built config.
+        env = dict(os.environ)
+        app_db_path = _env(env, "APP_DB_PATH") or _env(env, "STATE_DB_PATH") or "xiuxian_app.sqlite3"
+        admin_password = _get_env_str(env, "WEB_ADMIN_PASSWORD", default="changeme")
         secret_key = _get_env_str(
+            env,
             "WEB_SECRET_KEY",
             default=f"xiuxian-helper::{admin_password}::{app_db_path}",
         )
         return SystemConfig(
-            log_level=_get_env_str("LOG_LEVEL", default="INFO").upper(),
+            log_level=_get_env_str(env, "LOG_LEVEL", default="INFO").upper(),
             app_db_path=app_db_path,
-            web_host=_get_env_str("WEB_HOST", default="127.0.0.1"),
-            web_port=_get_env_int("WEB_PORT", default=8000),
-            web_admin_username=_get_env_str("WEB_ADMIN_USERNAME", default="admin"),
+            web_host=_get_env_str(env, "WEB_HOST", default="127.0.0.1"),
+            web_port=_get_env_int(env, "WEB_PORT", default=8000),
+            web_admin_username=_get_env_str(env, "WEB_ADMIN_USERNAME", default="admin"),
             web_admin_password=admin_password,
             web_secret_key=secret_key,
-            log_dir=_get_env_str("LOG_DIR", default="logs"),
-            session_root_dir=_get_env_str("SESSION_ROOT_DIR", default=""),
-            default_account_name=_get_env_str("DEFAULT_ACCOUNT_NAME", default="default"),
-            tg_api_id=_get_env_int("TG_API_ID", default=0),
-            tg_api_hash=_get_env_str("TG_API_HASH", default=""),
-            game_chat_id=_get_env_int("GAME_CHAT_ID", default=0),
-            topic_id=_get_env_int("TOPIC_ID", default=0),
-            send_to_topic=_get_env_bool("SEND_TO_TOPIC", default=True),
+            log_dir=_get_env_str(env, "LOG_DIR", default="logs"),
+            session_root_dir=_get_env_str(env, "SESSION_ROOT_DIR", default=""),
+            default_account_name=_get_env_str(env, "DEFAULT_ACCOUNT_NAME", default="default"),
+            tg_api_id=_get_env_int(env, "TG_API_ID", default=0),
+            tg_api_hash=_get_env_str(env, "TG_API_HASH", default=""),
+            game_chat_id=_get_env_int(env, "GAME_CHAT_ID", default=0),
+            topic_id=_get_env_int(env, "TOPIC_ID", default=0),
+            send_to_topic=_get_env_bool(env, "SEND_TO_TOPIC", default=True),
             system_reply_source_usernames=_get_env_str(
+                env,
                 "SYSTEM_REPLY_SOURCE_USERNAMES",
                 default="hantianzunhl",
             ),
             message_archive_cleanup_enabled=_get_env_bool(
+                env,
                 "MESSAGE_ARCHIVE_CLEANUP_ENABLED",
                 default=True,
             ),
             message_archive_retention_days=_get_env_int(
+                env,
                 "MESSAGE_ARCHIVE_RETENTION_DAYS",
                 default=30,
             ),
             message_archive_vacuum_enabled=_get_env_bool(
+                env,
                 "MESSAGE_ARCHIVE_VACUUM_ENABLED",
                 default=True,
             ),
@@ -1011,255 +1020,331 @@ class Config:
     @staticmethod
     def load_legacy_env() -> "Config" | None:
         _load_dotenv(Path(".env"))
-        if any(_env(key) is None for key in LEGACY_ACCOUNT_ENV_KEYS):
+        env = dict(os.environ)
+        if any(_env(env, key) is None for key in LEGACY_ACCOUNT_ENV_KEYS):
             return None
 
         mapping = {
-            "tg_api_id": _get_env_int("TG_API_ID"),
-            "tg_api_hash": _get_env_str("TG_API_HASH"),
-            "tg_session_name": _get_env_str("TG_SESSION_NAME", default="xiuxian_private_session"),
-            "game_chat_id": _get_env_int("GAME_CHAT_ID"),
-            "topic_id": _get_env_int("TOPIC_ID"),
-            "my_name": _get_env_str("MY_NAME"),
-            "send_to_topic": _get_env_bool("SEND_TO_TOPIC", default=False),
-            "action_cmd_biguan": _get_env_str("ACTION_CMD_BIGUAN", default=".闭关修炼"),
-            "dry_run": _get_env_bool("DRY_RUN", default=False),
-            "enable_message_archive": _get_env_bool("ENABLE_MESSAGE_ARCHIVE", default=True),
-            "log_level": _get_env_str("LOG_LEVEL", default="INFO").upper(),
-            "global_sends_per_minute": _get_env_int("GLOBAL_SENDS_PER_MINUTE", default=6),
-            "plugin_sends_per_minute": _get_env_int("PLUGIN_SENDS_PER_MINUTE", default=3),
-            "enable_biguan": _get_env_bool("ENABLE_BIGUAN", default=True),
-            "enable_daily": _get_env_bool("ENABLE_DAILY", default=False),
-            "enable_garden": _get_env_bool("ENABLE_GARDEN", default=False),
-            "enable_xinggong": _get_env_bool("ENABLE_XINGGONG", default=False),
-            "enable_yuanying": _get_env_bool("ENABLE_YUANYING", default=False),
-            "enable_zongmen": _get_env_bool("ENABLE_ZONGMEN", default=False),
+            "tg_api_id": _get_env_int(env, "TG_API_ID"),
+            "tg_api_hash": _get_env_str(env, "TG_API_HASH"),
+            "tg_session_name": _get_env_str(env, "TG_SESSION_NAME", default="xiuxian_private_session"),
+            "game_chat_id": _get_env_int(env, "GAME_CHAT_ID"),
+            "topic_id": _get_env_int(env, "TOPIC_ID"),
+            "my_name": _get_env_str(env, "MY_NAME"),
+            "send_to_topic": _get_env_bool(env, "SEND_TO_TOPIC", default=False),
+            "action_cmd_biguan": _get_env_str(env, "ACTION_CMD_BIGUAN", default=".闭关修炼"),
+            "dry_run": _get_env_bool(env, "DRY_RUN", default=False),
+            "enable_message_archive": _get_env_bool(env, "ENABLE_MESSAGE_ARCHIVE", default=True),
+            "log_level": _get_env_str(env, "LOG_LEVEL", default="INFO").upper(),
+            "global_sends_per_minute": _get_env_int(env, "GLOBAL_SENDS_PER_MINUTE", default=6),
+            "plugin_sends_per_minute": _get_env_int(env, "PLUGIN_SENDS_PER_MINUTE", default=3),
+            "enable_biguan": _get_env_bool(env, "ENABLE_BIGUAN", default=True),
+            "enable_daily": _get_env_bool(env, "ENABLE_DAILY", default=False),
+            "enable_garden": _get_env_bool(env, "ENABLE_GARDEN", default=False),
+            "enable_xinggong": _get_env_bool(env, "ENABLE_XINGGONG", default=False),
+            "enable_yuanying": _get_env_bool(env, "ENABLE_YUANYING", default=False),
+            "enable_zongmen": _get_env_bool(env, "ENABLE_ZONGMEN", default=False),
             "biguan_extra_buffer_seconds": _get_env_int(
-                "BIGUAN_EXTRA_BUFFER_SECONDS", default=60
+                env,
+                "BIGUAN_EXTRA_BUFFER_SECONDS",
+                default=60,
             ),
             "biguan_cooldown_jitter_min_seconds": _get_env_int(
-                "BIGUAN_COOLDOWN_JITTER_MIN_SECONDS", default=5
+                env,
+                "BIGUAN_COOLDOWN_JITTER_MIN_SECONDS",
+                default=5,
             ),
             "biguan_cooldown_jitter_max_seconds": _get_env_int(
-                "BIGUAN_COOLDOWN_JITTER_MAX_SECONDS", default=15
+                env,
+                "BIGUAN_COOLDOWN_JITTER_MAX_SECONDS",
+                default=15,
             ),
             "biguan_retry_jitter_min_seconds": _get_env_int(
-                "BIGUAN_RETRY_JITTER_MIN_SECONDS", default=3
+                env,
+                "BIGUAN_RETRY_JITTER_MIN_SECONDS",
+                default=3,
             ),
             "biguan_retry_jitter_max_seconds": _get_env_int(
-                "BIGUAN_RETRY_JITTER_MAX_SECONDS", default=8
+                env,
+                "BIGUAN_RETRY_JITTER_MAX_SECONDS",
+                default=8,
             ),
-            "biguan_mode": _get_env_str("BIGUAN_MODE", default="normal"),
+            "biguan_mode": _get_env_str(env, "BIGUAN_MODE", default="normal"),
             "biguan_deep_settle_command": _get_env_str(
+                env,
                 "BIGUAN_DEEP_SETTLE_COMMAND",
                 default=".状态",
             ),
             "biguan_deep_duration_seconds": _get_env_int(
+                env,
                 "BIGUAN_DEEP_DURATION_SECONDS",
                 default=8 * 3600 + 180,
             ),
             "daily_bushi_times_per_day": _get_env_int(
+                env,
                 "DAILY_BUSHI_TIMES_PER_DAY",
                 default=5,
             ),
             "daily_bushi_interval_seconds": _get_env_int(
+                env,
                 "DAILY_BUSHI_INTERVAL_SECONDS",
                 default=120,
             ),
             "daily_bushi_exchange_action": _get_env_str(
+                env,
                 "DAILY_BUSHI_EXCHANGE_ACTION",
                 default=".换取",
             ),
             "daily_bushi_start_time": _get_env_str(
+                env,
                 "DAILY_BUSHI_START_TIME",
                 default="08:00",
             ),
-            "enable_wild_explore": _get_env_bool("ENABLE_WILD_EXPLORE", default=False),
+            "enable_wild_explore": _get_env_bool(env, "ENABLE_WILD_EXPLORE", default=False),
             "wild_explore_interval_seconds": _get_env_int(
+                env,
                 "WILD_EXPLORE_INTERVAL_SECONDS",
                 default=7200,
             ),
-            "wild_explore_strategy": _get_env_str("WILD_EXPLORE_STRATEGY", default="深入"),
+            "wild_explore_strategy": _get_env_str(env, "WILD_EXPLORE_STRATEGY", default="深入"),
             "wild_explore_repeat_delay_seconds": _get_env_int(
+                env,
                 "WILD_EXPLORE_REPEAT_DELAY_SECONDS",
                 default=10,
             ),
-            "enable_random_text": _get_env_bool("ENABLE_RANDOM_TEXT", default=False),
-            "random_text_messages": _get_env_str("RANDOM_TEXT_MESSAGES", default=""),
+            "enable_random_text": _get_env_bool(env, "ENABLE_RANDOM_TEXT", default=False),
+            "random_text_messages": _get_env_str(env, "RANDOM_TEXT_MESSAGES", default=""),
             "random_text_min_interval_seconds": _get_env_int(
+                env,
                 "RANDOM_TEXT_MIN_INTERVAL_SECONDS",
                 default=1800,
             ),
             "random_text_max_interval_seconds": _get_env_int(
+                env,
                 "RANDOM_TEXT_MAX_INTERVAL_SECONDS",
                 default=7200,
             ),
             "random_text_daily_limit": _get_env_int(
+                env,
                 "RANDOM_TEXT_DAILY_LIMIT",
                 default=6,
             ),
-            "enable_shiqie": _get_env_bool("ENABLE_SHIQIE", default=False),
+            "enable_shiqie": _get_env_bool(env, "ENABLE_SHIQIE", default=False),
             "shiqie_tianji_interval_seconds": _get_env_int(
+                env,
                 "SHIQIE_TIANJI_INTERVAL_SECONDS",
                 default=12 * 3600,
             ),
             "shiqie_rumeng_interval_seconds": _get_env_int(
+                env,
                 "SHIQIE_RUMENG_INTERVAL_SECONDS",
                 default=8 * 3600,
             ),
-            "enable_luoyunzong": _get_env_bool("ENABLE_LUOYUNZONG", default=False),
+            "enable_luoyunzong": _get_env_bool(env, "ENABLE_LUOYUNZONG", default=False),
             "luoyunzong_status_interval_seconds": _get_env_int(
+                env,
                 "LUOYUNZONG_STATUS_INTERVAL_SECONDS",
                 default=1800,
             ),
             "luoyunzong_watering_cooldown_seconds": _get_env_int(
+                env,
                 "LUOYUNZONG_WATERING_COOLDOWN_SECONDS",
                 default=7200,
             ),
             "luoyunzong_watering_strategy": _get_env_str(
+                env,
                 "LUOYUNZONG_WATERING_STRATEGY",
                 default="match_linggen",
             ),
             "luoyunzong_watering_required_needs": _get_env_str(
+                env,
                 "LUOYUNZONG_WATERING_REQUIRED_NEEDS",
                 default="",
             ),
             "luoyunzong_linggen_refresh_seconds": _get_env_int(
+                env,
                 "LUOYUNZONG_LINGGEN_REFRESH_SECONDS",
                 default=86400,
             ),
             "luoyunzong_harvest_suppress_seconds": _get_env_int(
+                env,
                 "LUOYUNZONG_HARVEST_SUPPRESS_SECONDS",
                 default=86400,
             ),
-            "enable_qiling": _get_env_bool("ENABLE_QILING", default=False),
-            "qiling_artifact_names": _get_env_str("QILING_ARTIFACT_NAMES", default=""),
-            "qiling_enable_touch": _get_env_bool("QILING_ENABLE_TOUCH", default=True),
-            "qiling_enable_nurture": _get_env_bool("QILING_ENABLE_NURTURE", default=True),
-            "qiling_enable_trial": _get_env_bool("QILING_ENABLE_TRIAL", default=True),
-            "qiling_trial_route": _get_env_str("QILING_TRIAL_ROUTE", default="静修"),
-            "garden_seed_name": _get_env_str("GARDEN_SEED_NAME", default="清灵草种子"),
+            "enable_qiling": _get_env_bool(env, "ENABLE_QILING", default=False),
+            "qiling_artifact_names": _get_env_str(env, "QILING_ARTIFACT_NAMES", default=""),
+            "qiling_enable_touch": _get_env_bool(env, "QILING_ENABLE_TOUCH", default=True),
+            "qiling_enable_nurture": _get_env_bool(env, "QILING_ENABLE_NURTURE", default=True),
+            "qiling_enable_trial": _get_env_bool(env, "QILING_ENABLE_TRIAL", default=True),
+            "qiling_trial_route": _get_env_str(env, "QILING_TRIAL_ROUTE", default="静修"),
+            "garden_seed_name": _get_env_str(env, "GARDEN_SEED_NAME", default="清灵草种子"),
             "garden_poll_interval_seconds": _get_env_int(
-                "GARDEN_POLL_INTERVAL_SECONDS", default=3600
+                env,
+                "GARDEN_POLL_INTERVAL_SECONDS",
+                default=3600,
             ),
             "garden_action_spacing_seconds": _get_env_int(
-                "GARDEN_ACTION_SPACING_SECONDS", default=25
+                env,
+                "GARDEN_ACTION_SPACING_SECONDS",
+                default=25,
             ),
-            "xinggong_star_name": _get_env_str("XINGGONG_STAR_NAME", default="庚金星"),
+            "xinggong_star_name": _get_env_str(env, "XINGGONG_STAR_NAME", default="庚金星"),
             "xinggong_poll_interval_seconds": _get_env_int(
-                "XINGGONG_POLL_INTERVAL_SECONDS", default=3600
+                env,
+                "XINGGONG_POLL_INTERVAL_SECONDS",
+                default=3600,
             ),
             "xinggong_action_spacing_seconds": _get_env_int(
-                "XINGGONG_ACTION_SPACING_SECONDS", default=25
+                env,
+                "XINGGONG_ACTION_SPACING_SECONDS",
+                default=25,
             ),
             "xinggong_qizhen_start_time": _get_env_str(
-                "XINGGONG_QIZHEN_START_TIME", default="07:00"
+                env,
+                "XINGGONG_QIZHEN_START_TIME",
+                default="07:00",
             ),
             "xinggong_qizhen_retry_interval_seconds": _get_env_int(
-                "XINGGONG_QIZHEN_RETRY_INTERVAL_SECONDS", default=120
+                env,
+                "XINGGONG_QIZHEN_RETRY_INTERVAL_SECONDS",
+                default=120,
             ),
             "xinggong_qizhen_second_offset_seconds": _get_env_int(
-                "XINGGONG_QIZHEN_SECOND_OFFSET_SECONDS", default=43500
+                env,
+                "XINGGONG_QIZHEN_SECOND_OFFSET_SECONDS",
+                default=43500,
             ),
             "xinggong_wenan_interval_seconds": _get_env_int(
-                "XINGGONG_WENAN_INTERVAL_SECONDS", default=43200
+                env,
+                "XINGGONG_WENAN_INTERVAL_SECONDS",
+                default=43200,
             ),
             "yuanying_liefeng_interval_seconds": _get_env_int(
-                "YUANYING_LIEFENG_INTERVAL_SECONDS", default=43200
+                env,
+                "YUANYING_LIEFENG_INTERVAL_SECONDS",
+                default=43200,
             ),
             "yuanying_chuqiao_interval_seconds": _get_env_int(
-                "YUANYING_CHUQIAO_INTERVAL_SECONDS", default=28800
-            ),
-            "zongmen_cmd_dianmao": _get_env_str("ZONGMEN_CMD_DIANMAO", default=".宗门点卯"),
-            "zongmen_cmd_chuangong": _get_env_str("ZONGMEN_CMD_CHUANGONG", default=".宗门传功"),
-            "zongmen_dianmao_time": _env("ZONGMEN_DIANMAO_TIME"),
-            "zongmen_chuangong_times": _env("ZONGMEN_CHUANGONG_TIMES"),
+                env,
+                "YUANYING_CHUQIAO_INTERVAL_SECONDS",
+                default=28800,
+            ),
+            "zongmen_cmd_dianmao": _get_env_str(env, "ZONGMEN_CMD_DIANMAO", default=".宗门点卯"),
+            "zongmen_cmd_chuangong": _get_env_str(env, "ZONGMEN_CMD_CHUANGONG", default=".宗门传功"),
+            "zongmen_dianmao_time": _env(env, "ZONGMEN_DIANMAO_TIME"),
+            "zongmen_chuangong_times": _env(env, "ZONGMEN_CHUANGONG_TIMES"),
             "zongmen_chuangong_xinde_text": _get_env_str(
+                env,
                 "ZONGMEN_CHUANGONG_XINDE_TEXT",
                 default="今日修行心得：稳中求进。",
             ),
             "enable_zongmen_chuangong": _get_env_bool(
+                env,
                 "ENABLE_ZONGMEN_CHUANGONG",
                 default=False,
             ),
-            "zongmen_catch_up": _get_env_bool("ZONGMEN_CATCH_UP", default=True),
+            "zongmen_catch_up": _get_env_bool(env, "ZONGMEN_CATCH_UP", default=True),
             "zongmen_action_spacing_seconds": _get_env_int(
-                "ZONGMEN_ACTION_SPACING_SECONDS", default=20
+                env,
+                "ZONGMEN_ACTION_SPACING_SECONDS",
+                default=20,
             ),
-            "enable_xinggong_wenan": _get_env_bool("ENABLE_XINGGONG_WENAN", default=True),
+            "enable_xinggong_wenan": _get_env_bool(env, "ENABLE_XINGGONG_WENAN", default=True),
             "enable_xinggong_deep_biguan": _get_env_bool(
-                "ENABLE_XINGGONG_DEEP_BIGUAN", default=False
+                env,
+                "ENABLE_XINGGONG_DEEP_BIGUAN",
+                default=False,
             ),
             "enable_xinggong_guanxing": _get_env_bool(
-                "ENABLE_XINGGONG_GUANXING", default=False
+                env,
+                "ENABLE_XINGGONG_GUANXING",
+                default=False,
             ),
             "enable_yuanying_liefeng": _get_env_bool(
-                "ENABLE_YUANYING_LIEFENG", default=True
+                env,
+                "ENABLE_YUANYING_LIEFENG",
+                default=True,
             ),
             "xinggong_guanxing_target_username": _get_env_str(
+                env,
                 "XINGGONG_GUANXING_TARGET_USERNAME",
                 default="salt9527",
             ),
             "xinggong_guanxing_preview_advance_seconds": _get_env_int(
+                env,
                 "XINGGONG_GUANXING_PREVIEW_ADVANCE_SECONDS",
                 default=180,
             ),
             "xinggong_guanxing_shift_advance_seconds": _get_env_float(
+                env,
                 "XINGGONG_GUANXING_SHIFT_ADVANCE_SECONDS",
                 default=1.0,
             ),
             "xinggong_guanxing_watch_events": _get_env_str(
+                env,
                 "XINGGONG_GUANXING_WATCH_EVENTS",
                 default="星辰异象,地磁暴动",
             ),
             "global_send_min_interval_seconds": _get_env_int(
-                "GLOBAL_SEND_MIN_INTERVAL_SECONDS", default=10
+                env,
+                "GLOBAL_SEND_MIN_INTERVAL_SECONDS",
+                default=10,
             ),
-            "state_db_path": _env("APP_DB_PATH") or _env("STATE_DB_PATH") or "xiuxian_app.sqlite3",
-            "enable_chuangta": _get_env_bool("ENABLE_CHUANGTA", default=False),
-            "chuangta_time": _get_env_str("CHUANGTA_TIME", default="14:15"),
-            "enable_lingxiaogong": _get_env_bool("ENABLE_LINGXIAOGONG", default=False),
+            "state_db_path": _env(env, "APP_DB_PATH") or _env(env, "STATE_DB_PATH") or "xiuxian_app.sqlite3",
+            "enable_chuangta": _get_env_bool(env, "ENABLE_CHUANGTA", default=False),
+            "chuangta_time": _get_env_str(env, "CHUANGTA_TIME", default="14:15"),
+            "enable_lingxiaogong": _get_env_bool(env, "ENABLE_LINGXIAOGONG", default=False),
             "enable_lingxiaogong_wenxintai": _get_env_bool(
+                env,
                 "ENABLE_LINGXIAOGONG_WENXINTAI",
                 default=True,
             ),
             "enable_lingxiaogong_jiutian": _get_env_bool(
+                env,
                 "ENABLE_LINGXIAOGONG_JIUTIAN",
                 default=True,
             ),
             "enable_lingxiaogong_dengtianjie": _get_env_bool(
+                env,
                 "ENABLE_LINGXIAOGONG_DENGTIANJIE",
                 default=True,
             ),
             "lingxiaogong_poll_interval_seconds": _get_env_int(
+                env,
                 "LINGXIAOGONG_POLL_INTERVAL_SECONDS",
                 default=300,
             ),
             "lingxiaogong_wenxintai_after_climb_count": _get_env_int(
+                env,
                 "LINGXIAOGONG_WENXINTAI_AFTER_CLIMB_COUNT",
                 default=4,
             ),
             "enable_random_event_nanlonghou": _get_env_bool(
+                env,
                 "ENABLE_RANDOM_EVENT_NANLONGHOU",
                 default=True,
             ),
             "random_event_nanlonghou_action": _get_env_str(
+                env,
                 "RANDOM_EVENT_NANLONGHOU_ACTION",
                 default=".交换 功法",
             ),
             "enable_random_event_jiyin": _get_env_bool(
+                env,
                 "ENABLE_RANDOM_EVENT_JIYIN",
                 default=True,
             ),
             "random_event_jiyin_action": _get_env_str(
+                env,
                 "RANDOM_EVENT_JIYIN_ACTION",
                 default=".献上魂魄",
             ),
             "system_reply_source_usernames": _get_env_str(
+                env,
                 "SYSTEM_REPLY_SOURCE_USERNAMES",
                 default="hantianzunhl",
             ),
             "account_id": "legacy-default",
-            "account_name": _get_env_str("DEFAULT_ACCOUNT_NAME", default="default"),
+            "account_name": _get_env_str(env, "DEFAULT_ACCOUNT_NAME", default="default"),
         }
         return Config.from_mapping(mapping)
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Protocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MessageContext:
     chat_id: int
     message_id: int
@@ -23,7 +23,7 @@ class MessageContext:
         return self.is_reply_to_me or self.is_system_reply
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SendAction:
     plugin: str
     text: str
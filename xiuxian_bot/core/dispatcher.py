@@ -1,26 +1,43 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 
 from .contracts import MessageContext, Plugin, SendAction
 
+_OnMessage = Callable[[MessageContext], Awaitable["list[SendAction] | None"]]
+
+
+def _make_safe(on_message: _OnMessage, name: str, logger: logging.Logger) -> _OnMessage:
+    async def safe_on_message(ctx: MessageContext) -> list[SendAction] | None:
+        try:
+            return await on_message(ctx)
+        except Exception:
+            logger.exception("plugin_error name=%s", name)
+            return None
+
+    return safe_on_message
+
 
 class Dispatcher:
     def __init__(self, plugins: list[Plugin], logger: logging.Logger) -> None:
         self._logger = logger
-        self._plugins = sorted(plugins, key=lambda p: getattr(p, "priority", 0), reverse=True)
+        # Plugins decide `enabled` from their config in __init__ and never flip it afterwards,
+        # so disabled plugins are dropped here and each callback is wrapped once; a failing
+        # plugin is logged inside its wrapper instead of being sorted out per message.
+        self._entries: tuple[_OnMessage, ...] = tuple(
+            _make_safe(plugin.on_message, str(getattr(plugin, "name", plugin)), logger)
+            for plugin in sorted(plugins, key=lambda p: getattr(p, "priority", 0), reverse=True)
+            if getattr(plugin, "enabled", True)
+        )
 
     async def dispatch(self, ctx: MessageContext) -> list[SendAction]:
+        # Plugins run concurrently so one awaiting I/O does not hold up the rest;
+        # actions are still collected in priority order.
+        results = await asyncio.gather(*(on_message(ctx) for on_message in self._entries))
         actions: list[SendAction] = []
-        for plugin in self._plugins:
-            if not getattr(plugin, "enabled", True):
-                continue
-            try:
-                result = await plugin.on_message(ctx)
-            except Exception:
-                self._logger.exception("plugin_error name=%s", getattr(plugin, "name", plugin))
-                continue
+        for result in results:
             if result:
                 actions.extend(result)
         return actions
-
@@ -1,17 +1,28 @@
 from __future__ import annotations
 
-from collections import deque
+from collections import defaultdict, deque
+from collections.abc import Callable
+from functools import partial
 import time
 
+MonotonicFn = Callable[[], float]
+
 
 class SlidingWindowRateLimiter:
-    def __init__(self, max_events: int, window_seconds: int) -> None:
+    def __init__(
+        self,
+        max_events: int,
+        window_seconds: int,
+        *,
+        monotonic_fn: MonotonicFn = time.monotonic,
+    ) -> None:
         if max_events < 1:
             raise ValueError(f"max_events must be >= 1, got: {max_events}")
         if window_seconds < 1:
             raise ValueError(f"window_seconds must be >= 1, got: {window_seconds}")
         self._max_events = max_events
         self._window_seconds = window_seconds
+        self._monotonic = monotonic_fn
         self._events: deque[float] = deque()
 
     def _prune(self, now: float) -> None:
@@ -27,7 +38,7 @@ class SlidingWindowRateLimiter:
         self._events.append(now)
 
     def allow(self) -> bool:
-        now = time.monotonic()
+        now = self._monotonic()
         if not self.can_allow_at(now):
             return False
         self.reserve_at(now)
@@ -41,25 +52,30 @@ class SlidingWindowRateLimiter:
         return max(0.0, (self._events[0] + self._window_seconds) - now)
 
     def next_allowed_in(self) -> float:
-        return self.next_allowed_in_at(time.monotonic())
+        return self.next_allowed_in_at(self._monotonic())
 
 
 class RateLimiter:
-    def __init__(self, *, global_per_minute: int, plugin_per_minute: int) -> None:
+    def __init__(
+        self,
+        *,
+        global_per_minute: int,
+        plugin_per_minute: int,
+        monotonic_fn: MonotonicFn = time.monotonic,
+    ) -> None:
+        self._monotonic = monotonic_fn
         self._global = SlidingWindowRateLimiter(global_per_minute, 60)
-        self._plugin_per_minute = plugin_per_minute
-        self._per_plugin: dict[str, SlidingWindowRateLimiter] = {}
+        # A plugin's window is created on first use; every later lookup is a single subscript.
+        self._per_plugin: defaultdict[str, SlidingWindowRateLimiter] = defaultdict(
+            partial(SlidingWindowRateLimiter, plugin_per_minute, 60)
+        )
 
     def _limiter_for(self, plugin: str) -> SlidingWindowRateLimiter:
-        limiter = self._per_plugin.get(plugin)
-        if limiter is None:
-            limiter = SlidingWindowRateLimiter(self._plugin_per_minute, 60)
-            self._per_plugin[plugin] = limiter
-        return limiter
+        return self._per_plugin[plugin]
 
     def allow(self, plugin: str) -> bool:
         # Atomic: only record the global event when the plugin bucket can also accept it.
-        now = time.monotonic()
+        now = self._monotonic()
         limiter = self._limiter_for(plugin)
         if not self._global.can_allow_at(now) or not limiter.can_allow_at(now):
             return False
@@ -68,6 +84,6 @@ class RateLimiter:
         return True
 
     def next_allowed_in(self, plugin: str) -> float:
-        now = time.monotonic()
+        now = self._monotonic()
         limiter = self._limiter_for(plugin)
         return max(self._global.next_allowed_in_at(now), limiter.next_allowed_in_at(now))
@@ -50,6 +50,28 @@ class ReliableSender:
             return max(self._min_interval_seconds, float(seconds) + 1.0)
         return max(self._min_interval_seconds, 5.0)
 
+    def _log_sent(
+        self,
+        text: str,
+        *,
+        identity_key: str | None,
+        reply_to_msg_id: int | None,
+        dry_run: bool,
+    ) -> None:
+        # Every send ends here; only build the prefix when the ">>" record will be emitted.
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
+        identity_prefix = f"[{identity_key}] " if identity_key else ""
+        if reply_to_msg_id is None:
+            self._logger.info(">> %s%s (dry-run)" if dry_run else ">> %s%s", identity_prefix, text)
+        else:
+            self._logger.info(
+                ">> %s%s (reply_to=%s, dry-run)" if dry_run else ">> %s%s (reply_to=%s)",
+                identity_prefix,
+                text,
+                reply_to_msg_id,
+            )
+
     async def send(
         self,
         plugin: str,
@@ -60,12 +82,8 @@ class ReliableSender:
         identity_key: str | None = None,
         send_as: str | None = None,
     ) -> int | None:
-        identity_prefix = f"[{identity_key}] " if identity_key else ""
         if self._dry_run:
-            if reply_to_msg_id is None:
-                self._logger.info(">> %s%s (dry-run)", identity_prefix, text)
-            else:
-                self._logger.info(">> %s%s (reply_to=%s, dry-run)", identity_prefix, text, reply_to_msg_id)
+            self._log_sent(text, identity_key=identity_key, reply_to_msg_id=reply_to_msg_id, dry_run=True)
             return None
 
         async with self._lock:
@@ -134,8 +152,5 @@ class ReliableSender:
                     await self._sleep(wait_seconds)
                     continue
 
-                if reply_to_msg_id is None:
-                    self._logger.info(">> %s%s", identity_prefix, text)
-                else:
-                    self._logger.info(">> %s%s (reply_to=%s)", identity_prefix, text, reply_to_msg_id)
+                self._log_sent(text, identity_key=identity_key, reply_to_msg_id=reply_to_msg_id, dry_run=False)
                 return mid
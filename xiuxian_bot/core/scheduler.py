@@ -1,55 +1,125 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
+
+Action = Callable[[], Awaitable[None]]
 
 
 class Scheduler:
+    # Only ever used from one event loop, and none of the bookkeeping below awaits,
+    # so no lock is needed.
+    #
+    # Pending actions are plain heap entries behind a single loop timer armed for the
+    # earliest deadline; a task is only created once an action is due. Re-scheduling a
+    # key tombstones its pending entry (the heap is never searched) and cancels the
+    # action if it is currently running.
     def __init__(self, logger: logging.Logger) -> None:
         self._logger = logger
+        self._heap: list[tuple[float, int, str, Action]] = []
+        # key -> seq of its live heap entry; anything else in the heap is a tombstone.
+        self._pending: dict[str, int] = {}
+        self._seq = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_due = 0.0
+        # key -> task of an action that is currently running.
         self._tasks: dict[str, asyncio.Task[None]] = {}
-        self._lock = asyncio.Lock()
 
     async def schedule(
         self,
         *,
         key: str,
         delay_seconds: float,
-        action: Callable[[], Awaitable[None]],
+        action: Action,
     ) -> None:
-        async with self._lock:
-            old = self._tasks.get(key)
-            if old is not None:
-                old.cancel()
-            task = asyncio.create_task(self._run(key, delay_seconds, action))
-            self._tasks[key] = task
-
-    async def _run(
+        loop = asyncio.get_running_loop()
+        self._replace(loop, key, delay_seconds, action)
+        self._arm(loop)
+
+    async def schedule_many(self, items: Iterable[tuple[str, float, Action]]) -> None:
+        # Batch of (key, delay_seconds, action); later items win on duplicate keys.
+        loop = asyncio.get_running_loop()
+        for key, delay_seconds, action in items:
+            self._replace(loop, key, delay_seconds, action)
+        self._arm(loop)
+
+    def _replace(
         self,
+        loop: asyncio.AbstractEventLoop,
         key: str,
         delay_seconds: float,
-        action: Callable[[], Awaitable[None]],
+        action: Action,
     ) -> None:
+        running = self._tasks.pop(key, None)
+        if running is not None:
+            running.cancel()
+        self._seq += 1
+        self._pending[key] = self._seq
+        heapq.heappush(self._heap, (loop.time() + max(0.0, delay_seconds), self._seq, key, action))
+        # Keys that keep getting pushed out leave a tombstone each time; drop them once they dominate.
+        if len(self._heap) > 2 * len(self._pending):
+            pending = self._pending
+            self._heap = [entry for entry in self._heap if pending.get(entry[2]) == entry[1]]
+            heapq.heapify(self._heap)
+
+    def _arm(self, loop: asyncio.AbstractEventLoop) -> None:
+        if not self._heap:
+            return
+        due = self._heap[0][0]
+        if self._timer is not None:
+            if self._timer_due <= due:
+                return
+            self._timer.cancel()
+        self._timer = loop.call_at(due, self._fire_due, loop)
+        self._timer_due = due
+
+    def _fire_due(self, loop: asyncio.AbstractEventLoop) -> None:
+        # The loop may run a timer a hair before its deadline; treat the armed deadline as reached.
+        now = max(loop.time(), self._timer_due)
+        self._timer = None
+        heap = self._heap
+        due: list[tuple[str, Action]] = []
+        while heap and heap[0][0] <= now:
+            _, seq, key, action = heapq.heappop(heap)
+            if self._pending.get(key) != seq:
+                continue
+            del self._pending[key]
+            due.append((key, action))
+        # Start tasks only after the sweep: an eager task that re-schedules itself with no delay
+        # waits for the next timer instead of being picked up again by this loop.
+        for key, action in due:
+            if key in self._pending:
+                # Re-scheduled by an action that already ran in this batch; the newer entry wins.
+                continue
+            task = loop.create_task(self._run(key, action))
+            # An eager task factory may already have finished it.
+            if not task.done():
+                self._tasks[key] = task
+        self._arm(loop)
+
+    async def _run(self, key: str, action: Action) -> None:
         try:
-            await asyncio.sleep(delay_seconds)
             await action()
         except asyncio.CancelledError:
             return
         except Exception:
             self._logger.exception("scheduled_action_failed key=%s", key)
         finally:
-            async with self._lock:
-                task = self._tasks.get(key)
-                if task is not None and task.done():
-                    self._tasks.pop(key, None)
+            # Only drop the entry if it was not re-scheduled (possibly by `action` itself) meanwhile.
+            if self._tasks.get(key) is asyncio.current_task():
+                self._tasks.pop(key, None)
 
     async def cancel_all(self) -> None:
-        async with self._lock:
-            tasks = list(self._tasks.values())
-            self._tasks.clear()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._heap.clear()
+        self._pending.clear()
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
         for task in tasks:
             task.cancel()
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
-
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import re
+
+
+# "(剩余: 1小时2分钟)" suffix on garden plot / observatory disk lines.
+REMAINING_RE = re.compile(r"[（(]\s*剩余\s*[:：]\s*([^)）]+?)\s*[)）]")
+_DURATION_RE = re.compile(r"(\d+)\s*(天|小时|分钟|秒)")
+_UNIT_SECONDS = {"天": 86400, "小时": 3600, "分钟": 60, "秒": 1}
+
+# Per-unit patterns for the plugins' own duration helpers, which take the first amount of each unit.
+DAYS_RE = re.compile(r"(\d+)\s*天")
+HOURS_RE = re.compile(r"(\d+)\s*小时")
+MINUTES_RE = re.compile(r"(\d+)\s*(?:分钟|分)")
+SECONDS_RE = re.compile(r"(\d+)\s*秒")
+
+
+def parse_duration_seconds(raw: str) -> int | None:
+    """Parse '1天2小时3分钟4秒' (any subset of units) into seconds."""
+
+    raw = raw.strip()
+    if not raw:
+        return None
+
+    # One scan over the text; like separate per-unit searches, the first amount of each unit wins.
+    amounts: dict[str, int] = {}
+    for match in _DURATION_RE.finditer(raw):
+        amounts.setdefault(match.group(2), int(match.group(1)))
+        if len(amounts) == len(_UNIT_SECONDS):
+            break
+    total = sum(amount * _UNIT_SECONDS[unit] for unit, amount in amounts.items())
+    return total if total > 0 else None
@@ -1,10 +1,14 @@
 import re
 
 
+_MIN_RE = re.compile(r"(\d+)\s*分钟")
+_MIN_SEC_RE = re.compile(r"(\d+)\s*(分钟|秒)")
+
+
 def parse_biguan_cooldown_minutes(text: str) -> int | None:
     """Parse '打坐调息 N 分钟' -> N."""
 
-    match = re.search(r"(\d+)\s*分钟", text)
+    match = _MIN_RE.search(text)
     if not match:
         return None
     try:
@@ -17,14 +21,19 @@ def parse_biguan_cooldown_minutes(text: str) -> int | None:
 def parse_lingqi_cooldown_seconds(text: str) -> int | None:
     """Parse '灵气尚未平复' cooldown like '10分钟8秒' or '18秒' -> total seconds."""
 
-    match_min = re.search(r"(\d+)\s*分钟", text)
-    minutes = int(match_min.group(1)) if match_min else 0
-
-    match_sec = re.search(r"(\d+)\s*秒", text)
-    seconds = int(match_sec.group(1)) if match_sec else 0
+    # One scan; like separate searches, the first amount of each unit wins.
+    minutes: int | None = None
+    seconds: int | None = None
+    for match in _MIN_SEC_RE.finditer(text):
+        if match.group(2) == "秒":
+            if seconds is None:
+                seconds = int(match.group(1))
+        elif minutes is None:
+            minutes = int(match.group(1))
+        if minutes is not None and seconds is not None:
+            break
 
-    total = minutes * 60 + seconds
     # Distinguish "0秒" (valid, should trigger an immediate retry) from "no time info".
-    if match_min is None and match_sec is None:
+    if minutes is None and seconds is None:
         return None
-    return total
+    return (minutes or 0) * 60 + (seconds or 0)
@@ -2,54 +2,59 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
+from ._duration import REMAINING_RE, parse_duration_seconds
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class XinggongObservatoryStatus:
     total_disks: int | None
-    idle_disks: list[int]
-    abnormal_disks: list[int]
-    collectable_disks: list[int]
+    idle_disks: tuple[int, ...]
+    abnormal_disks: tuple[int, ...]
+    collectable_disks: tuple[int, ...]
     # Min time-to-finish (seconds) from any disk line that contains "(剩余: ...)".
     min_remaining_seconds: int | None = None
 
 
 _TOTAL_RE = re.compile(r"引\s*\[?\s*星盘总数\s*[:：]\s*(\d+)\s*座")
-_DISK_RE = re.compile(
-    r"(\d+)\s*号\s*引\s*\[?\s*星盘\s*[:：]\s*(.+?)(?=(?:\d+\s*号\s*引\s*\[?\s*星盘\s*[:：])|$)",
-    re.S,
-)
-_REMAINING_RE = re.compile(r"[（(]\s*剩余\s*[:：]\s*([^)）]+?)\s*[)）]")
-
-
-def _parse_duration_seconds(raw: str) -> int | None:
-    raw = raw.strip()
-    if not raw:
-        return None
-
-    def _pick(unit: str) -> int:
-        match = re.search(rf"(\d+)\s*{unit}", raw)
-        return int(match.group(1)) if match else 0
-
-    days = _pick("天")
-    hours = _pick("小时")
-    minutes = _pick("分钟")
-    seconds = _pick("秒")
-
-    total = days * 86400 + hours * 3600 + minutes * 60 + seconds
-    return total if total > 0 else None
+# Splitting on the disk headers yields [preamble, idx, body, idx, body, ...] in one linear pass;
+# each body runs up to the next header or the end of the text.
+_DISK_HEADER_RE = re.compile(r"(\d+)\s*号\s*引\s*\[?\s*星盘\s*[:：]")
+# Disk-state keyword -> category; one alternation scan per disk body instead of one `in` per keyword.
+_DISK_STATE_TOKENS = {
+    "空闲": "idle",
+    "元磁紊乱": "abnormal",
+    "星光黯淡": "abnormal",
+    "狂暴": "abnormal",
+    "紊乱": "abnormal",
+    "异常": "abnormal",
+    "已凝聚": "collectable",
+    "凝聚完成": "collectable",
+    "已成形": "collectable",
+    "可收集": "collectable",
+    "精华": "collectable",
+}
+_DISK_STATE_RE = re.compile("|".join(map(re.escape, sorted(_DISK_STATE_TOKENS, key=len, reverse=True))))
 
 
 def parse_xinggong_observatory(text: str) -> XinggongObservatoryStatus | None:
     """Parse '.观星台' response into coarse flags for automation.
 
     The game text may evolve; this parser is intentionally conservative and
-    keyword-based to avoid mis-triggering.
+    keyword-based to avoid mis-triggering. Results are memoized like
+    parse_garden_status, since re-polled replies often repeat verbatim; the
+    status and its disk tuples are immutable, so sharing them is safe.
     """
 
+    # Gate outside the cache so unrelated messages never take a cache slot.
     if "观星台" not in text:
         return None
+    return _parse_xinggong_observatory(text)
 
+
+@lru_cache(maxsize=32)
+def _parse_xinggong_observatory(text: str) -> XinggongObservatoryStatus | None:
     total_disks: int | None = None
     total_match = _TOTAL_RE.search(text)
     if total_match:
@@ -64,34 +69,37 @@ def parse_xinggong_observatory(text: str) -> XinggongObservatoryStatus | None:
     min_remaining_seconds: int | None = None
 
     matched_disk = False
-    for match in _DISK_RE.finditer(text):
+    parts = _DISK_HEADER_RE.split(text)
+    for raw_idx, raw_body in zip(parts[1::2], parts[2::2]):
+        if not raw_body:
+            continue
         matched_disk = True
         try:
-            idx = int(match.group(1))
+            idx = int(raw_idx)
         except ValueError:
             continue
-        body = match.group(2)
-        body = re.sub(r"\s+", " ", body).strip()
+        body = " ".join(raw_body.split())
         if not body:
             continue
 
-        if "空闲" in body:
+        states = {_DISK_STATE_TOKENS[state.group()] for state in _DISK_STATE_RE.finditer(body)}
+        if "idle" in states:
             idle.append(idx)
             continue
 
-        if any(k in body for k in ("元磁紊乱", "星光黯淡", "狂暴", "紊乱", "异常")):
+        if "abnormal" in states:
             abnormal.append(idx)
             continue
 
-        rem_match = _REMAINING_RE.search(body)
+        rem_match = REMAINING_RE.search(body)
         if rem_match:
-            rem_seconds = _parse_duration_seconds(rem_match.group(1))
+            rem_seconds = parse_duration_seconds(rem_match.group(1))
             if rem_seconds is not None and (min_remaining_seconds is None or rem_seconds < min_remaining_seconds):
                 min_remaining_seconds = rem_seconds
             continue
 
         # Heuristic: if it's neither idle/abnormal/collecting, it might be ready for collection.
-        if any(k in body for k in ("已凝聚", "凝聚完成", "已成形", "可收集", "精华")):
+        if "collectable" in states:
             collectable.append(idx)
 
     # Fallback: if we can't match any disk lines, still return a minimal status so the caller can avoid actions.
@@ -100,9 +108,9 @@ def parse_xinggong_observatory(text: str) -> XinggongObservatoryStatus | None:
 
     return XinggongObservatoryStatus(
         total_disks=total_disks,
-        idle_disks=sorted(set(idle)),
-        abnormal_disks=sorted(set(abnormal)),
-        collectable_disks=sorted(set(collectable)),
+        idle_disks=tuple(sorted(set(idle))),
+        abnormal_disks=tuple(sorted(set(abnormal))),
+        collectable_disks=tuple(sorted(set(collectable))),
         min_remaining_seconds=min_remaining_seconds,
     )
 
@@ -33,6 +33,10 @@ class AutoBiguanPlugin:
         self._next_attempt_at: datetime | None = None
         self._pending_feedback_deadline_at: datetime | None = None
         self._deep_until_at: datetime | None = None
+        # Own RNG and fixed jitter bounds: no shared module-level Random, no config lookups per reply.
+        self._rng = random.Random()
+        self._retry_jitter = (config.biguan_retry_jitter_min_seconds, config.biguan_retry_jitter_max_seconds)
+        self._cooldown_jitter = (config.biguan_cooldown_jitter_min_seconds, config.biguan_cooldown_jitter_max_seconds)
 
     def set_state_store(self, state_store: SQLiteStateStore) -> None:
         self._state_store = state_store
@@ -206,19 +210,14 @@ class AutoBiguanPlugin:
         if self._mode == "deep":
             return None
         text = ctx.text
+        # Every branch below needs the message to be about us; check once, the flag before the scan.
+        if not ctx.is_effective_reply and self._config.my_name not in text:
+            return None
 
         # 0) 奇遇：闭关冷却被重置 -> 立即再次闭关
-        if (
-            "冷却时间" in text
-            and "重置" in text
-            and "闭关" in text
-            and (self._config.my_name in text or ctx.is_effective_reply)
-        ):
+        if "冷却时间" in text and "重置" in text and "闭关" in text:
             self._clear_pending_feedback()
-            delay_seconds = random.randint(
-                self._config.biguan_retry_jitter_min_seconds,
-                self._config.biguan_retry_jitter_max_seconds,
-            )
+            delay_seconds = self._rng.randint(*self._retry_jitter)
             self._logger.debug(
                 "biguan_reset_cooldown delay_seconds=%s reply_to_me=%s",
                 delay_seconds,
@@ -227,7 +226,7 @@ class AutoBiguanPlugin:
             return await self._arm_next(float(delay_seconds))
 
         # 1) 正常闭关冷却：打坐调息 N 分钟
-        if "打坐调息" in text and (self._config.my_name in text or ctx.is_effective_reply):
+        if "打坐调息" in text:
             minutes = parse_biguan_cooldown_minutes(text)
             if minutes is None:
                 return None
@@ -236,10 +235,7 @@ class AutoBiguanPlugin:
             delay_seconds = (
                 minutes * 60
                 + self._config.biguan_extra_buffer_seconds
-                + random.randint(
-                    self._config.biguan_cooldown_jitter_min_seconds,
-                    self._config.biguan_cooldown_jitter_max_seconds,
-                )
+                + self._rng.randint(*self._cooldown_jitter)
             )
 
             self._logger.debug(
@@ -251,16 +247,13 @@ class AutoBiguanPlugin:
             return await self._arm_next(float(delay_seconds))
 
         # 2) 操作太频繁：灵气尚未平复 N分M秒
-        if "灵气尚未平复" in text and (self._config.my_name in text or ctx.is_effective_reply):
+        if "灵气尚未平复" in text:
             total_seconds = parse_lingqi_cooldown_seconds(text)
             if total_seconds is None:
                 return None
 
             self._clear_pending_feedback()
-            delay_seconds = total_seconds + random.randint(
-                self._config.biguan_retry_jitter_min_seconds,
-                self._config.biguan_retry_jitter_max_seconds,
-            )
+            delay_seconds = total_seconds + self._rng.randint(*self._retry_jitter)
 
             self._logger.debug(
                 "biguan_retry total_seconds=%s delay_seconds=%s reply_to_me=%s",
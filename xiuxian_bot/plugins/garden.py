@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from datetime import datetime, timedelta
 from typing import Awaitable, Callable
 
@@ -12,6 +13,25 @@ from ..domain.garden import parse_garden_status
 
 SendFn = Callable[[str, str, bool], Awaitable[int | None]]
 
+# Reply keywords as bits: one alternation scan per message tells on_message which branch applies.
+_NO_IDLE = 1
+_SHORTAGE = 2
+_SEED = 4
+_SOW_OK = 8
+_HARVEST_OK = 16
+_STATUS = 32
+_REPLY_TOKENS = {
+    "你的药园中已无空闲的灵田": _NO_IDLE,
+    "数量不足": _SHORTAGE,
+    "种子": _SEED,
+    "播种成功": _SOW_OK,
+    "一键采药完成": _HARVEST_OK,
+    # Same markers parse_garden_status gates on.
+    "小药园": _STATUS,
+    "灵田总数": _STATUS,
+}
+_REPLY_RE = re.compile("|".join(map(re.escape, _REPLY_TOKENS)))
+
 
 class AutoGardenPlugin:
     """自动种植（小药园）。
@@ -36,6 +56,16 @@ class AutoGardenPlugin:
         self._config = config
         self._logger = logger
         self.enabled = config.enable_garden
+        # The seed name is fixed for this plugin's lifetime; build the sow command once.
+        self._cmd_sow = f".播种 {config.garden_seed_name}"
+        # Every field of the post-harvest sow is fixed by config; SendAction is frozen, so share one instance.
+        self._sow_after_harvest = SendAction(
+            plugin=self.name,
+            text=self._cmd_sow,
+            reply_to_topic=True,
+            delay_seconds=float(config.garden_action_spacing_seconds),
+            key="garden.action.sow",
+        )
         self._scheduler: Scheduler | None = None
         self._send: SendFn | None = None
         self._state_store: SQLiteStateStore | None = None
@@ -77,9 +107,6 @@ class AutoGardenPlugin:
             },
         )
 
-    def _sow_cmd(self) -> str:
-        return f".播种 {self._config.garden_seed_name}"
-
     def _next_poll_delay_seconds(self, status) -> float:
         base = float(self._config.garden_poll_interval_seconds)
         if status.min_remaining_seconds is None:
@@ -129,13 +156,19 @@ class AutoGardenPlugin:
         if text.startswith("."):
             return None
 
+        mask = 0
+        for match in _REPLY_RE.finditer(text):
+            mask |= _REPLY_TOKENS[match.group()]
+        if not mask:
+            return None
+
         # ---- Command replies (heuristic, keyword-based) ----
-        if "你的药园中已无空闲的灵田" in text:
+        if mask & _NO_IDLE:
             self._sow_blocked_no_idle = True
             self._save_state()
             return None
 
-        if "数量不足" in text and "种子" in text:
+        if mask & _SHORTAGE and mask & _SEED:
             self._seed_insufficient = True
             if not self._seed_insufficient_warned:
                 self._seed_insufficient_warned = True
@@ -147,28 +180,22 @@ class AutoGardenPlugin:
             self._save_state()
             return None
 
-        if "播种成功" in text:
+        if mask & _SOW_OK:
             self._sow_blocked_no_idle = False
             self._save_state()
             return None
 
-        if "一键采药完成" in text:
+        if mask & _HARVEST_OK:
             # Harvesting usually creates idle plots right away, so try sowing once.
             self._sow_blocked_no_idle = False
             self._save_state()
             if self._seed_insufficient:
                 return None
-            return [
-                SendAction(
-                    plugin=self.name,
-                    text=self._sow_cmd(),
-                    reply_to_topic=True,
-                    delay_seconds=float(self._config.garden_action_spacing_seconds),
-                    key="garden.action.sow",
-                )
-            ]
+            return [self._sow_after_harvest]
 
         # ---- Status reply (.小药园) ----
+        if not mask & _STATUS:
+            return None
         status = parse_garden_status(text)
         if status is None:
             return None
@@ -255,7 +282,7 @@ class AutoGardenPlugin:
             actions.append(
                 SendAction(
                     plugin=self.name,
-                    text=self._sow_cmd(),
+                    text=self._cmd_sow,
                     reply_to_topic=True,
                     delay_seconds=delay,
                     key="garden.action.sow",
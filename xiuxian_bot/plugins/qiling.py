@@ -10,6 +10,7 @@ from ..config import Config
 from ..core.contracts import MessageContext, SendAction
 from ..core.scheduler import Scheduler
 from ..core.state_store import SQLiteStateStore, deserialize_datetime, serialize_datetime
+from ..domain._duration import DAYS_RE, HOURS_RE, MINUTES_RE, SECONDS_RE
 
 SendFn = Callable[[str, str, bool], Awaitable[int | None]]
 NowFn = Callable[[], datetime]
@@ -365,18 +366,18 @@ class QilingPlugin:
     def _parse_duration_seconds(self, text: str) -> int | None:
         matched = False
 
-        def _pick(pattern: str) -> int:
+        def _pick(pattern: re.Pattern[str]) -> int:
             nonlocal matched
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             if match is None:
                 return 0
             matched = True
             return int(match.group(1))
 
-        days = _pick(r"(\d+)\s*天")
-        hours = _pick(r"(\d+)\s*小时")
-        minutes = _pick(r"(\d+)\s*(?:分钟|分)")
-        seconds = _pick(r"(\d+)\s*秒")
+        days = _pick(DAYS_RE)
+        hours = _pick(HOURS_RE)
+        minutes = _pick(MINUTES_RE)
+        seconds = _pick(SECONDS_RE)
         if not matched:
             return None
         return days * 86400 + hours * 3600 + minutes * 60 + seconds
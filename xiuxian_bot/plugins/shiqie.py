@@ -7,6 +7,7 @@ from typing import Awaitable, Callable, Literal
 from ..config import Config
 from ..core.contracts import MessageContext, SendAction
 from ..core.scheduler import Scheduler
+from ..domain._duration import DAYS_RE, HOURS_RE, MINUTES_RE, SECONDS_RE
 
 SendFn = Callable[[str, str, bool], Awaitable[int | None]]
 CommandKind = Literal["tianji", "rumeng"]
@@ -84,18 +85,18 @@ class ShiqiePlugin:
     def _parse_duration_seconds(self, text: str) -> int | None:
         matched = False
 
-        def _pick(pattern: str) -> int:
+        def _pick(pattern: re.Pattern[str]) -> int:
             nonlocal matched
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             if match is None:
                 return 0
             matched = True
             return int(match.group(1))
 
-        days = _pick(r"(\d+)\s*天")
-        hours = _pick(r"(\d+)\s*小时")
-        minutes = _pick(r"(\d+)\s*(?:分钟|分)")
-        seconds = _pick(r"(\d+)\s*秒")
+        days = _pick(DAYS_RE)
+        hours = _pick(HOURS_RE)
+        minutes = _pick(MINUTES_RE)
+        seconds = _pick(SECONDS_RE)
         if not matched:
             return None
         return days * 86400 + hours * 3600 + minutes * 60 + seconds
@@ -15,9 +15,12 @@ from ..core.state_store import (
     serialize_date,
     serialize_datetime,
 )
+from ..domain._duration import parse_duration_seconds
 from ..domain.text_normalizer import normalize_match_text
 from ..domain.xinggong import parse_xinggong_observatory
 
+_ONE_DAY = timedelta(days=1)
+
 
 class AutoXinggongPlugin:
     """星宫自动化：观星台 + 周天星斗大阵 + 观星劫持。"""
@@ -47,6 +50,11 @@ class AutoXinggongPlugin:
     _STATUS_REPLY_WINDOW_SECONDS = 120
     _GUANXING_VALID_SECONDS = 300
     _GUANXING_SHIFT_EXECUTION_GRACE_SECONDS = 1.0
+    # Fixed windows checked on the message path, built once.
+    _QIZHEN_FEEDBACK_WINDOW = timedelta(seconds=_QIZHEN_FEEDBACK_WINDOW_SECONDS)
+    _GUANXING_VALID = timedelta(seconds=_GUANXING_VALID_SECONDS)
+    _GUANXING_SHIFT_EXECUTION_GRACE = timedelta(seconds=_GUANXING_SHIFT_EXECUTION_GRACE_SECONDS)
+    _GUANXING_PERIOD = timedelta(hours=3)
     _GUANXING_PREVIEW_ANCHOR = normalize_match_text("星盘显化")
     _GUANXING_NEXT_EVOLUTION_ANCHOR = normalize_match_text("下一次天道演化")
     _GUANXING_DESTINY_ANCHOR = normalize_match_text("当前天命所归")
@@ -55,6 +63,9 @@ class AutoXinggongPlugin:
     _GUANXING_ORIGINAL_DESTINY_ANCHOR = normalize_match_text("原本将降临于")
     _GUANXING_FAILURE_ANCHOR = normalize_match_text("你今日已观星一次，天机不可多泄，请明日再来")
 
+    # Every 启阵/助阵/观星台 reply handled below contains one of these; one alternation scan finds any.
+    _REPLY_MARKER_RE = re.compile("启阵|助阵|周天星斗大阵|引星盘|星辰精华|观星台")
+
     _HHMM_RE = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*$")
 
     def __init__(self, config: Config, logger: logging.Logger) -> None:
@@ -85,8 +96,11 @@ class AutoXinggongPlugin:
         self._guanxing_watch_event_keys = tuple(
             normalize_match_text(event_name) for event_name in self._guanxing_watch_events
         )
+        # "@name" as matched against normalized message text; the config never changes.
+        self._my_tag_key = normalize_match_text(self._normalize_username(config.my_name))
 
         self._qizhen_hm = self._parse_hhmm(config.xinggong_qizhen_start_time)
+        self._cycle_window: tuple[datetime, datetime] | None = None
         self._qizhen_retry_seconds = max(30, int(config.xinggong_qizhen_retry_interval_seconds))
         self._qizhen_second_offset_seconds = max(0, int(config.xinggong_qizhen_second_offset_seconds))
 
@@ -218,12 +232,6 @@ class AutoXinggongPlugin:
             },
         )
 
-    def _my_tag(self) -> str:
-        name = self._config.my_name.strip()
-        if not name:
-            return ""
-        return name if name.startswith("@") else f"@{name}"
-
     def _identity_match_tokens(self, identity) -> tuple[str, ...]:  # type: ignore[no-untyped-def]
         tokens: list[str] = []
         for value in (
@@ -243,7 +251,7 @@ class AutoXinggongPlugin:
         return any(token and token in normalized_text for token in self._identity_match_tokens(identity))
 
     def _matches_active_identity_text(self, normalized_text: str) -> bool:
-        my_tag = normalize_match_text(self._my_tag())
+        my_tag = self._my_tag_key
         return (
             bool(my_tag and my_tag in normalized_text)
             or self._matches_identity_text(normalized_text, self._config.active_identity)
@@ -270,16 +278,19 @@ class AutoXinggongPlugin:
         return hour, minute
 
     def _cycle_date_for(self, now: datetime) -> date:
-        hh, mm = self._qizhen_hm
-        start_today = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
-        if now < start_today:
-            return (start_today - timedelta(days=1)).date()
-        return start_today.date()
+        return self._cycle_start_dt(now).date()
 
     def _cycle_start_dt(self, now: datetime) -> datetime:
+        # Every message and loop run asks for the current cycle; reuse its [start, next start) window.
+        window = self._cycle_window
+        if window is not None and window[0] <= now < window[1]:
+            return window[0]
         hh, mm = self._qizhen_hm
-        cycle_date = self._cycle_date_for(now)
-        return now.replace(year=cycle_date.year, month=cycle_date.month, day=cycle_date.day, hour=hh, minute=mm, second=0, microsecond=0)
+        start = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
+        if now < start:
+            start -= _ONE_DAY
+        self._cycle_window = (start, start + _ONE_DAY)
+        return start
 
     def _sanitize_restored_state(self) -> None:
         now = datetime.now()
@@ -340,12 +351,12 @@ class AutoXinggongPlugin:
         aligned = now.replace(minute=0, second=0, microsecond=0)
         next_hour = ((aligned.hour // 3) + 1) * 3
         if next_hour >= 24:
-            aligned = aligned + timedelta(days=1)
+            aligned = aligned + _ONE_DAY
             next_hour = 0
         return aligned.replace(hour=next_hour)
 
     def _guanxing_window_start(self, settlement_at: datetime) -> datetime:
-        return settlement_at - timedelta(hours=3)
+        return settlement_at - self._GUANXING_PERIOD
 
     def _guanxing_shift_at(self, settlement_at: datetime | None = None) -> datetime | None:
         target = settlement_at or self._guanxing_settlement_at
@@ -360,7 +371,7 @@ class AutoXinggongPlugin:
         shift_at = self._guanxing_shift_at(target)
         if shift_at is None or shift_at <= target:
             return target
-        return shift_at + timedelta(seconds=self._GUANXING_SHIFT_EXECUTION_GRACE_SECONDS)
+        return shift_at + self._GUANXING_SHIFT_EXECUTION_GRACE
 
     def _clear_guanxing_claim_state(self) -> None:
         self._guanxing_claim_active = False
@@ -390,7 +401,7 @@ class AutoXinggongPlugin:
     def _should_ignore_external_guanxing_preview(self, now: datetime) -> bool:
         settlement_at = self._next_guanxing_settlement_at(now)
         window_start = self._guanxing_window_start(settlement_at)
-        return now < (window_start + timedelta(seconds=self._GUANXING_VALID_SECONDS))
+        return now < (window_start + self._GUANXING_VALID)
 
     def _is_guanxing_preview(self, text: str) -> bool:
         normalized = normalize_match_text(text)
@@ -464,20 +475,7 @@ class AutoXinggongPlugin:
 
     def _parse_duration_seconds(self, text: str) -> int | None:
         # Parse "2小时16分钟27秒" into seconds.
-        text = (text or "").strip()
-        if not text:
-            return None
-
-        def _pick(unit: str) -> int:
-            match = re.search(rf"(\d+)\s*{unit}", text)
-            return int(match.group(1)) if match else 0
-
-        days = _pick("天")
-        hours = _pick("小时")
-        minutes = _pick("分钟")
-        seconds = _pick("秒")
-        total = days * 86400 + hours * 3600 + minutes * 60 + seconds
-        return total if total > 0 else None
+        return parse_duration_seconds(text or "")
 
     def _infer_qizhen_success_at(self, now: datetime, remaining_cooldown_seconds: int) -> datetime:
         elapsed_seconds = max(0, self._QIZHEN_COOLDOWN_SECONDS - remaining_cooldown_seconds)
@@ -528,7 +526,7 @@ class AutoXinggongPlugin:
             return False
         if self._qizhen_last_sent_at is None:
             return False
-        return (now - self._qizhen_last_sent_at) <= timedelta(seconds=self._QIZHEN_FEEDBACK_WINDOW_SECONDS)
+        return (now - self._qizhen_last_sent_at) <= self._QIZHEN_FEEDBACK_WINDOW
 
     def _clear_qizhen_existing_invite_wait(self) -> None:
         self._qizhen_existing_invite_until = None
@@ -908,7 +906,7 @@ class AutoXinggongPlugin:
             await self._schedule_qizhen_loop((self._qizhen_next_cycle_at - now).total_seconds())
             return
 
-        next_cycle_start = cycle_start + timedelta(days=1)
+        next_cycle_start = cycle_start + _ONE_DAY
         await self._schedule_qizhen_loop(max(0.0, (next_cycle_start - now).total_seconds()))
 
     async def on_message(self, ctx: MessageContext) -> list[SendAction] | None:
@@ -927,9 +925,7 @@ class AutoXinggongPlugin:
         if self._guanxing_enabled:
             if self._is_own_guanxing_preview(ctx, text):
                 self._guanxing_own_preview_msg_id = ctx.message_id
-                self._guanxing_window_expires_at = now + timedelta(
-                    seconds=self._GUANXING_VALID_SECONDS
-                )
+                self._guanxing_window_expires_at = now + self._GUANXING_VALID
                 self._save_state()
                 return None
 
@@ -948,6 +944,10 @@ class AutoXinggongPlugin:
                     await self._register_guanxing_claim(now, matched_event)
                 return None
 
+        # Unrelated chat stops here, unless a deep-biguan status reply (any wording) is awaited.
+        if self._deep_biguan_status_reason is None and self._REPLY_MARKER_RE.search(text) is None:
+            return None
+
         # ---- 周天星斗大阵：成功/邀请/助阵冷却 ----
         normalized_text = normalize_match_text(text)
         if "再次启阵" in text and "请在" in text:
@@ -9,6 +9,7 @@ from ..config import Config
 from ..core.contracts import MessageContext, SendAction
 from ..core.scheduler import Scheduler
 from ..core.state_store import SQLiteStateStore, deserialize_datetime, serialize_datetime
+from ..domain._duration import DAYS_RE, HOURS_RE, SECONDS_RE
 
 SendFn = Callable[[str, str, bool], Awaitable[int | None]]
 
@@ -31,6 +32,8 @@ class AutoYuanyingPlugin:
     _LIEFENG_SOURCE_INTERVAL = "interval"
     _LIEFENG_SOURCE_COOLDOWN = "cooldown"
     _LIEFENG_SOURCE_WEAKNESS = "weakness"
+    # Unlike the shared MINUTES_RE, only "分钟" counts as minutes here; a bare "分" is ignored.
+    _MINUTES_RE = re.compile(r"(\d+)\s*分钟")
 
     def __init__(self, config: Config, logger: logging.Logger) -> None:
         self._config = config
@@ -116,18 +119,18 @@ class AutoYuanyingPlugin:
     def _parse_duration_seconds(self, text: str) -> int | None:
         matched = False
 
-        def _pick(unit: str) -> int:
+        def _pick(pattern: re.Pattern[str]) -> int:
             nonlocal matched
-            match = re.search(rf"(\d+)\s*{unit}", text)
+            match = pattern.search(text)
             if match:
                 matched = True
                 return int(match.group(1))
             return 0
 
-        days = _pick("天")
-        hours = _pick("小时")
-        minutes = _pick("分钟")
-        seconds = _pick("秒")
+        days = _pick(DAYS_RE)
+        hours = _pick(HOURS_RE)
+        minutes = _pick(self._MINUTES_RE)
+        seconds = _pick(SECONDS_RE)
         if not matched:
             return None
         return days * 86400 + hours * 3600 + minutes * 60 + seconds
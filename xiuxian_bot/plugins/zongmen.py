@@ -7,13 +7,14 @@ from typing import Awaitable, Callable
 
 from ..config import Config
 from ..core.contracts import MessageContext, SendAction
-from ..core.scheduler import Scheduler
+from ..core.scheduler import Action, Scheduler
 from ..core.state_store import (
     SQLiteStateStore,
     deserialize_date,
     serialize_date,
 )
 
+_ONE_DAY = timedelta(days=1)
 
 SendFn = Callable[[str, str, bool], Awaitable[int | None]]
 
@@ -26,6 +27,8 @@ class AutoZongmenPlugin:
 
     _HHMM_RE = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*$")
     _CG_COUNT_RE = re.compile(r"今日已传功\s*(\d+)\s*/\s*(\d+)\s*次")
+    # Every reply handled in on_message contains one of these.
+    _REPLY_MARKER_RE = re.compile("点卯|传功|神通")
 
     def __init__(self, config: Config, logger: logging.Logger) -> None:
         self._config = config
@@ -35,6 +38,7 @@ class AutoZongmenPlugin:
 
         self._cmd_dianmao = config.zongmen_cmd_dianmao.strip()
         self._cmd_chuangong = config.zongmen_cmd_chuangong.strip()
+        self._cmd_chuangong_key = self._normalize_cmd(self._cmd_chuangong)
         self._xinde_text = config.zongmen_chuangong_xinde_text.strip()
         self._catch_up = bool(config.zongmen_catch_up)
         self._spacing = max(0, int(config.zongmen_action_spacing_seconds))
@@ -126,7 +130,7 @@ class AutoZongmenPlugin:
     def _xinde_for_send(self) -> str:
         text = self._xinde_text or "今日修行心得：稳中求进。"
         # Defensive: avoid sending the command itself as the "valuable message".
-        if self._normalize_cmd(text) == self._normalize_cmd(self._cmd_chuangong):
+        if self._normalize_cmd(text) == self._cmd_chuangong_key:
             return f"心得：{text}"
         return text
 
@@ -141,23 +145,28 @@ class AutoZongmenPlugin:
             return (today_dt - now).total_seconds(), today_dt.date()
         if self._catch_up:
             return 0.0, today_dt.date()
-        next_dt = today_dt + timedelta(days=1)
+        next_dt = today_dt + _ONE_DAY
         return (next_dt - now).total_seconds(), next_dt.date()
 
-    def _next_occurrence(self, now: datetime, hour: int, minute: int) -> datetime:
+    def _next_occurrence(self, now: datetime, hour: int, minute: int) -> tuple[datetime, float]:
+        """Return (next_dt, delay_seconds) for the first occurrence strictly after `now`."""
+
         dt = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        if dt > now:
-            return dt
-        return dt + timedelta(days=1)
+        if dt <= now:
+            dt += _ONE_DAY
+        return dt, (dt - now).total_seconds()
 
     async def on_message(self, ctx: MessageContext) -> list[SendAction] | None:
         # Only observe replies to update local state; no direct actions here (scheduled elsewhere).
         text = (ctx.text or "").strip()
-        if not text:
+        if not text or self._REPLY_MARKER_RE.search(text) is None:
             return None
 
         now = datetime.now()
         self._reset_if_new_day(now)
+        # Nothing left to track until the next day reset.
+        if self._dianmao_done and (self._chuangong_disabled or self._chuangong_count >= 3):
+            return None
 
         if "点卯成功" in text or "今日已点卯" in text:
             self._dianmao_done = True
@@ -210,7 +219,7 @@ class AutoZongmenPlugin:
         if dianmao_delay == 0.0 and self._catch_up:
             dianmao_delay = offset
             offset += float(self._spacing)
-        await self._schedule_dianmao(scheduler, send, dianmao_date, dianmao_delay)
+        entries = [self._dianmao_entry(scheduler, send, dianmao_date, dianmao_delay)]
 
         if self._chuangong_enabled:
             for idx, (hh, mm) in enumerate(self._chuangong_hms, start=1):
@@ -218,7 +227,10 @@ class AutoZongmenPlugin:
                 if delay == 0.0 and self._catch_up:
                     delay = offset
                     offset += float(self._spacing)
-                await self._schedule_chuangong(scheduler, send, idx, occ_date, delay)
+                entries.append(self._chuangong_entry(scheduler, send, idx, occ_date, delay))
+
+        # Register all daily slots in one batch so the scheduler arms its timer once.
+        await scheduler.schedule_many(entries)
 
     async def _schedule_dianmao(
         self,
@@ -227,20 +239,25 @@ class AutoZongmenPlugin:
         occ_date: date,
         delay_seconds: float,
     ) -> None:
+        key, delay_seconds, action = self._dianmao_entry(scheduler, send, occ_date, delay_seconds)
+        await scheduler.schedule(key=key, delay_seconds=delay_seconds, action=action)
+
+    def _dianmao_entry(
+        self,
+        scheduler: Scheduler,
+        send,
+        occ_date: date,
+        delay_seconds: float,
+    ) -> tuple[str, float, Action]:
         key = f"zongmen.dianmao.{occ_date.strftime('%Y%m%d')}"
 
         async def _runner() -> None:
             await self._maybe_send_dianmao(send)
-            next_dt = self._next_occurrence(datetime.now(), *self._dianmao_hm)
-            await self._schedule_dianmao(
-                scheduler,
-                send,
-                next_dt.date(),
-                max(0.0, (next_dt - datetime.now()).total_seconds()),
-            )
+            next_dt, delay = self._next_occurrence(datetime.now(), *self._dianmao_hm)
+            await self._schedule_dianmao(scheduler, send, next_dt.date(), delay)
 
         self._logger.info("zongmen_scheduled key=%s delay_seconds=%s", key, delay_seconds)
-        await scheduler.schedule(key=key, delay_seconds=delay_seconds, action=_runner)
+        return key, delay_seconds, _runner
 
     async def _schedule_chuangong(
         self,
@@ -252,6 +269,21 @@ class AutoZongmenPlugin:
         *,
         is_retry: bool = False,
     ) -> None:
+        key, delay_seconds, action = self._chuangong_entry(
+            scheduler, send, slot, occ_date, delay_seconds, is_retry=is_retry
+        )
+        await scheduler.schedule(key=key, delay_seconds=delay_seconds, action=action)
+
+    def _chuangong_entry(
+        self,
+        scheduler: Scheduler,
+        send,
+        slot: int,
+        occ_date: date,
+        delay_seconds: float,
+        *,
+        is_retry: bool = False,
+    ) -> tuple[str, float, Action]:
         hh, mm = self._chuangong_hms[slot - 1]
         suffix = ".retry" if is_retry else ""
         key = f"zongmen.chuangong.{slot}.{occ_date.strftime('%Y%m%d')}{suffix}"
@@ -269,17 +301,11 @@ class AutoZongmenPlugin:
                     is_retry=True,
                 )
                 return
-            next_dt = self._next_occurrence(datetime.now(), hh, mm)
-            await self._schedule_chuangong(
-                scheduler,
-                send,
-                slot,
-                next_dt.date(),
-                max(0.0, (next_dt - datetime.now()).total_seconds()),
-            )
+            next_dt, delay = self._next_occurrence(datetime.now(), hh, mm)
+            await self._schedule_chuangong(scheduler, send, slot, next_dt.date(), delay)
 
         self._logger.info("zongmen_scheduled key=%s delay_seconds=%s", key, delay_seconds)
-        await scheduler.schedule(key=key, delay_seconds=delay_seconds, action=_runner)
+        return key, delay_seconds, _runner
 
     async def _maybe_send_dianmao(self, send) -> None:
         now = datetime.now()
@@ -3,7 +3,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
-from collections import deque
+from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -15,7 +16,7 @@ from .core.identity_switch import IdentitySwitchCoordinator, unique_best_identit
 from .core.message_archive_repository import MessageArchiveInput, MessageArchiveRepository
 from .core.rate_limit import RateLimiter
 from .core.reliable_sender import ReliableSender
-from .core.scheduler import Scheduler
+from .core.scheduler import Action, Scheduler
 from .core.state_store import SQLiteStateStore
 from .plugins.biguan import AutoBiguanPlugin
 from .plugins.chuangta import AutoChuangtaPlugin
@@ -49,16 +50,38 @@ class _FocusFilter(logging.Filter):
         )
 
 
-_WS_RE = re.compile(r"\s+")
 _GUANXING_EVENT_ANCHORS = (
     normalize_match_text("星盘显化"),
     normalize_match_text("天机异动"),
 )
 
 
+# Keywords that make a foreign message worth an "<<" log line.
+_INTERESTING_KEYWORDS = (
+    "周天星斗大阵",
+    "观星台",
+    "星盘显化",
+    "天机阁快报",
+    "天机异动",
+    "星移失败",
+)
+
+
+def _compile_keyword_scan(words: Iterable[str]) -> re.Pattern[str] | None:
+    # One alternation of literals scans the text once instead of one `in` per keyword.
+    alternatives = sorted({word for word in words if word}, key=len, reverse=True)
+    if not alternatives:
+        return None
+    return re.compile("|".join(re.escape(word) for word in alternatives))
+
+
 def _short_text(text: str, max_chars: int = 160) -> str:
-    text = _WS_RE.sub(" ", text).strip()
-    if len(text) <= max_chars:
+    # Only a log preview: bound the work on long messages before collapsing whitespace.
+    clipped = len(text) > max_chars * 4
+    if clipped:
+        text = text[: max_chars * 4]
+    text = " ".join(text.split())
+    if len(text) <= max_chars and not clipped:
         return text
     return text[: max_chars - 1] + "…"
 
@@ -87,14 +110,6 @@ def _resolve_session_name(system_config: SystemConfig, session_name: str) -> str
     return str(base / raw)
 
 
-def _in_scope(config: Config, text: str, reply_to_msg_id: int | None, is_reply_to_me: bool) -> bool:
-    return (
-        reply_to_msg_id == config.topic_id
-        or any(name and name in text for name in config.all_identity_mentions)
-        or is_reply_to_me
-    )
-
-
 def _is_guanxing_route_candidate(text: str) -> bool:
     normalized = normalize_match_text(text)
     return any(anchor and anchor in normalized for anchor in _GUANXING_EVENT_ANCHORS)
@@ -265,7 +280,7 @@ class _IdentityRuntime:
     random_text: object | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _SentMessageBinding:
     identity_key: str
     plugin: str
@@ -283,6 +298,11 @@ class _ScopedScheduler:
             action=action,
         )
 
+    async def schedule_many(self, items) -> None:  # type: ignore[no-untyped-def]
+        await self._scheduler.schedule_many(
+            (f"{self._scope}:{key}", delay_seconds, action) for key, delay_seconds, action in items
+        )
+
 
 @dataclass
 class RunnerSnapshot:
@@ -358,11 +378,15 @@ class AccountRunner:
             global_per_minute=base_config.global_sends_per_minute,
             plugin_per_minute=base_config.plugin_sends_per_minute,
         )
+        # base_config is fixed for the whole run; all_identity_mentions rebuilds its tuple on every access.
+        topic_id = base_config.topic_id
+        identity_mentions = base_config.all_identity_mentions
         adapter = TGAdapter(
             base_config,
             self._logger,
-            identity_name_provider=lambda: base_config.all_identity_mentions,
+            identity_name_provider=lambda: identity_mentions,
         )
+        interesting_scan = _compile_keyword_scan((*identity_mentions, *_INTERESTING_KEYWORDS))
         sender = ReliableSender(
             send_message=adapter.send_message,
             limiter=limiter,
@@ -418,10 +442,9 @@ class AccountRunner:
                 if callable(clear_runtime_pause):
                     clear_runtime_pause(clear_progress=True)
 
-        recent_sent_ids: deque[int] = deque(maxlen=50)
-        recent_sent_bindings: dict[int, _SentMessageBinding] = {}
-        xinggong_qizhen_assisted_invite_ids: deque[int] = deque(maxlen=100)
-        xinggong_qizhen_assisted_invite_id_set: set[int] = set()
+        # Bounded FIFO caches keyed by message id: a single ordered dict gives O(1) lookups and eviction.
+        recent_sent_bindings: OrderedDict[int, _SentMessageBinding] = OrderedDict()
+        xinggong_qizhen_assisted_invite_ids: OrderedDict[int, None] = OrderedDict()
         xinggong_qizhen_assist_lock = asyncio.Lock()
         pause_mode_active = False
         identity_send_lock = asyncio.Lock()
@@ -446,14 +469,17 @@ class AccountRunner:
         def _remember_sent(mid: int | None, *, identity_key: str, plugin: str) -> None:
             if mid is None:
                 return
-            if mid in recent_sent_bindings:
-                recent_sent_bindings[mid] = _SentMessageBinding(identity_key=identity_key, plugin=plugin)
-                return
-            if len(recent_sent_ids) == recent_sent_ids.maxlen:
-                old = recent_sent_ids.popleft()
-                recent_sent_bindings.pop(old, None)
-            recent_sent_ids.append(mid)
+            # Re-binding an id keeps its original position, so eviction order stays by first send.
             recent_sent_bindings[mid] = _SentMessageBinding(identity_key=identity_key, plugin=plugin)
+            if len(recent_sent_bindings) > 50:
+                recent_sent_bindings.popitem(last=False)
+
+        def _mentions_identity(text: str) -> bool:
+            return any(name in text for name in identity_mentions)
+
+        def _in_scope(text: str, reply_to_msg_id: int | None, is_reply_to_me: bool) -> bool:
+            # Cheap flag / int checks before the substring scans.
+            return is_reply_to_me or reply_to_msg_id == topic_id or _mentions_identity(text)
 
         def _binding_for_message_id(message_id: int | None) -> _SentMessageBinding | None:
             if message_id is None:
@@ -461,13 +487,11 @@ class AccountRunner:
             return recent_sent_bindings.get(message_id)
 
         def _remember_xinggong_qizhen_assist(message_id: int | None) -> None:
-            if message_id is None or message_id in xinggong_qizhen_assisted_invite_id_set:
+            if message_id is None or message_id in xinggong_qizhen_assisted_invite_ids:
                 return
-            if len(xinggong_qizhen_assisted_invite_ids) == xinggong_qizhen_assisted_invite_ids.maxlen:
-                old = xinggong_qizhen_assisted_invite_ids.popleft()
-                xinggong_qizhen_assisted_invite_id_set.discard(old)
-            xinggong_qizhen_assisted_invite_ids.append(message_id)
-            xinggong_qizhen_assisted_invite_id_set.add(message_id)
+            xinggong_qizhen_assisted_invite_ids[message_id] = None
+            if len(xinggong_qizhen_assisted_invite_ids) > 100:
+                xinggong_qizhen_assisted_invite_ids.popitem(last=False)
 
         def _should_auto_return_after_send(runtime: _IdentityRuntime, plugin: str, text: str) -> bool:
             plugin_obj = next(
@@ -598,43 +622,60 @@ class AccountRunner:
                     )
                 return mid
 
-        async def _execute_action(action, *, identity_key: str) -> None:
-            if identity_key == identity_switch.active_identity_key:
-                pause_message = _current_pause_message()
-                if pause_message is not None:
-                    await _enter_pause_mode(pause_message)
-                    self._logger.warning(
-                        "action_suppressed_for_pause plugin=%s text=%s delay_seconds=%.1f",
-                        action.plugin,
-                        action.text,
-                        action.delay_seconds,
-                    )
-                    return
-            if action.delay_seconds and action.delay_seconds > 0:
-                key = action.key or f"{action.plugin}:{action.text}"
-
-                async def _scheduled() -> None:
-                    await _send(
-                        action.plugin,
-                        action.text,
-                        action.reply_to_topic,
-                        reply_to_msg_id=action.reply_to_msg_id,
-                        identity_key=identity_key,
-                    )
-
-                await scheduler.schedule(
-                    key=f"{identity_key}:{key}",
-                    delay_seconds=action.delay_seconds,
-                    action=_scheduled,
-                )
-                return
-            await _send(
+        async def _suppressed_for_pause(action, identity_key: str) -> bool:
+            if identity_key != identity_switch.active_identity_key:
+                return False
+            pause_message = _current_pause_message()
+            if pause_message is None:
+                return False
+            await _enter_pause_mode(pause_message)
+            self._logger.warning(
+                "action_suppressed_for_pause plugin=%s text=%s delay_seconds=%.1f",
                 action.plugin,
                 action.text,
-                action.reply_to_topic,
-                reply_to_msg_id=action.reply_to_msg_id,
-                identity_key=identity_key,
+                action.delay_seconds,
             )
+            return True
+
+        def _deferred_item(action, identity_key: str) -> tuple[str, float, Action]:
+            key = action.key or f"{action.plugin}:{action.text}"
+
+            async def _scheduled() -> None:
+                await _send(
+                    action.plugin,
+                    action.text,
+                    action.reply_to_topic,
+                    reply_to_msg_id=action.reply_to_msg_id,
+                    identity_key=identity_key,
+                )
+
+            return f"{identity_key}:{key}", action.delay_seconds, _scheduled
+
+        async def _execute_actions(action_items: list[tuple[SendAction, str]]) -> None:
+            # Actions run in the order plugins returned them. A run of consecutive delayed
+            # actions only needs scheduler entries, so it is queued in one batch at its place
+            # in the list; an immediate send flushes the run before it goes out.
+            deferred: list[tuple[str, float, Action]] = []
+            for action, identity_key in action_items:
+                if await _suppressed_for_pause(action, identity_key):
+                    # Entering pause cancelled everything scheduled so far; the buffered run goes with it.
+                    deferred = []
+                    continue
+                if action.delay_seconds and action.delay_seconds > 0:
+                    deferred.append(_deferred_item(action, identity_key))
+                    continue
+                if deferred:
+                    await scheduler.schedule_many(deferred)
+                    deferred = []
+                await _send(
+                    action.plugin,
+                    action.text,
+                    action.reply_to_topic,
+                    reply_to_msg_id=action.reply_to_msg_id,
+                    identity_key=identity_key,
+                )
+            if deferred:
+                await scheduler.schedule_many(deferred)
 
         async def _archive_message_event(event, ctx, event_type: str) -> None:
             if not base_config.enable_message_archive:
@@ -717,7 +758,7 @@ class AccountRunner:
 
         async def _dispatch_xinggong_qizhen_invite(ctx: MessageContext) -> list[tuple[SendAction, str]]:
             async with xinggong_qizhen_assist_lock:
-                if ctx.message_id in xinggong_qizhen_assisted_invite_id_set:
+                if ctx.message_id in xinggong_qizhen_assisted_invite_ids:
                     return []
                 for identity in base_config.identities:
                     candidate = runtimes.get(identity.key)
@@ -760,7 +801,7 @@ class AccountRunner:
             ctx = await adapter.build_context(event)
             identity_switch.observe(ctx)
             await _archive_message_event(event, ctx, event_type)
-            in_scope = _in_scope(base_config, ctx.text, ctx.reply_to_msg_id, ctx.is_reply_to_me)
+            in_scope = _in_scope(ctx.text, ctx.reply_to_msg_id, ctx.is_reply_to_me)
             is_bound_reply = _binding_for_message_id(ctx.reply_to_msg_id) is not None
             is_luoyunzong_status = _is_luoyunzong_status_route_candidate(ctx.text)
             is_luoyunzong_public_guard = _is_luoyunzong_public_guard_route_candidate(ctx.text)
@@ -773,18 +814,17 @@ class AccountRunner:
                 runtime = _lingxiaogong_status_runtime(ctx.text) or runtime
                 if _is_guanxing_route_candidate(ctx.text):
                     runtime = _guanxing_listener_runtime() or runtime
-            if adapter.me_id is not None and ctx.sender_id != adapter.me_id:
+            # The keyword scan and preview only feed this INFO line; skip them when it would be dropped.
+            if (
+                adapter.me_id is not None
+                and ctx.sender_id != adapter.me_id
+                and self._logger.isEnabledFor(logging.INFO)
+            ):
                 interesting = (
                     ctx.is_reply_to_me
                     or (ctx.reply_to_msg_id in recent_sent_bindings)
-                    or any(name and name in ctx.text for name in base_config.all_identity_mentions)
-                    or ("周天星斗大阵" in ctx.text)
-                    or ("观星台" in ctx.text)
-                    or ("星盘显化" in ctx.text)
-                    or ("天机阁快报" in ctx.text)
-                    or ("天机异动" in ctx.text)
-                    or ("星移失败" in ctx.text)
                     or is_luoyunzong_event
+                    or (interesting_scan is not None and interesting_scan.search(ctx.text) is not None)
                 )
                 if interesting:
                     self._logger.info("<< %s", _short_text(ctx.text))
@@ -803,8 +843,7 @@ class AccountRunner:
             if pause_message is not None and runtime.identity_key == identity_switch.active_identity_key:
                 await _enter_pause_mode(pause_message)
                 return
-            for action, action_identity_key in action_items:
-                await _execute_action(action, identity_key=action_identity_key)
+            await _execute_actions(action_items)
 
         async def _on_new_message(event) -> None:
             await _on_event(event, "new")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Callable
@@ -35,6 +36,9 @@ class SendAsOption:
 
 
 class TGAdapter:
+    # How many of our own recent message ids build_context remembers.
+    _SENT_IDS_LIMIT = 4096
+
     def __init__(
         self,
         config: Config,
@@ -49,6 +53,13 @@ class TGAdapter:
         self._peer = None
         self._system_reply_source_ids: set[int] = set()
         self._identity_name_provider = identity_name_provider
+        # Ids of messages we sent as ourselves (oldest first), so replies to them skip get_reply_message().
+        self._sent_ids: OrderedDict[int, None] = OrderedDict()
+        # Plain topic sends all anchor to the topic starter; that reply header never changes.
+        self._topic_reply_to = types.InputReplyToMessage(
+            reply_to_msg_id=config.topic_id,
+            top_msg_id=config.topic_id,
+        )
 
     @property
     def me_id(self) -> int | None:
@@ -133,6 +144,14 @@ class TGAdapter:
                 return mid
         return None
 
+    def _remember_sent(self, mid: int | None, send_as_peer: str | int | None) -> int | None:
+        # Messages sent as a channel are not from `me_id`, so replies to them must still be checked.
+        if mid is not None and send_as_peer is None:
+            self._sent_ids[mid] = None
+            if len(self._sent_ids) > self._SENT_IDS_LIMIT:
+                self._sent_ids.popitem(last=False)
+        return mid
+
     def _is_topic_closed_error(self, exc: BadRequestError) -> bool:
         message = str(getattr(exc, "message", "") or exc).upper()
         return "TOPIC_CLOSED" in message
@@ -147,20 +166,24 @@ class TGAdapter:
     ) -> int | None:
         send_as_peer = _coerce_send_as_peer(send_as)
         if reply_to_topic and self._config.send_to_topic:
-            topic_reply_to_msg_id = reply_to_msg_id or self._config.topic_id
             # Forum topic messages are anchored to the topic starter message ID.
+            reply_to = (
+                types.InputReplyToMessage(
+                    reply_to_msg_id=reply_to_msg_id,
+                    top_msg_id=self._config.topic_id,
+                )
+                if reply_to_msg_id
+                else self._topic_reply_to
+            )
             request = functions.messages.SendMessageRequest(
                 peer=self._peer,
                 message=text,
-                reply_to=types.InputReplyToMessage(
-                    reply_to_msg_id=topic_reply_to_msg_id,
-                    top_msg_id=self._config.topic_id,
-                ),
+                reply_to=reply_to,
                 send_as=send_as_peer,
             )
             try:
                 result = await self._client(request)
-                return self._extract_sent_message_id(result)
+                return self._remember_sent(self._extract_sent_message_id(result), send_as_peer)
             except BadRequestError as exc:
                 if reply_to_msg_id is not None or not self._is_topic_closed_error(exc):
                     raise
@@ -178,7 +201,7 @@ class TGAdapter:
             kwargs["send_as"] = send_as_peer
         msg = await self._client.send_message(self._config.game_chat_id, text, **kwargs)
         mid = getattr(msg, "id", None)
-        return mid if isinstance(mid, int) and mid > 0 else None
+        return self._remember_sent(mid if isinstance(mid, int) and mid > 0 else None, send_as_peer)
 
     async def build_context(self, event) -> MessageContext:
         text = event.raw_text or ""
@@ -216,22 +239,28 @@ class TGAdapter:
             and reply_to_msg_id != self._config.topic_id
             and not mentions_me
         ):
-            try:
-                reply_msg = await event.get_reply_message()
-            except Exception:
-                reply_msg = None
-            if reply_msg and self._me_id is not None and reply_msg.sender_id == self._me_id:
+            if reply_to_msg_id in self._sent_ids:
+                # Replying to one of our own recent sends; no need to fetch it.
                 is_reply_to_me = True
+            else:
+                try:
+                    reply_msg = await event.get_reply_message()
+                except Exception:
+                    reply_msg = None
+                if reply_msg and self._me_id is not None and reply_msg.sender_id == self._me_id:
+                    is_reply_to_me = True
         is_system_reply = bool(
             (is_from_system_identity or is_from_bot_sender) and (is_reply_to_me or mentions_me)
         )
 
-        msg_date = getattr(getattr(event, "message", None), "date", None)
+        # NewMessage/MessageEdited events always carry `message`; its id is required below anyway.
+        message = event.message
+        msg_date = message.date
         ts = msg_date if isinstance(msg_date, datetime) else datetime.now(timezone.utc)
 
         return MessageContext(
             chat_id=event.chat_id,
-            message_id=event.message.id,
+            message_id=message.id,
             reply_to_msg_id=reply_to_msg_id,
             sender_id=sender_id,
             text=text,
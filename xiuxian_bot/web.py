@@ -909,6 +909,7 @@ def create_app() -> FastAPI:
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
+        _install_eager_task_factory()
         base_system_config = SystemConfig.load()
         system_settings_repository = SystemSettingsRepository(base_system_config.app_db_path)
         system_config = system_settings_repository.apply_to_config(base_system_config)
@@ -1663,10 +1664,20 @@ def create_app() -> FastAPI:
     return app
 
 
+def _install_eager_task_factory() -> None:
+    # Python 3.12+：create_task 时协程先同步跑到第一个真正的挂起点，
+    # 被限流或 dry_run 直接返回的发送、立即完成的调度不必再绕一圈事件循环。
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is not None:
+        asyncio.get_running_loop().set_task_factory(factory)
+
+
 def main() -> None:
     system_config = SystemConfig.load()
     uvicorn.run(
         create_app(),
         host=system_config.web_host,
         port=system_config.web_port,
+        # 装了 uvloop 就用 uvloop（Telethon 收发与调度器计时都跑在这个循环上），否则回退到标准 asyncio。
+        loop="auto",
     )